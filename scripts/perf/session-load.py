@@ -0,0 +1,247 @@
+"""Load generator for ``python -m homeland serve``: how many sessions fit on one core.
+
+Every session plays the baseline build plan over the wire: it opens, builds
+its towers, starts each wave, polls snapshots until the wave ends, upgrades
+between waves, and reopens once the map is over, so the number of live
+sessions stays at the step's target. Sessions ramp through ``--steps``;
+after each step the server's batch timings are read back. The server runs
+one asyncio loop, so the largest step whose batches fit inside the tick
+with no overruns is the session capacity of one core.
+
+    PYTHONPATH=src python scripts/perf/session-load.py --spawn --steps 250,500,1000,2000
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from homeland.core.profiler import percentile
+from homeland.policy import BASELINE_PLAN
+
+
+class Client:
+    """One connection with pipelined requests matched to replies by ``id``."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._pump = asyncio.create_task(self._read_replies())
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> Client:
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def call(self, **request: Any) -> dict[str, Any]:
+        self._next_id += 1
+        request["id"] = self._next_id
+        reply: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._waiting[self._next_id] = reply
+        self._writer.write(json.dumps(request).encode() + b"\n")
+        await self._writer.drain()
+        return await reply
+
+    async def close(self) -> None:
+        self._pump.cancel()
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def _read_replies(self) -> None:
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                break
+            reply = json.loads(line)
+            waiting = self._waiting.pop(reply.get("id"), None)
+            if waiting is not None and not waiting.done():
+                waiting.set_result(reply)
+        for waiting in self._waiting.values():
+            waiting.set_exception(ConnectionError("server closed the connection"))
+
+
+class Tally:
+    def __init__(self) -> None:
+        self.command_ms: list[float] = []
+        self.busy = 0
+        self.refused = 0
+        self.maps_finished = 0
+
+    async def timed(self, client: Client, **request: Any) -> dict[str, Any]:
+        start = time.perf_counter()
+        reply = await client.call(**request)
+        self.command_ms.append((time.perf_counter() - start) * 1000)
+        if not reply["ok"] and reply["error"].startswith("busy"):
+            self.busy += 1
+        return reply
+
+
+async def play(client: Client, tally: Tally, stop: asyncio.Event, poll: float) -> None:
+    """Keep one session playing the baseline plan until ``stop`` is set."""
+    while not stop.is_set():
+        opened = await client.call(op="open")
+        if not opened["ok"]:
+            tally.refused += 1
+            await asyncio.sleep(poll)
+            continue
+        session = opened["session"]
+        for slot_id, tower_id in BASELINE_PLAN.placements:
+            await tally.timed(client, op="build_tower", session=session, args=[slot_id, tower_id])
+        state = "build_phase"
+        while state != "map_result" and not stop.is_set():
+            started = await tally.timed(client, op="start_next_wave", session=session)
+            if not started["ok"]:
+                break
+            state = "wave_running"
+            while state == "wave_running" and not stop.is_set():
+                await asyncio.sleep(poll)
+                state = (await client.call(op="snapshot", session=session))["snapshot"]["state"]
+            if state == "wave_result" or state == "build_phase":
+                for slot_id in BASELINE_PLAN.upgrade_priority:
+                    upgraded = await tally.timed(client, op="upgrade_tower", session=session, args=[slot_id])
+                    if upgraded["ok"]:
+                        break
+        if state == "map_result":
+            tally.maps_finished += 1
+        await client.call(op="close", session=session)
+
+
+async def ramp(args: argparse.Namespace) -> dict[str, Any]:
+    clients = [await Client.connect(args.host, args.port) for _ in range(args.connections)]
+    control = clients[0]
+    stop = asyncio.Event()
+    players: list[asyncio.Task[None]] = []
+    tally = Tally()
+    steps: list[dict[str, Any]] = []
+    try:
+        for target in args.steps:
+            while len(players) < target:
+                client = clients[len(players) % len(clients)]
+                players.append(asyncio.create_task(play(client, tally, stop, args.poll)))
+            # Let the new sessions reach their first waves before measuring.
+            await asyncio.sleep(args.warmup)
+            before = (await control.call(op="stats", reset=True))["stats"]
+            tally.command_ms.clear()
+            busy, refused = tally.busy, tally.refused
+            await asyncio.sleep(args.duration)
+            after = (await control.call(op="stats"))["stats"]
+            step = {
+                "sessions": after["sessions"],
+                "running": after["running"],
+                "tickMs": after["tick"] * 1000,
+                "batchMs": after["batch_ms"],
+                "overruns": after["overruns"],
+                "batches": after["batches"] - before["batches"],
+                "commands": len(tally.command_ms),
+                "commandMs": {
+                    "p50": percentile(tally.command_ms, 50),
+                    "p95": percentile(tally.command_ms, 95),
+                },
+                "busy": tally.busy - busy,
+                "refused": tally.refused - refused,
+            }
+            step["withinBudget"] = step["overruns"] == 0 and step["batchMs"]["p95"] < step["tickMs"]
+            steps.append(step)
+            print(
+                f"sessions={step['sessions']} running={step['running']} "
+                f"batch p50={step['batchMs']['p50']:.2f}ms p95={step['batchMs']['p95']:.2f}ms "
+                f"tick={step['tickMs']:.0f}ms overruns={step['overruns']} "
+                f"commands={step['commands']} p95={step['commandMs']['p95']:.1f}ms "
+                f"busy={step['busy']} refused={step['refused']}",
+                flush=True,
+            )
+            if not step["withinBudget"] and args.stop_on_overrun:
+                break
+    finally:
+        stop.set()
+        await asyncio.gather(*players, return_exceptions=True)
+        for client in clients:
+            await client.close()
+    healthy = [step["sessions"] for step in steps if step["withinBudget"]]
+    return {
+        "startedAt": args.started_at,
+        "steps": steps,
+        "sessionsPerCore": max(healthy, default=0),
+        "mapsFinished": tally.maps_finished,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _spawn_server(args: argparse.Namespace) -> subprocess.Popen[bytes]:
+    args.port = _free_port()
+    env = dict(os.environ)
+    src = str(Path(__file__).resolve().parents[2] / "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "homeland",
+            "serve",
+            "--port",
+            str(args.port),
+            "--tick",
+            str(args.tick),
+            "--max-sessions",
+            str(max(args.steps) * 2),
+        ],
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+    assert server.stdout is not None
+    # The server prints one line once it is listening.
+    server.stdout.readline()
+    return server
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--spawn", action="store_true", help="start a server subprocess on a free port")
+    parser.add_argument("--tick", type=float, default=0.1, help="tick of a spawned server")
+    parser.add_argument("--steps", default="100,250,500,1000", help="comma-separated session counts")
+    parser.add_argument("--connections", type=int, default=8, help="client connections sharing the sessions")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds before measuring each step")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds measured per step")
+    parser.add_argument("--poll", type=float, default=0.5, help="seconds between a session's snapshot polls")
+    parser.add_argument("--stop-on-overrun", action="store_true", help="stop at the first step over budget")
+    parser.add_argument("--out", type=Path, default=None, help="write the JSON report here")
+    args = parser.parse_args(argv)
+    args.steps = sorted(int(value) for value in args.steps.split(",") if value.strip())
+    args.started_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    server = _spawn_server(args) if args.spawn else None
+    try:
+        report = asyncio.run(ramp(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print(f"sessions per core within budget: {report['sessionsPerCore']}")
+    if args.out is not None:
+        args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
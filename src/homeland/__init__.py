@@ -1,5 +1,20 @@
 """Homeland prototype package."""
 
-from homeland.game import HomelandGame
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeland.game import HomelandGame
 
 __all__ = ["HomelandGame"]
+
+
+def __getattr__(name: str) -> object:
+    # Deferred so ``python -m homeland`` and light submodules such as
+    # ``homeland.config`` do not pay for importing every game system.
+    if name == "HomelandGame":
+        from homeland.game import HomelandGame
+
+        return HomelandGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
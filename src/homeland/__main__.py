@@ -2,52 +2,46 @@
 
 from __future__ import annotations
 
-from homeland.core.game_state import GameState
-from homeland.game import HomelandGame
-
-
-def _auto_build(game: HomelandGame) -> None:
-    # Deterministic baseline strategy for first playable simulation.
-    planned_builds = [
-        ("s03", "arrow"),
-        ("s05", "bone"),
-        ("s08", "magic_fire"),
-        ("s07", "magic_wind"),
-    ]
-
-    for slot_id, tower_id in planned_builds:
-        if game.placement.is_slot_available(slot_id):
-            try:
-                game.build_tower(slot_id, tower_id)
-            except ValueError:
-                continue
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Sequence
+import argparse
+import sys
+import time
 
+# Subsystems are imported inside each command, so short-lived invocations
+# only pay for what they run; ``--timing`` reports that cost as "import".
 
-def _auto_upgrade(game: HomelandGame) -> None:
-    for slot_id in ["s03", "s05", "s08", "s07"]:
-        tower = game.placement.get_tower(slot_id)
-        if not tower:
-            continue
-        try:
-            game.upgrade_tower(slot_id)
-            break
-        except ValueError:
-            continue
 
+class _PhaseTimer:
+    """Wall-clock time per CLI phase, printed to stderr by ``--timing``."""
 
-def main() -> None:
-    game = HomelandGame()
-    _auto_build(game)
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
 
-    while game.state != GameState.MAP_RESULT:
-        if game.state == GameState.BUILD_PHASE:
-            _auto_upgrade(game)
-            game.start_next_wave()
+    def report(self) -> str:
+        parts = [f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases.items()]
+        parts.append(f"total={sum(self.phases.values()) * 1000:.1f}ms")
+        return "timing " + " ".join(parts)
 
-        if game.state == GameState.WAVE_RUNNING:
-            game.tick(0.1)
 
-    summary = game.snapshot()
+def _run_demo(timer: _PhaseTimer) -> None:
+    with timer.phase("import"):
+        from homeland.config import load_game_content
+        from homeland.game import HomelandGame
+        from homeland.policy import BASELINE_PLAN, play_map
+    with timer.phase("content"):
+        content = load_game_content()
+    with timer.phase("simulation"):
+        summary = play_map(HomelandGame(content=content), BASELINE_PLAN, dt=0.1)
     print("Homeland Prototype Run")
     print(f"state={summary['state']}")
     print(f"coins={summary['coins']}")
@@ -57,5 +51,196 @@ def main() -> None:
     print(f"next_map_unlocked={summary['next_map_unlocked']}")
 
 
+def _run_sim(args: argparse.Namespace, timer: _PhaseTimer) -> None:
+    with timer.phase("import"):
+        import json
+
+        from homeland.config import DEFAULT_MAP_ID, load_game_content
+        from homeland.monte_carlo import report, run_monte_carlo
+    map_id = args.map or DEFAULT_MAP_ID
+    with timer.phase("content"):
+        # Loaded up front so serial runs and forked workers reuse it.
+        load_game_content(base_data_dir=args.data_dir, map_id=map_id)
+    with timer.phase("simulation"):
+        results = run_monte_carlo(
+            runs=args.runs,
+            policy=args.policy,
+            seed=args.seed,
+            workers=args.workers,
+            dt=args.dt,
+            data_dir=args.data_dir,
+            event_driven=args.event_driven,
+            trace_dir=args.trace_dir,
+            trace_format=args.trace_format,
+            map_id=map_id,
+        )
+    payload = report(results, policy=args.policy, seed=args.seed, dt=args.dt, event_driven=args.event_driven)
+    summary = payload["summary"]
+    print(f"runs={summary['runs']} policy={args.policy} seed={args.seed}")
+    print(f"clear_rate={summary['clear_rate']:.3f}")
+    for name in ("leaks", "coins", "xp"):
+        print(f"{name}=" + " ".join(f"{key}={value:g}" for key, value in summary[name].items() if value is not None))
+    if args.out is not None:
+        args.out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {args.out}")
+
+
+def _run_plan(args: argparse.Namespace, timer: _PhaseTimer) -> None:
+    with timer.phase("import"):
+        from dataclasses import asdict
+        import json
+
+        from homeland.config import DEFAULT_MAP_ID, load_game_content
+        from homeland.planner import plan_build_order
+    with timer.phase("content"):
+        content = load_game_content(base_data_dir=args.data_dir, map_id=args.map or DEFAULT_MAP_ID)
+    with timer.phase("simulation"):
+        result = plan_build_order(
+            content,
+            beam_width=args.beam_width,
+            branching=args.branching,
+            actions_per_phase=args.actions_per_phase,
+            max_nodes=args.max_nodes,
+            time_limit=args.time_limit,
+            workers=args.workers,
+            dt=args.dt,
+            event_driven=args.event_driven,
+        )
+    print(f"complete={result.complete} nodes={result.nodes} elapsed={result.elapsed:.2f}s")
+    print(f"leaks={result.leaks} coins={result.coins} xp={result.xp}")
+    for wave, actions in enumerate(result.phases, start=1):
+        print(f"wave {wave}: " + (", ".join(" ".join(action) for action in actions) or "-"))
+    if args.out is not None:
+        args.out.write_text(json.dumps(asdict(result), indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {args.out}")
+
+
+def _run_bench(args: argparse.Namespace, timer: _PhaseTimer) -> None:
+    with timer.phase("import"):
+        import json
+
+        from homeland.bench import compare, load_report, run_benchmarks
+    with timer.phase("simulation"):
+        payload = run_benchmarks(names=args.only, repeats=args.repeats)
+    for name, result in payload["benchmarks"].items():
+        summary = result["summary"]
+        unit = result["unit"]
+        speedup = result.get("speedup")
+        versus = f" {speedup['ratio']:.2f}x vs {speedup['versus']}" if speedup else ""
+        print(f"{name}: p50={summary['p50']:.4f}{unit} p95={summary['p95']:.4f}{unit} ({result['kind']}){versus}")
+    if args.out is not None:
+        args.out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {args.out}")
+    if args.compare is not None:
+        rows = compare(load_report(args.compare), payload, alpha=args.alpha, threshold=args.threshold)
+        for row in rows:
+            if row["status"] != "compared":
+                print(f"{row['name']}: {row['status']}")
+                continue
+            flag = "REGRESSION" if row["regression"] else "ok"
+            print(f"{row['name']}: {row['change']:+.1%} p={row['pValue']:.3f} {flag}")
+        if any(row["regression"] for row in rows):
+            raise SystemExit(1)
+
+
+def _run_serve(args: argparse.Namespace, timer: _PhaseTimer) -> None:
+    with timer.phase("import"):
+        import asyncio
+
+        from homeland.content_registry import ContentRegistry
+        from homeland.server import serve
+    try:
+        asyncio.run(
+            serve(
+                host=args.host,
+                port=args.port,
+                registry=ContentRegistry(args.data_dir),
+                tick=args.tick,
+                max_sessions=args.max_sessions,
+                max_pending=args.max_pending,
+                finished_ttl=args.finished_ttl,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m homeland", description="Homeland prototype simulation")
+    parser.add_argument("--timing", action="store_true", help="report import, content and simulation time on stderr")
+    commands = parser.add_subparsers(dest="command")
+
+    sim = commands.add_parser("sim", help="Monte Carlo runs across a process pool")
+    sim.add_argument("--runs", type=int, default=100, help="number of games to play")
+    sim.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    sim.add_argument("--seed", type=int, default=0, help="base seed; run i uses seed + i")
+    sim.add_argument("--policy", default="baseline", help="baseline, random or package.module:function")
+    sim.add_argument("--dt", type=float, default=0.1, help="tick length in seconds")
+    sim.add_argument(
+        "--event-driven",
+        action="store_true",
+        help="advance event to event instead of fixed ticks; results differ from --dt runs, so compare like with like",
+    )
+    sim.add_argument("--data-dir", type=Path, default=None, help="content directory")
+    sim.add_argument("--map", default=None, help="map id under the content directory (default: map_01_river_bend)")
+    sim.add_argument("--trace-dir", type=Path, default=None, help="stream every run's events to files here")
+    sim.add_argument("--trace-format", choices=("ndjson", "binary"), default="ndjson", help="trace file format")
+    sim.add_argument("--out", type=Path, default=None, help="write the JSON report here")
+
+    plan = commands.add_parser("plan", help="beam-search a build order for the map")
+    plan.add_argument("--beam-width", type=int, default=8, help="states kept after each wave")
+    plan.add_argument("--branching", type=int, default=6, help="bundles kept per bundle size")
+    plan.add_argument("--actions-per-phase", type=int, default=4, help="most builds or upgrades per build phase")
+    plan.add_argument("--max-nodes", type=int, default=2000, help="wave simulations allowed")
+    plan.add_argument("--time-limit", type=float, default=None, help="seconds allowed")
+    plan.add_argument("--workers", type=int, default=1, help="worker processes (0: CPU count)")
+    plan.add_argument("--dt", type=float, default=0.1, help="tick length in seconds")
+    plan.add_argument(
+        "--event-driven",
+        action="store_true",
+        help="plan event to event instead of on fixed ticks; replay the plan the same way",
+    )
+    plan.add_argument("--data-dir", type=Path, default=None, help="content directory")
+    plan.add_argument("--map", default=None, help="map id under the content directory (default: map_01_river_bend)")
+    plan.add_argument("--out", type=Path, default=None, help="write the plan as JSON here")
+
+    bench = commands.add_parser("bench", help="time the simulation core and compare with a baseline")
+    bench.add_argument("--only", action="append", default=None, help="benchmark to run (repeatable; default: all)")
+    bench.add_argument("--repeats", type=int, default=10, help="samples per benchmark")
+    bench.add_argument("--out", type=Path, default=None, help="write the JSON report here")
+    bench.add_argument("--compare", type=Path, default=None, help="baseline report; exit 1 on a significant slowdown")
+    bench.add_argument("--alpha", type=float, default=0.05, help="significance level for --compare")
+    bench.add_argument("--threshold", type=float, default=0.10, help="smallest median slowdown to flag")
+
+    serve = commands.add_parser("serve", help="host concurrent game sessions over line-delimited JSON on TCP")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    serve.add_argument("--port", type=int, default=8765, help="port to listen on (0: any free port)")
+    serve.add_argument("--tick", type=float, default=0.1, help="seconds between batches, and game time per tick")
+    serve.add_argument("--max-sessions", type=int, default=10_000, help="sessions hosted at once")
+    serve.add_argument("--max-pending", type=int, default=16, help="queued commands per session before 'busy'")
+    serve.add_argument(
+        "--finished-ttl", type=float, default=60.0, help="seconds a session stays open after its map ends"
+    )
+    serve.add_argument("--data-dir", type=Path, default=None, help="content directory")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parser().parse_args(argv)
+    timer = _PhaseTimer()
+    if args.command == "sim":
+        _run_sim(args, timer)
+    elif args.command == "plan":
+        _run_plan(args, timer)
+    elif args.command == "bench":
+        _run_bench(args, timer)
+    elif args.command == "serve":
+        _run_serve(args, timer)
+    else:
+        _run_demo(timer)
+    if args.timing:
+        print(timer.report(), file=sys.stderr)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,429 @@
+"""Lockstep simulation of many independent games on one map."""
+
+from __future__ import annotations
+
+from itertools import compress
+from typing import Sequence
+
+from homeland.config import GameContent, WaveConfig
+from homeland.core.game_state import GameState
+from homeland.entities.enemy_boat import EnemyBoat, Fleet
+from homeland.entities.tower import Tower
+from homeland.policy import BuildPlan
+from homeland.systems.combat_system import CombatSystem, Volley
+from homeland.systems.coverage import CoverageIndex, TowerCoverage
+from homeland.systems.economy_system import EconomySystem
+from homeland.systems.ledger import Ledger
+from homeland.systems.pathing import Path, PositionCache
+from homeland.systems.placement_system import PlacementSystem
+from homeland.systems.progression_system import ProgressionSystem
+from homeland.systems.wave_system import WaveSystem
+
+
+# Tick a tower that nothing can reach this wave waits for; wave starts wake it.
+_NEVER = 1 << 62
+
+
+class _Lane:
+    """One game of a batch: the parts of ``HomelandGame`` a ``BuildPlan`` drives, plus its schedules.
+
+    ``build_tower`` and ``upgrade_tower`` follow ``HomelandGame`` without the
+    events. Per tower in build order, ``ready`` is the tick its cooldown runs
+    out, ``due`` the tick it next looks for a target and ``coverage`` its
+    reach at its level, set when a wave starts. ``rows`` are the
+    game's rows of the shared fleet in spawn order and ``boats`` how many of
+    its boats are alive, or were when it lost.
+    """
+
+    def __init__(self, index: int, content: GameContent, combat: CombatSystem, plan: BuildPlan) -> None:
+        map_config = content.map_config
+        self.index = index
+        self.content = content
+        self.combat = combat
+        self.plan = plan
+        self.state = GameState.BUILD_PHASE
+        self.economy = EconomySystem(coins=map_config.starting_coins)
+        self.progression = ProgressionSystem(xp=map_config.starting_xp)
+        self.ledger = Ledger()
+        self.placement = PlacementSystem.from_slots(map_config.build_slots)
+        self.towers: list[Tower] = []
+        self.ready: list[int] = []
+        self.due: list[int] = []
+        self.coverage: list[TowerCoverage] = []
+        self.wave_index = -1
+        self.wave_start = 0
+        self.spawned = 0
+        self.rows: list[int] = []
+        self.boats = 0
+
+    def build_tower(self, slot_id: str, tower_id: str) -> None:
+        if self.state not in {GameState.BUILD_PHASE, GameState.WAVE_RESULT}:
+            raise ValueError("Towers can only be built in build phase")
+        tower_cfg = self.content.tower_configs.get(tower_id)
+        if tower_cfg is None:
+            raise ValueError(f"Unknown tower_id: {tower_id}")
+        if not self.economy.spend(tower_cfg.levels[0].cost):
+            raise ValueError("Not enough coins")
+        tower = self.placement.place_tower(slot_id, tower_id)
+        tower.stats_slot = self.combat.stats.slot(tower)
+        self.towers.append(tower)
+        self.ready.append(0)
+        self.due.append(_NEVER)
+
+    def upgrade_tower(self, slot_id: str) -> None:
+        if self.state not in {GameState.BUILD_PHASE, GameState.WAVE_RESULT}:
+            raise ValueError("Towers can only be upgraded in build phase")
+        tower = self.placement.get_tower(slot_id)
+        if tower is None:
+            raise ValueError(f"No tower at slot: {slot_id}")
+        levels = self.content.tower_configs[tower.tower_id].levels
+        if tower.level >= len(levels):
+            raise ValueError("Tower is already max level")
+        if not self.economy.spend(levels[tower.level].cost):
+            raise ValueError("Not enough coins")
+        tower.level += 1
+        tower.stats_slot = self.combat.stats.slot(tower)
+
+
+class BatchedHomelandSim:
+    """Steps N copies of one map in lockstep, each under its own ``BuildPlan``.
+
+    One ``step`` is one iteration of ``policy.play_map`` for every unfinished
+    game, so final snapshots match running each game through ``HomelandGame``
+    with the same plan and ``dt``. No events are emitted.
+
+    Boats of every game live in one shared ``Fleet``, its ``boat_id`` column
+    holding the owning game, so ``step_effects`` and ``step_movement`` run
+    once per tick for the whole batch. Towers fire through
+    ``CombatSystem.fire`` on a ``Volley`` of their own game's rows, with the
+    game's ``TowerStats`` slots and effect handlers. Spawns and cooldowns
+    are tick schedules replayed once from ``WaveSystem`` and ``Tower``, so a
+    tick only visits the games and towers with something due, and a ready
+    tower that finds nothing to shoot sleeps until the fastest boat could
+    first reach its coverage. Finished games drop out of every later step.
+    """
+
+    def __init__(self, content: GameContent, plans: Sequence[BuildPlan], dt: float = 0.1) -> None:
+        if not plans:
+            raise ValueError("At least one build plan is required")
+        if dt <= 0:
+            raise ValueError("dt must be positive")
+        self.content = content
+        self.dt = dt
+        self.games = len(plans)
+        self.tick_count = 0
+
+        self._path = Path(content.map_config.path_waypoints)
+        self._coverage_index = CoverageIndex(self._path, content.tower_configs)
+        self._coverage: dict[tuple[str, float], TowerCoverage] = {}
+        self._countdowns: dict[float, int] = {}
+        self.combat = CombatSystem(content.tower_configs)
+        self.fleet = Fleet()
+
+        self._waves = sorted(content.waves, key=lambda w: w.wave_id)
+        self._spawns = [self._schedule_spawns(wave) for wave in self._waves]
+        self._max_speed = max((cfg.speed for cfg in content.enemy_configs.values()), default=0.0)
+        self._spawn_due: dict[int, list[_Lane]] = {}
+        self._tower_due: dict[int, list[tuple[int, int]]] = {}
+
+        self._lanes = [_Lane(index, content, self.combat, plan) for index, plan in enumerate(plans)]
+        for lane in self._lanes:
+            lane.plan.place_towers(lane)
+        self._active = list(self._lanes)
+        # Games due to upgrade and start a wave on the next step.
+        self._building = list(self._lanes)
+        self._results: list[dict[str, int | str | bool] | None] = [None] * self.games
+
+    @property
+    def finished(self) -> list[bool]:
+        return [lane.state == GameState.MAP_RESULT for lane in self._lanes]
+
+    def run(self, max_steps: int | None = None) -> list[dict[str, int | str | bool]]:
+        """Step until every game reaches its map result (or ``max_steps``)."""
+        steps = 0
+        while self._active and (max_steps is None or steps < max_steps):
+            self.step()
+            steps += 1
+        return self.snapshots()
+
+    def step(self) -> bool:
+        """Advance every unfinished game by one play iteration; return whether any remain."""
+        if not self._active:
+            return False
+        self.tick_count += 1
+        tick = self.tick_count
+
+        changed = set(self._building)
+        for lane in self._building:
+            lane.plan.upgrade_one(lane)
+            self._start_next_wave(lane, tick)
+        self._building = []
+
+        self._spawn(tick)
+        fleet = self.fleet
+        burned = len(fleet) > 0 and any(fleet.step_effects(self.dt))
+        if self._fire_towers(tick, burned) or burned:
+            changed.update(self._settle(fleet.destroyed, credit=True))
+        leaked = fleet.step_movement(self.dt, self._path.length)
+        if any(leaked):
+            changed.update(self._settle(leaked, credit=False))
+
+        if changed:
+            self._check_outcomes(sorted(changed, key=lambda lane: lane.index))
+        return bool(self._active)
+
+    def snapshots(self) -> list[dict[str, int | str | bool]]:
+        return [self.snapshot(game) for game in range(self.games)]
+
+    def snapshot(self, game: int) -> dict[str, int | str | bool]:
+        """Same fields and values as ``HomelandGame.snapshot`` for one game."""
+        result = self._results[game]
+        if result is not None:
+            return dict(result)
+        lane = self._lanes[game]
+        wave_index = lane.wave_index
+        # Spawning restarts with each wave and has run out by the wave's end.
+        to_spawn = len(self._spawns[wave_index]) - lane.spawned if wave_index >= 0 else 0
+        return {
+            "state": lane.state.value,
+            "coins": lane.economy.coins,
+            "xp": lane.progression.xp,
+            "current_wave": self._waves[wave_index].wave_id if wave_index >= 0 else 0,
+            "total_waves": len(self._waves),
+            "boats_remaining": lane.boats + to_spawn,
+            "towers_built": len(lane.towers),
+            "next_map_unlocked": lane.progression.has_unlock(self.content.map_config.unlock_requirement.min_xp),
+        }
+
+    def _schedule_spawns(self, wave: WaveConfig) -> list[tuple[int, str]]:
+        """Tick offset from wave start and enemy type of every spawn, from a ``WaveSystem`` run alone."""
+        waves = WaveSystem([wave])
+        waves.start_next_wave()
+        schedule: list[tuple[int, str]] = []
+        tick = 0
+        while waves.boats_remaining_to_spawn():
+            schedule.extend((tick, enemy_type) for enemy_type in waves.tick(self.dt))
+            tick += 1
+        return schedule
+
+    def _countdown_ticks(self, seconds: float) -> int:
+        """Ticks of ``Tower.tick_cooldown`` until a ``seconds`` cooldown lets the tower attack."""
+        ticks = self._countdowns.get(seconds)
+        if ticks is None:
+            probe = Tower("probe", "probe", "probe", 0.0, 0.0, cooldown_left=seconds)
+            ticks = 0
+            while not probe.can_attack():
+                probe.tick_cooldown(self.dt)
+                ticks += 1
+            self._countdowns[seconds] = ticks
+        return ticks
+
+    def _coverage_for(self, tower: Tower, range_units: float) -> TowerCoverage:
+        """Coverage shared by every game's tower on the same slot at the same range."""
+        key = (tower.slot_id, range_units)
+        coverage = self._coverage.get(key)
+        if coverage is None:
+            coverage = self._coverage[key] = self._coverage_index.coverage_at(tower.x, tower.y, range_units)
+        return coverage
+
+    def _schedule_tower(self, lane: _Lane, tower: int, tick: int) -> None:
+        lane.due[tower] = tick
+        due = self._tower_due.get(tick)
+        if due is None:
+            self._tower_due[tick] = [(lane.index, tower)]
+        else:
+            due.append((lane.index, tower))
+
+    def _start_next_wave(self, lane: _Lane, tick: int) -> None:
+        lane.wave_index += 1
+        lane.wave_start = tick
+        lane.spawned = 0
+        lane.state = GameState.WAVE_RUNNING
+        ranges = self.combat.stats.range
+        lane.coverage = [self._coverage_for(tower, ranges[tower.stats_slot]) for tower in lane.towers]
+        # New towers, upgrades and towers asleep for the last wave all look again.
+        for tower, due in enumerate(lane.due):
+            if due > tick:
+                self._schedule_tower(lane, tower, max(lane.ready[tower], tick))
+        schedule = self._spawns[lane.wave_index]
+        if schedule:
+            self._spawn_due.setdefault(tick + schedule[0][0], []).append(lane)
+
+    def _spawn(self, tick: int) -> None:
+        due = self._spawn_due.pop(tick, None)
+        if not due:
+            return
+        enemy_configs = self.content.enemy_configs
+        fleet = self.fleet
+        for lane in due:
+            schedule = self._spawns[lane.wave_index]
+            offset = tick - lane.wave_start
+            spawned = lane.spawned
+            while spawned < len(schedule) and schedule[spawned][0] == offset:
+                enemy_cfg = enemy_configs[schedule[spawned][1]]
+                lane.rows.append(len(fleet))
+                fleet.spawn(
+                    boat_id=lane.index,
+                    enemy_type=enemy_cfg.enemy_type,
+                    max_hp=enemy_cfg.hp,
+                    hp=enemy_cfg.hp,
+                    speed=enemy_cfg.speed,
+                    coin_reward=enemy_cfg.coin_reward,
+                    xp_reward=enemy_cfg.xp_reward,
+                )
+                spawned += 1
+            lane.boats += spawned - lane.spawned
+            lane.spawned = spawned
+            if spawned < len(schedule):
+                self._spawn_due.setdefault(lane.wave_start + schedule[spawned][0], []).append(lane)
+
+    def _fire_towers(self, tick: int, burned: bool) -> bool:
+        """Let every tower due this tick fire, as ``CombatSystem.tick`` per game; return whether any boat died."""
+        due = self._tower_due.pop(tick, None)
+        if not due:
+            return False
+        fleet = self.fleet
+        destroyed = fleet.destroyed
+        positions = PositionCache(self._path, fleet.distance)
+        killed: dict[int, EnemyBoat] = {}
+        volleys: dict[int, Volley] = {}
+        combat = self.combat
+        cooldowns = combat.stats.cooldown
+        countdowns = self._countdowns
+        tower_due = self._tower_due
+        lanes = self._lanes
+
+        # Games are independent; within a game towers act in build order.
+        for game, index in sorted(due):
+            lane = lanes[game]
+            if lane.state != GameState.WAVE_RUNNING or lane.due[index] != tick:
+                continue
+            volley = volleys.get(game)
+            if volley is None:
+                # Boats burned to death this tick are out of the volley, as in ``CombatSystem.tick``.
+                rows = [row for row in lane.rows if not destroyed[row]] if burned else lane.rows
+                volley = volleys[game] = Volley(fleet, positions, rows, killed)
+            tower = lane.towers[index]
+            slot = tower.stats_slot
+            coverage = lane.coverage[index]
+            if combat.fire(tower, slot, volley, coverage):
+                cooldown = countdowns.get(cooldowns[slot])
+                if cooldown is None:
+                    cooldown = self._countdown_ticks(cooldowns[slot])
+                ready = lane.ready[index] = lane.due[index] = tick + cooldown
+                scheduled = tower_due.get(ready)
+                if scheduled is None:
+                    tower_due[ready] = [(game, index)]
+                else:
+                    scheduled.append((game, index))
+                continue
+            idle = self._idle_ticks(lane, volley.rows, coverage, tick)
+            if idle is None:
+                lane.due[index] = _NEVER
+            else:
+                self._schedule_tower(lane, index, tick + 1 + idle)
+        return bool(killed)
+
+    def _idle_ticks(self, lane: _Lane, rows: list[int], coverage: TowerCoverage, tick: int) -> int | None:
+        """Ticks an idle tower can skip before any boat, present or yet to spawn, can reach it.
+
+        ``None`` means no boat of the running wave ever can.
+        """
+        fringe = coverage.fringe
+        bands = [(lo - fringe, hi + fringe) for lo, hi in coverage.intervals]
+        if not bands:
+            return None
+        dt = self.dt
+        fleet = self.fleet
+        distances = fleet.distance
+        speeds = fleet.speed
+        destroyed = fleet.destroyed
+        skip = _NEVER
+        for row in rows:
+            if destroyed[row]:
+                continue
+            distance = distances[row]
+            for lo, hi in bands:
+                if distance < lo:
+                    if speeds[row] > 0:
+                        # Slows only shorten the step, so full speed bounds it.
+                        skip = min(skip, int((lo - distance) / (speeds[row] * dt)) - 1)
+                    break
+                if distance <= hi:
+                    return 0
+        # Boats yet to spawn enter at distance zero, no earlier than the next
+        # scheduled spawn. Once the wave has spawned out, the next one wakes
+        # every tower when it starts.
+        schedule = self._spawns[lane.wave_index]
+        if lane.spawned < len(schedule):
+            first_spawn = lane.wave_start + schedule[lane.spawned][0]
+            lo = bands[0][0]
+            if lo <= 0:
+                skip = min(skip, first_spawn - tick - 1)
+            elif self._max_speed > 0:
+                skip = min(skip, first_spawn - tick + int(lo / (self._max_speed * dt)) - 2)
+        return None if skip == _NEVER else max(0, skip)
+
+    def _settle(self, mask: list[bool], credit: bool) -> set[_Lane]:
+        """Credit each masked row's kill, or debit its leak, to its game's ledger; drop the rows.
+
+        Returns the games touched.
+        """
+        fleet = self.fleet
+        lanes = self._lanes
+        owners = fleet.boat_id
+        touched: set[_Lane] = set()
+        if credit:
+            for row in compress(range(len(mask)), mask):
+                lane = lanes[owners[row]]
+                lane.ledger.credit(fleet.coin_reward[row], fleet.xp_reward[row])
+                lane.boats -= 1
+                touched.add(lane)
+        else:
+            penalty = self.content.map_config.leak_penalty
+            for row in compress(range(len(mask)), mask):
+                lane = lanes[owners[row]]
+                lane.ledger.debit(penalty.coins, penalty.xp)
+                lane.boats -= 1
+                touched.add(lane)
+        self._compact([not dropped for dropped in mask])
+        return touched
+
+    def _compact(self, keep: list[bool]) -> None:
+        """Drop the rows ``keep`` leaves out and renumber every game's rows."""
+        self.fleet.compact(keep)
+        for lane in self._active:
+            lane.rows = []
+        lanes = self._lanes
+        for row, game in enumerate(self.fleet.boat_id):
+            lanes[game].rows.append(row)
+
+    def _check_outcomes(self, lanes: list[_Lane]) -> None:
+        """Settle each game's ledger and end its wave or map, as ``HomelandGame._check_outcome``."""
+        progression = self.content.progression
+        defeated: list[_Lane] = []
+        for lane in lanes:
+            if lane.state != GameState.WAVE_RUNNING:
+                continue
+            if lane.ledger.pending:
+                lane.ledger.settle(lane.economy, lane.progression)
+            if lane.economy.coins < 0:
+                lane.state = GameState.MAP_RESULT
+                defeated.append(lane)
+            elif lane.spawned == len(self._spawns[lane.wave_index]) and not lane.boats:
+                lane.progression.add_xp(progression.xp_per_wave_clear)
+                if lane.wave_index + 1 < len(self._waves):
+                    lane.state = GameState.BUILD_PHASE
+                    self._building.append(lane)
+                    continue
+                lane.progression.add_xp(progression.xp_map_clear)
+                lane.state = GameState.MAP_RESULT
+            else:
+                continue
+            self._results[lane.index] = self.snapshot(lane.index)
+        if defeated:
+            # A lost game's boats stay in its snapshot but leave the fleet.
+            gone = {lane.index for lane in defeated}
+            self._compact([game not in gone for game in self.fleet.boat_id])
+        if any(lane.state == GameState.MAP_RESULT for lane in lanes):
+            self._active = [lane for lane in self._active if lane.state != GameState.MAP_RESULT]
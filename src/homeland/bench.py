@@ -0,0 +1,509 @@
+"""Micro and macro benchmarks of the simulation core, with baseline comparison."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+import gc
+import json
+import math
+import platform
+import time
+import tracemalloc
+
+from homeland.core.profiler import percentile
+
+
+DEFAULT_REPEATS = 10
+
+# A slowdown is flagged when the median grows by more than THRESHOLD and a
+# one-sided Mann-Whitney test puts its p-value under ALPHA.
+DEFAULT_ALPHA = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """``setup`` builds fresh state untimed and returns the call to time.
+
+    Each sample runs ``setup`` again, times ``inner`` back-to-back calls and
+    records the mean per call in milliseconds. ``memory`` benchmarks are not
+    timed: their call returns the sample itself, in ``unit``. ``versus``
+    names a benchmark doing the same work another way; when both run, the
+    report gives this one's ``speedup`` over it.
+    """
+
+    name: str
+    kind: str
+    setup: Callable[[], Callable[[], object]]
+    inner: int = 1
+    unit: str = "ms"
+    versus: str | None = None
+
+
+def _default_content() -> Any:
+    from homeland.config import load_game_content
+
+    return load_game_content()
+
+
+def _crowded_game(boats: int = 200) -> Any:
+    """A stress map with ``boats`` boats spread evenly along the river."""
+    from homeland.game import HomelandGame
+    from homeland.stress_content import generate_content
+
+    content = generate_content(waypoints=50, slots=20, boats_per_wave=boats, waves=1, seed=7)
+    game = HomelandGame(content=content, event_history=0)
+    enemy = next(iter(content.enemy_configs.values()))
+    for index in range(boats):
+        game.fleet.spawn(
+            boat_id=index + 1,
+            enemy_type=enemy.enemy_type,
+            max_hp=enemy.hp,
+            hp=enemy.hp,
+            speed=enemy.speed,
+            coin_reward=enemy.coin_reward,
+            xp_reward=enemy.xp_reward,
+            distance=game.path.length * index / boats,
+        )
+    return game
+
+
+def _path_lookup() -> Callable[[], object]:
+    from homeland.systems.pathing import Path as RiverPath
+
+    path = RiverPath(_default_content().map_config.path_waypoints)
+    distances = [path.length * index / 1000 for index in range(1000)]
+    position_at = path.position_at_distance
+    return lambda: [position_at(distance) for distance in distances]
+
+
+def _river_path_lookup() -> Callable[[], object]:
+    """Batch lookups on a 2000-waypoint river, where walking every segment dominates."""
+    from homeland.stress_content import generate_content
+    from homeland.systems.pathing import Path as RiverPath
+
+    path = RiverPath(generate_content(waypoints=2000, seed=4).map_config.path_waypoints)
+    distances = [path.length * index / 1000 for index in range(1000)]
+    return lambda: path.positions_at_distances(distances)
+
+
+def _select_target() -> Callable[[], object]:
+    """One tower's pick from the tick's distance ranking, as ``CombatSystem.tick`` makes it."""
+    from homeland.entities.tower import Tower
+    from homeland.systems.pathing import PositionCache
+
+    game = _crowded_game()
+    fleet = game.fleet
+    slot = game.content.map_config.build_slots[0]
+    tower_id = sorted(game.content.tower_configs)[0]
+    tower = Tower(tower_instance_id="bench", tower_id=tower_id, slot_id=slot.slot_id, x=slot.x, y=slot.y)
+    combat = game.combat
+    coverage = game.coverage.coverage_for(tower, game.content.tower_configs[tower_id].levels[0].range)
+    rows = list(range(len(fleet)))
+    ranked = sorted(rows, key=fleet.distance.__getitem__)
+    ranked_distances = [fleet.distance[row] for row in ranked]
+    positions = PositionCache(game.path, fleet.distance)
+    positions.fill(rows)
+    return lambda: combat._select_target_indexed(tower, coverage, fleet, ranked, ranked_distances, positions)
+
+
+def _apply_chain_damage() -> Callable[[], object]:
+    """One chain from mid-river through the tick's fleet grid, built untimed."""
+    from homeland.systems.combat_system import CHAIN_RADIUS
+    from homeland.systems.pathing import PositionCache
+    from homeland.systems.spatial import FleetGrid
+
+    game = _crowded_game()
+    fleet = game.fleet
+    fleet.hp[:] = [math.inf] * len(fleet)
+    combat = game.combat
+    rows = list(range(len(fleet)))
+    positions = PositionCache(game.path, fleet.distance)
+    positions.fill(rows)
+    grid = FleetGrid(positions, rows, CHAIN_RADIUS)
+    source = len(fleet) // 2
+    return lambda: combat._apply_chain_damage(source, fleet, grid, 3, 35.0, {})
+
+
+def _chain_lightning_burst(sources: int = 10) -> Callable[[], object]:
+    """One tick's worth of chains from ``sources`` lightning hits spread along the river."""
+    from homeland.systems.combat_system import CHAIN_RADIUS, CombatSystem
+    from homeland.systems.pathing import PositionCache
+    from homeland.systems.spatial import FleetGrid
+
+    game = _crowded_game()
+    fleet = game.fleet
+    fleet.hp[:] = [math.inf] * len(fleet)
+    combat = CombatSystem(game.content.tower_configs)
+    rows = list(range(len(fleet)))
+    targets = rows[:: max(1, len(rows) // sources)][:sources]
+
+    def run() -> object:
+        # Includes the once-per-tick position fill and grid build.
+        positions = PositionCache(game.path, fleet.distance)
+        positions.fill(rows)
+        grid = FleetGrid(positions, rows, CHAIN_RADIUS)
+        killed: dict[int, object] = {}
+        for source in targets:
+            combat._apply_chain_damage(source, fleet, grid, 3, 35.0, killed)
+        return killed
+
+    return run
+
+
+def _combat_tick() -> Callable[[], object]:
+    """Every build slot fires once at a crowded river, cycling through the tower types."""
+    from homeland.entities.tower import Tower
+
+    game = _crowded_game()
+    fleet = game.fleet
+    fleet.hp[:] = [math.inf] * len(fleet)
+    tower_ids = sorted(game.content.tower_configs)
+    towers = [
+        Tower(
+            tower_instance_id=f"bench_{index}",
+            tower_id=tower_ids[index % len(tower_ids)],
+            slot_id=slot.slot_id,
+            x=slot.x,
+            y=slot.y,
+        )
+        for index, slot in enumerate(game.content.map_config.build_slots)
+    ]
+    combat = game.combat
+
+    def run() -> object:
+        for tower in towers:
+            tower.cooldown_left = 0.0
+        return combat.tick(0.0, towers, fleet, game.path)
+
+    return run
+
+
+def _tower_attacks(towers: int = 200) -> Callable[[], object]:
+    """``towers`` towers fire once each in one tick, so per-attack work dominates.
+
+    Lightning towers are left out: their chain search, timed by
+    ``apply_chain_damage``, would swamp the per-attack path.
+    """
+    from homeland.entities.tower import Tower
+
+    game = _crowded_game()
+    fleet = game.fleet
+    fleet.hp[:] = [math.inf] * len(fleet)
+    configs = game.content.tower_configs
+    tower_ids = [tower_id for tower_id in sorted(configs) if configs[tower_id].effect_type != "lightning"]
+    slots = game.content.map_config.build_slots
+    armed = []
+    for index in range(towers):
+        tower_id = tower_ids[index % len(tower_ids)]
+        slot = slots[index % len(slots)]
+        armed.append(
+            Tower(
+                tower_instance_id=f"bench_{index}",
+                tower_id=tower_id,
+                slot_id=slot.slot_id,
+                x=slot.x,
+                y=slot.y,
+                level=1 + index % len(configs[tower_id].levels),
+            )
+        )
+    combat = game.combat
+
+    def run() -> object:
+        for tower in armed:
+            tower.cooldown_left = 0.0
+        return combat.tick(0.0, armed, fleet, game.path)
+
+    # The first tick builds every tower's coverage.
+    run()
+    return run
+
+
+def _settle_mass_kills(boats: int = 1000) -> Callable[[], object]:
+    """Settle ``boats`` kills landing in the same tick, as a big chain or splash would."""
+    game = _crowded_game(boats)
+    game.fleet.destroyed[:] = [True] * boats
+    mask = game.fleet.destroyed[:]
+
+    def run() -> None:
+        game._settle_kills(mask)
+        game._settle_ledger()
+
+    return run
+
+
+def _event_bus_emit() -> Callable[[], object]:
+    from homeland.core.event_bus import EventBus
+
+    bus = EventBus()
+    bus.subscribe("enemy_leaked", lambda event: None)
+
+    def run() -> None:
+        emit = bus.emit
+        for index in range(1000):
+            emit("enemy_leaked", boat_id=index, coins=120)
+
+    return run
+
+
+def _wave_system_tick() -> Callable[[], object]:
+    from homeland.config import WaveConfig
+    from homeland.systems.wave_system import WaveSystem
+
+    waves = WaveSystem([WaveConfig(wave_id=1, spawn_interval=0.05, composition={"scout": 5000, "raider": 5000})])
+    waves.start_next_wave()
+    tick = waves.tick
+    return lambda: [tick(0.1) for _ in range(100)]
+
+
+def _wave_memory(boats: int = 100_000) -> Callable[[], float]:
+    """Bytes per boat allocated while a wave of ``boats`` spawns, as traced by ``tracemalloc``."""
+    from homeland.game import HomelandGame
+
+    content = _default_content()
+    enemy_type = next(iter(content.enemy_configs))
+
+    def run() -> float:
+        game = HomelandGame(content=content, event_history=0)
+        spawn = game._spawn_boat
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for _ in range(boats):
+                spawn(enemy_type)
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return (after - before) / boats
+
+    return run
+
+
+def _full_map_run() -> Callable[[], object]:
+    from homeland.game import HomelandGame
+    from homeland.policy import BASELINE_PLAN, play_map
+
+    content = _default_content()
+    return lambda: play_map(HomelandGame(content=content, event_history=0), BASELINE_PLAN)
+
+
+def _scalar_runs(games: int = 16) -> Callable[[], object]:
+    """``_batch_runs``' games played one after another through ``HomelandGame``."""
+    from homeland.game import HomelandGame
+    from homeland.policy import BASELINE_PLAN, play_map
+
+    content = _default_content()
+    return lambda: [play_map(HomelandGame(content=content, event_history=0), BASELINE_PLAN) for _ in range(games)]
+
+
+def _batch_runs(games: int = 16) -> Callable[[], object]:
+    from homeland.batch_sim import BatchedHomelandSim
+    from homeland.policy import BASELINE_PLAN
+
+    content = _default_content()
+    return lambda: BatchedHomelandSim(content, [BASELINE_PLAN] * games).run()
+
+
+def _stress_map_run() -> Callable[[], object]:
+    from homeland.game import HomelandGame
+    from homeland.policy import BuildPlan, play_map
+    from homeland.stress_content import generate_content
+
+    content = generate_content(waypoints=500, slots=40, towers_per_effect=2, boats_per_wave=200, waves=2, seed=11)
+    tower_ids = sorted(content.tower_configs)
+    slots = [slot.slot_id for slot in content.map_config.build_slots[:12]]
+    plan = BuildPlan(
+        placements=[(slot_id, tower_ids[index % len(tower_ids)]) for index, slot_id in enumerate(slots)],
+        upgrade_priority=slots,
+    )
+    return lambda: play_map(HomelandGame(content=content, event_history=0), plan)
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    bench.name: bench
+    for bench in (
+        Benchmark("path_lookup", "micro", _path_lookup, inner=20),
+        Benchmark("river_path_lookup", "micro", _river_path_lookup),
+        Benchmark("select_target", "micro", _select_target, inner=200),
+        Benchmark("apply_chain_damage", "micro", _apply_chain_damage, inner=200),
+        Benchmark("chain_lightning_burst", "micro", _chain_lightning_burst, inner=50),
+        Benchmark("combat_tick", "micro", _combat_tick, inner=50),
+        Benchmark("tower_attacks", "micro", _tower_attacks, inner=20),
+        Benchmark("settle_mass_kills", "micro", _settle_mass_kills),
+        Benchmark("event_bus_emit", "micro", _event_bus_emit, inner=10),
+        Benchmark("wave_system_tick", "micro", _wave_system_tick, inner=5),
+        Benchmark("wave_memory_100k", "memory", _wave_memory, unit="B/boat"),
+        Benchmark("full_map_run", "macro", _full_map_run),
+        Benchmark("scalar_runs_16", "macro", _scalar_runs),
+        Benchmark("batch_runs_16", "macro", _batch_runs, versus="scalar_runs_16"),
+        Benchmark("stress_map_run", "macro", _stress_map_run),
+    )
+}
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    mean = sum(samples) / len(samples)
+    variance = sum((value - mean) ** 2 for value in samples) / max(1, len(samples) - 1)
+    return {
+        "sampleSize": len(samples),
+        "min": percentile(samples, 0),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "max": percentile(samples, 100),
+        "mean": round(mean, 4),
+        "stdev": round(math.sqrt(variance), 4),
+    }
+
+
+def measure(bench: Benchmark, repeats: int = DEFAULT_REPEATS) -> list[float]:
+    """Milliseconds per call for each of ``repeats`` samples, after one warm-up.
+
+    Samples of a ``memory`` benchmark are its call's return values instead.
+    """
+    if repeats <= 0:
+        raise ValueError("repeats must be positive")
+    bench.setup()()
+    samples: list[float] = []
+    for _ in range(repeats):
+        run = bench.setup()
+        if bench.kind == "memory":
+            samples.append(float(run()))
+            continue
+        start = time.perf_counter()
+        for _ in range(bench.inner):
+            run()
+        samples.append((time.perf_counter() - start) * 1000 / bench.inner)
+    return samples
+
+
+def run_benchmarks(names: list[str] | None = None, repeats: int = DEFAULT_REPEATS) -> dict[str, Any]:
+    """Run the named benchmarks (all by default) into a ``docs/perf``-style report."""
+    unknown = sorted(set(names or ()) - set(BENCHMARKS))
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+    started = _timestamp()
+    results: dict[str, Any] = {}
+    for name in names or list(BENCHMARKS):
+        bench = BENCHMARKS[name]
+        samples = measure(bench, repeats)
+        results[name] = {
+            "kind": bench.kind,
+            "unit": bench.unit,
+            "innerCalls": bench.inner,
+            "summary": summarize(samples),
+            "samples": [round(value, 4) for value in samples],
+        }
+    for name, result in results.items():
+        versus = BENCHMARKS[name].versus
+        if versus in results and result["summary"]["p50"]:
+            ratio = results[versus]["summary"]["p50"] / result["summary"]["p50"]
+            result["speedup"] = {"versus": versus, "ratio": round(ratio, 3)}
+    return {
+        "startedAt": started,
+        "repeats": repeats,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+        "endedAt": _timestamp(),
+    }
+
+
+def mann_whitney_greater(current: list[float], baseline: list[float]) -> float:
+    """One-sided p-value that ``current`` tends to exceed ``baseline``.
+
+    Uses the normal approximation with a tie correction; fine for the ten
+    or so samples per side a run records.
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0.0
+    start = 0
+    while start < len(pooled):
+        end = start
+        while end + 1 < len(pooled) and pooled[end + 1][0] == pooled[start][0]:
+            end += 1
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2 + 1
+        size = end - start + 1
+        tie_term += size**3 - size
+        start = end + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, pooled) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    total = n1 + n2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    alpha: float = DEFAULT_ALPHA,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """One row per benchmark in either report, flagging significant slowdowns.
+
+    ``status`` is "compared" for benchmarks in both reports, "no baseline"
+    for ones only ``current`` has and "not run" for ones only ``baseline``
+    has; one-sided rows carry ``None`` for what they lack and never count
+    as regressions.
+    """
+    rows = []
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        after = result["summary"]["p50"]
+        if base is None:
+            rows.append(_one_sided_row(name, "no baseline", current=after))
+            continue
+        before = base["summary"]["p50"]
+        change = (after - before) / before if before else 0.0
+        p_value = mann_whitney_greater(result["samples"], base["samples"])
+        rows.append(
+            {
+                "name": name,
+                "status": "compared",
+                "baselineP50": before,
+                "currentP50": after,
+                "change": round(change, 4),
+                "pValue": round(p_value, 4),
+                "regression": change > threshold and p_value < alpha,
+            }
+        )
+    for name, base in baseline["benchmarks"].items():
+        if name not in current["benchmarks"]:
+            rows.append(_one_sided_row(name, "not run", baseline=base["summary"]["p50"]))
+    return rows
+
+
+def _one_sided_row(
+    name: str,
+    status: str,
+    baseline: float | None = None,
+    current: float | None = None,
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "status": status,
+        "baselineP50": baseline,
+        "currentP50": current,
+        "change": None,
+        "pValue": None,
+        "regression": False,
+    }
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
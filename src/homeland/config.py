@@ -2,48 +2,76 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-import json
+from types import MappingProxyType
+from typing import Mapping, Sequence
+import copyreg
+import hashlib
+import os
 
 
-@dataclass
+def _read_only(values: dict) -> Mapping:
+    return MappingProxyType(values)
+
+
+def _freeze(instance: object, **values: object) -> None:
+    """Replace list and dict fields of a frozen dataclass with read-only views.
+
+    Content is shared between every game that loads it, so its containers
+    must not be mutable either: lists become tuples and dicts read-only
+    mappings.
+    """
+    for name, value in values.items():
+        frozen = _read_only(dict(value)) if isinstance(value, Mapping) else tuple(value)
+        object.__setattr__(instance, name, frozen)
+
+
+# Read-only mappings pickle as the dict they wrap, for the disk cache and
+# for worker processes.
+copyreg.pickle(MappingProxyType, lambda proxy: (_read_only, (dict(proxy),)))
+
+
+@dataclass(frozen=True)
 class LeakPenalty:
     coins: int
     xp: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class UnlockRequirement:
     next_map: str
     min_xp: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class Waypoint:
     x: float
     y: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class BuildSlot:
     slot_id: str
     x: float
     y: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class MapConfig:
     map_id: str
     starting_coins: int
     starting_xp: int
     leak_penalty: LeakPenalty
     unlock_requirement: UnlockRequirement
-    path_waypoints: list[Waypoint]
-    build_slots: list[BuildSlot]
+    path_waypoints: Sequence[Waypoint]
+    build_slots: Sequence[BuildSlot]
 
+    def __post_init__(self) -> None:
+        _freeze(self, path_waypoints=self.path_waypoints, build_slots=self.build_slots)
 
-@dataclass
+
+@dataclass(frozen=True)
 class TowerLevel:
     level: int
     cost: int
@@ -58,15 +86,22 @@ class TowerLevel:
     chain_falloff: float = 0.0
 
 
-@dataclass
+# What a tower does after its direct hit: nothing, burn, slow or chain.
+EFFECT_TYPES = ("physical", "fire", "wind", "lightning")
+
+
+@dataclass(frozen=True)
 class TowerConfig:
     tower_id: str
     display_name: str
     effect_type: str
-    levels: list[TowerLevel]
+    levels: Sequence[TowerLevel]
 
+    def __post_init__(self) -> None:
+        _freeze(self, levels=self.levels)
 
-@dataclass
+
+@dataclass(frozen=True)
 class EnemyConfig:
     enemy_type: str
     hp: float
@@ -75,32 +110,60 @@ class EnemyConfig:
     xp_reward: int
 
 
-@dataclass
+# How a wave's composition is ordered at the spawn point: every type in
+# turn as one group, round-robin across types, or a repeating pattern.
+SPAWN_ORDERS = ("grouped", "interleaved", "pattern")
+
+
+@dataclass(frozen=True)
 class WaveConfig:
     wave_id: int
     spawn_interval: float
-    composition: dict[str, int]
+    composition: Mapping[str, int]
+    order: str = "grouped"
+    pattern: Sequence[str] = field(default_factory=tuple)
 
+    def __post_init__(self) -> None:
+        _freeze(self, composition=self.composition, pattern=self.pattern)
 
-@dataclass
+
+@dataclass(frozen=True)
 class ProgressionConfig:
     xp_per_wave_clear: int
     xp_map_clear: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class GameContent:
     map_config: MapConfig
-    tower_configs: dict[str, TowerConfig]
-    enemy_configs: dict[str, EnemyConfig]
-    waves: list[WaveConfig]
+    tower_configs: Mapping[str, TowerConfig]
+    enemy_configs: Mapping[str, EnemyConfig]
+    waves: Sequence[WaveConfig]
     progression: ProgressionConfig
 
+    def __post_init__(self) -> None:
+        _freeze(self, tower_configs=self.tower_configs, enemy_configs=self.enemy_configs, waves=self.waves)
+
 
 DEFAULT_DATA_DIR = Path(__file__).resolve().parent / "data"
+DEFAULT_MAP_ID = "map_01_river_bend"
+
+# Compiled content lives here unless ``HOMELAND_CONTENT_CACHE`` names
+# another directory; set it to an empty string to disable the disk cache.
+CACHE_ENV = "HOMELAND_CONTENT_CACHE"
+
+# Bump when the compiled form changes so stale artifacts are ignored.
+_CACHE_VERSION = 3
+
+# Content compiled in this process, keyed by source hash. Worker processes
+# forked after the first load share it without reloading.
+_compiled: dict[str, GameContent] = {}
 
 
 def _load_json(path: Path) -> dict | list:
+    # Only compiling needs JSON; a warm start loads the compiled artifact.
+    import json
+
     if not path.exists():
         raise ValueError(f"Missing config file: {path}")
     return json.loads(path.read_text())
@@ -112,10 +175,178 @@ def _require_keys(data: dict, keys: set[str], context: str) -> None:
         raise ValueError(f"{context}: missing keys {sorted(missing)}")
 
 
-def load_game_content(base_data_dir: Path | None = None) -> GameContent:
+def available_maps(base_data_dir: Path | None = None) -> list[str]:
+    """Ids of every map in the data directory."""
     data_dir = base_data_dir or DEFAULT_DATA_DIR
+    return sorted(path.stem for path in (data_dir / "maps").glob("*.json"))
 
-    map_raw = _load_json(data_dir / "maps" / "map_01_river_bend.json")
+
+def content_sources(base_data_dir: Path | None = None, map_id: str = DEFAULT_MAP_ID) -> list[Path]:
+    """The source files a map's content is built from, in load order."""
+    data_dir = base_data_dir or DEFAULT_DATA_DIR
+    map_path = data_dir / "maps" / f"{map_id}.json"
+    if not map_path.exists():
+        raise ValueError(f"Unknown map: {map_id}")
+    return [
+        map_path,
+        data_dir / "towers" / "towers.json",
+        data_dir / "enemies" / "boat_types.json",
+        _waves_path(data_dir, map_id),
+        data_dir / "progression" / "progression.json",
+    ]
+
+
+def content_hash(sources: list[Path]) -> str:
+    digest = hashlib.sha256(f"homeland-content-{_CACHE_VERSION}".encode("ascii"))
+    for path in sources:
+        if not path.exists():
+            raise ValueError(f"Missing config file: {path}")
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def content_cache_dir() -> Path | None:
+    """Where compiled content is stored, or ``None`` when caching is off."""
+    configured = os.environ.get(CACHE_ENV)
+    if configured is not None:
+        return Path(configured) if configured else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "homeland" / "content"
+
+
+def load_game_content(base_data_dir: Path | None = None, map_id: str = DEFAULT_MAP_ID) -> GameContent:
+    """Return a map's content, compiling it only when its sources changed.
+
+    Content is keyed by a hash of its source files: the first load in a
+    process reuses any content compiled earlier, then a compiled artifact
+    on disk, and only then parses and validates the JSON. The result is
+    shared between callers, so it is read-only throughout: its lists are
+    tuples and its dicts read-only mappings.
+    """
+    sources = content_sources(base_data_dir, map_id)
+    key = content_hash(sources)
+    content = _compiled.get(key)
+    if content is None:
+        content = _compiled[key] = load_compiled(sources, map_id, key)
+    return content
+
+
+def load_compiled(sources: list[Path], map_id: str, key: str | None = None) -> GameContent:
+    """Content built from ``sources`` via the on-disk artifact cache only.
+
+    ``sources`` are in ``content_sources`` order; ``key`` is their
+    ``content_hash`` if the caller already has it.
+    """
+    key = key or content_hash(sources)
+    cache_dir = content_cache_dir()
+    artifact = None if cache_dir is None else cache_dir / f"{map_id}-{key[:32]}.pickle"
+    content = None if artifact is None else _read_artifact(artifact)
+    if content is None:
+        content = compile_sources(sources, map_id)
+        if artifact is not None:
+            _write_artifact(artifact, content)
+            _prune_artifacts(artifact, map_id)
+    return content
+
+
+def validate_spawn_order(wave: WaveConfig) -> None:
+    """Check ``order`` is known and a pattern yields exactly the composition."""
+    if wave.order not in SPAWN_ORDERS:
+        raise ValueError(f"Wave {wave.wave_id}: unknown spawn order {wave.order!r}")
+    if wave.order != "pattern":
+        return
+    if not wave.pattern:
+        raise ValueError(f"Wave {wave.wave_id}: pattern order needs a pattern")
+    total = sum(wave.composition.values())
+    repeats, rest = divmod(total, len(wave.pattern))
+    counts: dict[str, int] = {}
+    for index, enemy_type in enumerate(wave.pattern):
+        counts[enemy_type] = counts.get(enemy_type, 0) + repeats + (index < rest)
+    if {k: v for k, v in counts.items() if v} != {k: v for k, v in wave.composition.items() if v}:
+        raise ValueError(f"Wave {wave.wave_id}: pattern does not produce the composition")
+
+
+def _read_artifact(path: Path) -> GameContent | None:
+    import pickle
+
+    try:
+        with open(path, "rb") as handle:
+            content = pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated, foreign or from an older build: rebuild it.
+        content = None
+    if isinstance(content, GameContent):
+        return content
+    try:
+        path.unlink()
+    except OSError:
+        pass
+    return None
+
+
+def _write_artifact(path: Path, content: GameContent) -> None:
+    import pickle
+
+    # Written beside the target and renamed so readers never see half a file.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _prune_artifacts(keep: Path, map_id: str) -> None:
+    """Remove ``map_id``'s artifacts for other source hashes, which only pile up."""
+    for path in keep.parent.glob(f"{map_id}-*.pickle"):
+        # ``map_id`` may itself be a prefix of a longer id with a dash.
+        if path != keep and path.stem.rsplit("-", 1)[0] == map_id:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _waves_path(data_dir: Path, map_id: str) -> Path:
+    """``waves/<map_id>_waves.json``, else the file named by the map's number prefix."""
+    waves_dir = data_dir / "waves"
+    exact = waves_dir / f"{map_id}_waves.json"
+    if exact.exists():
+        return exact
+    return waves_dir / ("_".join(map_id.split("_")[:2]) + "_waves.json")
+
+
+def compile_game_content(base_data_dir: Path | None = None, map_id: str = DEFAULT_MAP_ID) -> GameContent:
+    """Parse and validate a map's JSON sources without any caching."""
+    return compile_sources(content_sources(base_data_dir, map_id), map_id)
+
+
+def compile_sources(sources: list[Path], map_id: str) -> GameContent:
+    """Parse and validate content from files in ``content_sources`` order."""
+    map_path, towers_path, enemies_path, waves_path, progression_path = sources
+    return build_game_content(
+        map_id,
+        map_raw=_load_json(map_path),
+        towers_raw=_load_json(towers_path),
+        enemies_raw=_load_json(enemies_path),
+        waves_raw=_load_json(waves_path),
+        progression_raw=_load_json(progression_path),
+    )
+
+
+def build_game_content(
+    map_id: str,
+    map_raw: dict,
+    towers_raw: list,
+    enemies_raw: list,
+    waves_raw: list,
+    progression_raw: dict,
+) -> GameContent:
+    """Validate content in its JSON shape and build ``GameContent`` from it."""
     _require_keys(
         map_raw,
         {
@@ -127,7 +358,7 @@ def load_game_content(base_data_dir: Path | None = None) -> GameContent:
             "path_waypoints",
             "build_slots",
         },
-        "map_01_river_bend",
+        map_id,
     )
 
     map_config = MapConfig(
@@ -153,10 +384,11 @@ def load_game_content(base_data_dir: Path | None = None) -> GameContent:
     if len(map_config.path_waypoints) < 2:
         raise ValueError("path_waypoints must include at least 2 points")
 
-    towers_raw = _load_json(data_dir / "towers" / "towers.json")
     tower_configs: dict[str, TowerConfig] = {}
     for tower in towers_raw:
         _require_keys(tower, {"tower_id", "display_name", "effect_type", "levels"}, f"tower {tower!r}")
+        if tower["effect_type"] not in EFFECT_TYPES:
+            raise ValueError(f"Unknown effect_type for {tower['tower_id']}: {tower['effect_type']}")
         levels: list[TowerLevel] = []
         for level_data in tower["levels"]:
             stats = level_data["stats"]
@@ -183,7 +415,6 @@ def load_game_content(base_data_dir: Path | None = None) -> GameContent:
         )
         tower_configs[tower_cfg.tower_id] = tower_cfg
 
-    enemies_raw = _load_json(data_dir / "enemies" / "boat_types.json")
     enemy_configs: dict[str, EnemyConfig] = {}
     for enemy in enemies_raw:
         _require_keys(enemy, {"enemy_type", "hp", "speed", "coin_reward", "xp_reward"}, f"enemy {enemy!r}")
@@ -196,7 +427,6 @@ def load_game_content(base_data_dir: Path | None = None) -> GameContent:
         )
         enemy_configs[cfg.enemy_type] = cfg
 
-    waves_raw = _load_json(data_dir / "waves" / "map_01_waves.json")
     waves: list[WaveConfig] = []
     for wave in waves_raw:
         _require_keys(wave, {"wave_id", "spawn_interval", "composition"}, f"wave {wave!r}")
@@ -204,15 +434,16 @@ def load_game_content(base_data_dir: Path | None = None) -> GameContent:
         for enemy_type in composition:
             if enemy_type not in enemy_configs:
                 raise ValueError(f"Wave references unknown enemy type: {enemy_type}")
-        waves.append(
-            WaveConfig(
-                wave_id=int(wave["wave_id"]),
-                spawn_interval=float(wave["spawn_interval"]),
-                composition=composition,
-            )
+        wave_cfg = WaveConfig(
+            wave_id=int(wave["wave_id"]),
+            spawn_interval=float(wave["spawn_interval"]),
+            composition=composition,
+            order=wave.get("order", "grouped"),
+            pattern=[str(enemy_type) for enemy_type in wave.get("pattern", [])],
         )
+        validate_spawn_order(wave_cfg)
+        waves.append(wave_cfg)
 
-    progression_raw = _load_json(data_dir / "progression" / "progression.json")
     _require_keys(progression_raw, {"xp_per_wave_clear", "xp_map_clear"}, "progression")
     progression = ProgressionConfig(
         xp_per_wave_clear=int(progression_raw["xp_per_wave_clear"]),
@@ -0,0 +1,106 @@
+"""Campaign-wide content index with lazy, bounded per-map loading."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+import json
+
+from homeland.config import (
+    DEFAULT_DATA_DIR,
+    GameContent,
+    available_maps,
+    content_sources,
+    load_compiled,
+)
+
+
+MANIFEST_NAME = "manifest.json"
+
+# Compiled maps kept in memory before the least recently used is dropped.
+DEFAULT_MAX_MAPS = 4
+
+
+class ContentRegistry:
+    """Every map under a data directory, compiled on first request.
+
+    The index comes from ``manifest.json`` when the directory has one,
+    naming each map's file and wave set plus the shared tower, enemy and
+    progression tables; otherwise every ``maps/*.json`` is indexed by the
+    same conventions as ``load_game_content``. Opening a registry reads
+    only the manifest. ``get`` compiles a map (through the on-disk
+    artifact cache) the first time it is asked for, and at most
+    ``max_maps`` compiled maps stay in memory, the least recently used
+    going first. Loaded content reflects its sources as of that load.
+    """
+
+    def __init__(self, data_dir: Path | None = None, max_maps: int = DEFAULT_MAX_MAPS) -> None:
+        if max_maps <= 0:
+            raise ValueError("max_maps must be positive")
+        self.data_dir = Path(data_dir or DEFAULT_DATA_DIR)
+        self.max_maps = max_maps
+        self._sources = _index(self.data_dir)
+        self._loaded: OrderedDict[str, GameContent] = OrderedDict()
+
+    @property
+    def map_ids(self) -> list[str]:
+        return list(self._sources)
+
+    @property
+    def loaded(self) -> list[str]:
+        """Maps in memory, least recently used first."""
+        return list(self._loaded)
+
+    def __contains__(self, map_id: object) -> bool:
+        return map_id in self._sources
+
+    def sources(self, map_id: str) -> list[Path]:
+        """``map_id``'s source files in ``content_sources`` order."""
+        if map_id not in self._sources:
+            raise ValueError(f"Unknown map: {map_id}")
+        return self._sources[map_id]
+
+    def get(self, map_id: str) -> GameContent:
+        content = self._loaded.get(map_id)
+        if content is not None:
+            self._loaded.move_to_end(map_id)
+            return content
+        content = load_compiled(self.sources(map_id), map_id)
+        self._loaded[map_id] = content
+        while len(self._loaded) > self.max_maps:
+            self._loaded.popitem(last=False)
+        return content
+
+    def evict(self, map_id: str) -> None:
+        self._loaded.pop(map_id, None)
+
+    def clear(self) -> None:
+        self._loaded.clear()
+
+
+def _index(data_dir: Path) -> dict[str, list[Path]]:
+    manifest_path = data_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {map_id: content_sources(data_dir, map_id) for map_id in available_maps(data_dir)}
+
+    manifest = json.loads(manifest_path.read_text())
+    _require(manifest, {"towers", "enemies", "progression", "maps"}, MANIFEST_NAME)
+    index: dict[str, list[Path]] = {}
+    for entry in manifest["maps"]:
+        _require(entry, {"map_id", "map", "waves"}, f"{MANIFEST_NAME} map {entry!r}")
+        if entry["map_id"] in index:
+            raise ValueError(f"{MANIFEST_NAME}: duplicate map {entry['map_id']}")
+        index[entry["map_id"]] = [
+            data_dir / entry["map"],
+            data_dir / manifest["towers"],
+            data_dir / manifest["enemies"],
+            data_dir / entry["waves"],
+            data_dir / manifest["progression"],
+        ]
+    return index
+
+
+def _require(data: dict, keys: set[str], context: str) -> None:
+    missing = keys - set(data)
+    if missing:
+        raise ValueError(f"{context}: missing keys {sorted(missing)}")
@@ -2,32 +2,94 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+
+
+# Events kept in history by default; older ones fall off the front.
+DEFAULT_HISTORY = 10_000
+
+WILDCARD = "*"
 
 
 @dataclass
 class Event:
     """Runtime event payload."""
 
+    __slots__ = ("name", "payload")
+
     name: str
     payload: dict[str, Any]
 
 
+Listener = Callable[[Event], None]
+
+
 class EventBus:
-    """Collects events so systems can emit traceable state changes."""
+    """Delivers events to subscribers and keeps a bounded recent history.
+
+    ``history`` caps how many events are kept (``None`` keeps all, ``0``
+    keeps none). Subscribers are keyed by event name, or ``WILDCARD`` for
+    every event. When no history is kept and nobody listens for a name,
+    emitting it does nothing; callers on hot paths check ``wants`` first
+    so the payload is never built. ``published`` counts the events that
+    were recorded or delivered.
+    """
 
-    def __init__(self) -> None:
-        self._events: list[Event] = []
+    def __init__(self, history: int | None = DEFAULT_HISTORY) -> None:
+        if history is not None and history < 0:
+            raise ValueError("history must be non-negative or None")
+        self._history: deque[Event] | None = deque(maxlen=history) if history != 0 else None
+        self._listeners: dict[str, list[Listener]] = {}
+        self.published = 0
+
+    def subscribe(self, name: str, listener: Listener) -> Callable[[], None]:
+        """Call ``listener`` for every ``name`` event; returns an unsubscribe callback."""
+        self._listeners.setdefault(name, []).append(listener)
+        return lambda: self.unsubscribe(name, listener)
+
+    def unsubscribe(self, name: str, listener: Listener) -> None:
+        listeners = self._listeners.get(name)
+        if listeners is None or listener not in listeners:
+            return
+        listeners.remove(listener)
+        if not listeners:
+            del self._listeners[name]
+
+    def wants(self, name: str) -> bool:
+        """Whether emitting ``name`` would be recorded or delivered."""
+        return self._history is not None or name in self._listeners or WILDCARD in self._listeners
+
+    def has_listeners(self, name: str) -> bool:
+        """Whether a subscriber, named or wildcard, would receive ``name``; history aside."""
+        return name in self._listeners or WILDCARD in self._listeners
 
     def emit(self, name: str, **payload: Any) -> None:
-        self._events.append(Event(name=name, payload=payload))
+        if self.wants(name):
+            self._publish(Event(name=name, payload=payload))
+
+    def emit_lazy(self, name: str, build: Callable[[], dict[str, Any]]) -> None:
+        """Emit ``name`` with the payload from ``build``, called only if someone wants it."""
+        if self.wants(name):
+            self._publish(Event(name=name, payload=build()))
 
     @property
     def events(self) -> list[Event]:
-        return self._events
+        return list(self._history) if self._history is not None else []
 
     def drain(self) -> list[Event]:
-        events = self._events[:]
-        self._events.clear()
+        events = self.events
+        if self._history is not None:
+            self._history.clear()
         return events
+
+    def _publish(self, event: Event) -> None:
+        self.published += 1
+        if self._history is not None:
+            self._history.append(event)
+        # Copies, so a listener may unsubscribe while being called.
+        for listener in tuple(self._listeners.get(event.name, ())):
+            listener(event)
+        for listener in tuple(self._listeners.get(WILDCARD, ())):
+            listener(event)
@@ -0,0 +1,106 @@
+"""Opt-in wall-time and counter profiling of ``HomelandGame.tick``, and timing percentiles."""
+
+from __future__ import annotations
+
+from typing import Any
+import math
+import time
+
+
+# Phases of ``HomelandGame.tick`` in the order they run, plus the
+# closed-form ``drift`` step of event-driven stepping.
+PHASES = ("spawn", "combat", "kills", "movement", "outcome", "drift")
+
+COUNTERS = (
+    "ticks",
+    "boats_alive",
+    "peak_boats",
+    "spawned",
+    "attacks_fired",
+    "distance_checks",
+    "kills",
+    "leaks",
+    "events_emitted",
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile, as the web load-metrics script computes it."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 4)
+
+
+class TickProfiler:
+    """Cumulative seconds and calls per tick phase, plus simulation counters.
+
+    ``boats_alive`` sums the fleet size seen at the start of every tick, so
+    dividing it by ``ticks`` gives the mean; ``peak_boats`` is the largest.
+    ``distance_checks`` counts tower-to-boat and boat-to-boat range tests.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.seconds[phase] += seconds
+        self.calls[phase] += 1
+
+    def reset(self) -> None:
+        self.seconds: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.calls: dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.counters: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+
+    def report(self) -> dict[str, Any]:
+        """JSON-ready totals: per-phase milliseconds and calls, then counters."""
+        return {
+            "phases": {
+                phase: {"ms": round(self.seconds[phase] * 1000, 4), "calls": self.calls[phase]}
+                for phase in PHASES
+            },
+            "total_ms": round(sum(self.seconds.values()) * 1000, 4),
+            "counters": dict(self.counters),
+        }
+
+
+class PhaseTimer:
+    """Times the phases of one tick, in order, into a ``TickProfiler``.
+
+    Each ``lap`` closes the phase that just ran: it is charged the time
+    since the previous lap, or since the timer was made.
+    """
+
+    def __init__(self, profiler: TickProfiler) -> None:
+        self.profiler = profiler
+        self.counters = profiler.counters
+        self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.profiler.add(phase, now - self._mark)
+        self._mark = now
+
+    def count(self, counter: str, amount: int) -> None:
+        self.counters[counter] += amount
+
+    def peak(self, counter: str, value: int) -> None:
+        if value > self.counters[counter]:
+            self.counters[counter] = value
+
+
+class NullTimer:
+    """``PhaseTimer`` stand-in for unprofiled ticks; records nothing."""
+
+    def lap(self, phase: str) -> None:
+        pass
+
+    def count(self, counter: str, amount: int) -> None:
+        pass
+
+    def peak(self, counter: str, value: int) -> None:
+        pass
+
+
+NULL_TIMER = NullTimer()
@@ -0,0 +1,229 @@
+"""Streaming event sinks that write ``EventBus`` output to disk as it happens."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator
+import json
+import struct
+
+from homeland.core.event_bus import WILDCARD, Event, EventBus
+
+
+# Events buffered before a sink writes them out in one call.
+DEFAULT_BATCH = 4096
+
+# Doubles as a segment marker; it cannot collide with a record header
+# because no tag is ``ord("H")``.
+BINARY_MAGIC = b"HLOG\x01"
+
+# Binary record tags.
+_TAG_STRING = 0
+_TAG_LAYOUT = 1
+_TAG_EVENT = 2
+
+# Field type codes and their packed form; strings are string-table ids.
+_FIELD_FORMATS = {"q": "q", "d": "d", "?": "?", "s": "I", "j": "I"}
+
+_HEADER = struct.Struct("<BI")
+
+
+class EventSink:
+    """Buffers events and writes them out in batches.
+
+    Subclasses encode events with ``_encode``; ``flush`` hands everything
+    buffered to the file in a single write, so memory stays bounded by
+    ``batch`` events however long the trace grows.
+    """
+
+    def __init__(self, path: Path, batch: int = DEFAULT_BATCH, append: bool = False) -> None:
+        if batch <= 0:
+            raise ValueError("batch must be positive")
+        self.path = Path(path)
+        self.batch = batch
+        self._file: BinaryIO = open(self.path, "ab" if append else "wb")
+        self._chunks: list[bytes] = []
+        self._pending = 0
+
+    def attach(self, bus: EventBus) -> Callable[[], None]:
+        """Stream every event ``bus`` emits; returns a callback that detaches."""
+        return bus.subscribe(WILDCARD, self.write)
+
+    def write(self, event: Event) -> None:
+        self._chunks.append(self._encode(event))
+        self._pending += 1
+        if self._pending >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._chunks:
+            self._file.write(b"".join(self._chunks))
+            self._chunks.clear()
+            self._pending = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> EventSink:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _encode(self, event: Event) -> bytes:
+        raise NotImplementedError
+
+
+class NdjsonSink(EventSink):
+    """One ``{"name": ..., "payload": {...}}`` JSON object per line."""
+
+    def _encode(self, event: Event) -> bytes:
+        line = json.dumps({"name": event.name, "payload": event.payload}, separators=(",", ":"))
+        return line.encode("utf-8") + b"\n"
+
+
+class BinarySink(EventSink):
+    """Packed records with an event-name dictionary and fixed field layouts.
+
+    The first time an event name appears with a given set of fields and
+    value types, a layout record fixes its struct format. Later events of
+    that shape are a tag, a layout id and the packed values. Strings,
+    including event names, are written once to a string table and then
+    referenced by id; values that fit no fixed type are stored as JSON
+    text in the same table.
+    """
+
+    def __init__(self, path: Path, batch: int = DEFAULT_BATCH, append: bool = False) -> None:
+        super().__init__(path, batch=batch, append=append)
+        self._strings: dict[str, int] = {}
+        self._layouts: dict[tuple[str, tuple[tuple[str, str], ...]], tuple[int, struct.Struct]] = {}
+        # Every sink starts a segment with fresh tables, so appending to an
+        # existing log is safe.
+        self._chunks.append(BINARY_MAGIC)
+
+    def _encode(self, event: Event) -> bytes:
+        out: list[bytes] = []
+        fields = tuple((key, _field_type(value)) for key, value in event.payload.items())
+        layout = self._layouts.get((event.name, fields))
+        if layout is None:
+            layout = self._define_layout(event.name, fields, out)
+        layout_id, packer = layout
+        values = []
+        for (_, code), value in zip(fields, event.payload.values()):
+            if code == "s":
+                values.append(self._string_id(value, out))
+            elif code == "j":
+                values.append(self._string_id(json.dumps(value, separators=(",", ":")), out))
+            else:
+                values.append(value)
+        out.append(_HEADER.pack(_TAG_EVENT, layout_id))
+        out.append(packer.pack(*values))
+        return b"".join(out)
+
+    def _define_layout(
+        self,
+        name: str,
+        fields: tuple[tuple[str, str], ...],
+        out: list[bytes],
+    ) -> tuple[int, struct.Struct]:
+        name_id = self._string_id(name, out)
+        key_ids = [self._string_id(key, out) for key, _ in fields]
+        layout_id = len(self._layouts)
+        spec = "".join(code for _, code in fields).encode("ascii")
+        out.append(_HEADER.pack(_TAG_LAYOUT, layout_id))
+        out.append(struct.pack(f"<IH{len(fields)}I", name_id, len(fields), *key_ids))
+        out.append(spec)
+        layout = (layout_id, _packer(spec.decode("ascii")))
+        self._layouts[(name, fields)] = layout
+        return layout
+
+    def _string_id(self, text: str, out: list[bytes]) -> int:
+        string_id = self._strings.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[text] = string_id
+            data = text.encode("utf-8")
+            out.append(_HEADER.pack(_TAG_STRING, string_id))
+            out.append(struct.pack("<I", len(data)))
+            out.append(data)
+        return string_id
+
+
+def open_sink(path: Path, fmt: str = "ndjson", batch: int = DEFAULT_BATCH, append: bool = False) -> EventSink:
+    """Open an ``"ndjson"`` or ``"binary"`` sink at ``path``."""
+    if fmt == "ndjson":
+        return NdjsonSink(path, batch=batch, append=append)
+    if fmt == "binary":
+        return BinarySink(path, batch=batch, append=append)
+    raise ValueError(f"Unknown telemetry format: {fmt}")
+
+
+def read_events(path: Path) -> Iterator[Event]:
+    """Lazily iterate the events in a log written by either sink."""
+    with open(path, "rb") as handle:
+        if handle.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            yield from _read_binary(handle)
+            return
+        handle.seek(0)
+        for line in handle:
+            if line.strip():
+                record = json.loads(line)
+                yield Event(name=record["name"], payload=record["payload"])
+
+
+def _read_binary(handle: BinaryIO) -> Iterator[Event]:
+    strings: list[str] = []
+    layouts: list[tuple[str, list[str], str, struct.Struct]] = []
+    while True:
+        header = handle.read(_HEADER.size)
+        if not header:
+            return
+        if len(header) < _HEADER.size:
+            raise ValueError("Truncated telemetry log")
+        if header == BINARY_MAGIC:
+            # An appended segment restarts the string and layout tables.
+            strings = []
+            layouts = []
+            continue
+        tag, index = _HEADER.unpack(header)
+        if tag == _TAG_STRING:
+            (size,) = struct.unpack("<I", handle.read(4))
+            strings.append(handle.read(size).decode("utf-8"))
+        elif tag == _TAG_LAYOUT:
+            name_id, count = struct.unpack("<IH", handle.read(6))
+            key_ids = struct.unpack(f"<{count}I", handle.read(4 * count))
+            spec = handle.read(count).decode("ascii")
+            layouts.append((strings[name_id], [strings[key_id] for key_id in key_ids], spec, _packer(spec)))
+        elif tag == _TAG_EVENT:
+            name, keys, spec, packer = layouts[index]
+            raw = packer.unpack(handle.read(packer.size))
+            payload: dict[str, Any] = {}
+            for key, code, value in zip(keys, spec, raw):
+                if code == "s":
+                    value = strings[value]
+                elif code == "j":
+                    value = json.loads(strings[value])
+                payload[key] = value
+            yield Event(name=name, payload=payload)
+        else:
+            raise ValueError(f"Unknown telemetry record tag: {tag}")
+
+
+def _field_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "?"
+    if isinstance(value, int) and -(1 << 63) <= value < (1 << 63):
+        return "q"
+    if isinstance(value, float):
+        return "d"
+    if isinstance(value, str):
+        return "s"
+    return "j"
+
+
+def _packer(spec: str) -> struct.Struct:
+    return struct.Struct("<" + "".join(_FIELD_FORMATS[code] for code in spec))
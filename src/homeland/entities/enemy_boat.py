@@ -1,80 +1,454 @@
-"""Enemy boat entity and status effect logic."""
+"""Enemy boat entity, fleet storage and status effect logic."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from itertools import compress
+from typing import Any, Iterator
+import math
 
 
-@dataclass
-class EnemyBoat:
-    boat_id: str
-    enemy_type: str
-    max_hp: float
-    hp: float
-    speed: float
-    coin_reward: int
-    xp_reward: int
-    distance: float = 0.0
-    leaked: bool = False
-    destroyed: bool = False
-    burn_dps: float = 0.0
-    burn_duration_left: float = 0.0
-    slow_percent: float = 0.0
-    slow_duration_left: float = 0.0
+_FLOAT_COLUMNS = (
+    "max_hp",
+    "hp",
+    "speed",
+    "distance",
+    "burn_dps",
+    "burn_duration_left",
+    "slow_percent",
+    "slow_duration_left",
+)
+_INT_COLUMNS = ("coin_reward", "xp_reward")
+_FLAG_COLUMNS = ("leaked", "destroyed")
+_TEXT_COLUMNS = ("boat_id", "enemy_type")
+_COLUMNS = _TEXT_COLUMNS + _FLOAT_COLUMNS + _INT_COLUMNS + _FLAG_COLUMNS
+# Per-row bookkeeping owned by ``RangeTracker``: compacted with the boat
+# columns but not part of a boat's state, so never copied or checkpointed.
+_TRACKING_COLUMNS = ("range_zone", "range_edge")
+# One shared float, so tracking defaults cost no allocation per row.
+_NO_EDGE = -math.inf
+_TRACKING_DEFAULTS = (-1, _NO_EDGE)
 
-    def apply_damage(self, amount: float) -> bool:
-        if self.destroyed or self.leaked:
+
+def boat_label(boat_id: str | int) -> str:
+    """A boat's public id.
+
+    Game boats keep their integer spawn serial in the ``boat_id`` column and
+    only get the ``boat_0042`` form when read through a view or an event.
+    String ids, as tests and tools give directly, pass through unchanged.
+    """
+    return boat_id if isinstance(boat_id, str) else f"boat_{boat_id:04d}"
+
+
+class Fleet:
+    """Structure-of-arrays storage for every boat of a running map.
+
+    Each boat field lives in its own parallel column, so per-tick passes walk
+    flat columns and removals compact every column by a keep-mask instead of
+    rebuilding lists of objects. ``EnemyBoat`` views read and write a row.
+    ``boat_id`` holds whatever the spawner gave, an int serial or a string;
+    see ``boat_label``.
+    """
+
+    def __init__(self) -> None:
+        self.boat_id: list[str | int] = []
+        self.enemy_type: list[str] = []
+        self.max_hp: list[float] = []
+        self.hp: list[float] = []
+        self.speed: list[float] = []
+        self.distance: list[float] = []
+        self.burn_dps: list[float] = []
+        self.burn_duration_left: list[float] = []
+        self.slow_percent: list[float] = []
+        self.slow_duration_left: list[float] = []
+        self.coin_reward: list[int] = []
+        self.xp_reward: list[int] = []
+        self.leaked: list[bool] = []
+        self.destroyed: list[bool] = []
+        self.range_zone: list[int] = []
+        self.range_edge: list[float] = []
+        # Live views in spawn order; the list is owned by the fleet.
+        self.boats: list[EnemyBoat] = []
+
+    def __len__(self) -> int:
+        return len(self.boats)
+
+    def __iter__(self) -> Iterator[EnemyBoat]:
+        return iter(self.boats)
+
+    @classmethod
+    def adopt(cls, boats: list[EnemyBoat]) -> Fleet:
+        """Return a fleet holding ``boats`` in order.
+
+        A list that is already a fleet's own ``boats`` is used as is; any
+        other boats are moved into a new fleet and their views rebound.
+        """
+        if boats and boats is boats[0]._fleet.boats:
+            return boats[0]._fleet
+        fleet = cls()
+        for boat in boats:
+            fleet.spawn(**boat._fleet.row_values(boat._row))
+            fleet.boats[-1] = boat
+            boat._fleet = fleet
+            boat._row = len(fleet.boats) - 1
+        return fleet
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, list[Any]]) -> Fleet:
+        """Return a fleet owning copies of ``columns`` as produced by ``columns``."""
+        fleet = cls()
+        for name in _COLUMNS:
+            setattr(fleet, name, list(columns[name]))
+        for name, default in zip(_TRACKING_COLUMNS, _TRACKING_DEFAULTS):
+            setattr(fleet, name, [default] * len(fleet.boat_id))
+        views: list[EnemyBoat] = []
+        for row in range(len(fleet.boat_id)):
+            view = EnemyBoat.__new__(EnemyBoat)
+            view._fleet = fleet
+            view._row = row
+            views.append(view)
+        fleet.boats = views
+        return fleet
+
+    def copy(self) -> Fleet:
+        """Independent fleet with the same rows; views are not shared."""
+        return Fleet.from_columns({name: getattr(self, name) for name in _COLUMNS})
+
+    def columns(self) -> dict[str, list[Any]]:
+        """Copy every column, keyed by field name."""
+        return {name: list(getattr(self, name)) for name in _COLUMNS}
+
+    def spawn(
+        self,
+        boat_id: str | int,
+        enemy_type: str,
+        max_hp: float,
+        hp: float,
+        speed: float,
+        coin_reward: int,
+        xp_reward: int,
+        distance: float = 0.0,
+        leaked: bool = False,
+        destroyed: bool = False,
+        burn_dps: float = 0.0,
+        burn_duration_left: float = 0.0,
+        slow_percent: float = 0.0,
+        slow_duration_left: float = 0.0,
+    ) -> EnemyBoat:
+        self.boat_id.append(boat_id)
+        self.enemy_type.append(enemy_type)
+        self.max_hp.append(max_hp)
+        self.hp.append(hp)
+        self.speed.append(speed)
+        self.distance.append(distance)
+        self.burn_dps.append(burn_dps)
+        self.burn_duration_left.append(burn_duration_left)
+        self.slow_percent.append(slow_percent)
+        self.slow_duration_left.append(slow_duration_left)
+        self.coin_reward.append(coin_reward)
+        self.xp_reward.append(xp_reward)
+        self.leaked.append(leaked)
+        self.destroyed.append(destroyed)
+        self.range_zone.append(-1)
+        self.range_edge.append(_NO_EDGE)
+        view = EnemyBoat.__new__(EnemyBoat)
+        view._fleet = self
+        view._row = len(self.boats)
+        self.boats.append(view)
+        return view
+
+    def compact(self, keep: list[bool]) -> None:
+        """Drop every row whose ``keep`` entry is false, preserving order.
+
+        Dropped views move to one new fleet holding just the dropped rows,
+        so callers holding them still see each boat's final state.
+        """
+        if all(keep):
+            return
+        dropped = [row for row, kept in enumerate(keep) if not kept]
+        self._detach(dropped)
+        if len(dropped) * 8 < len(keep):
+            # A few removals: shift each column in place rather than rebuild.
+            columns = [getattr(self, name) for name in _COLUMNS + _TRACKING_COLUMNS]
+            columns.append(self.boats)
+            for row in reversed(dropped):
+                for column in columns:
+                    del column[row]
+        else:
+            for name in _COLUMNS + _TRACKING_COLUMNS:
+                setattr(self, name, list(compress(getattr(self, name), keep)))
+            self.boats = list(compress(self.boats, keep))
+        views = self.boats
+        for row in range(dropped[0], len(views)):
+            views[row]._row = row
+
+    def _detach(self, rows: list[int]) -> None:
+        """Rebind the views of ``rows`` to a fleet of their own, in the same order."""
+        archive = Fleet()
+        for name in _COLUMNS:
+            column = getattr(self, name)
+            setattr(archive, name, [column[row] for row in rows])
+        archive.range_zone = [-1] * len(rows)
+        archive.range_edge = [_NO_EDGE] * len(rows)
+        archive.boats = [self.boats[row] for row in rows]
+        for index, view in enumerate(archive.boats):
+            view._fleet = archive
+            view._row = index
+
+    def row_values(self, row: int) -> dict[str, Any]:
+        values: dict[str, Any] = {name: getattr(self, name)[row] for name in _TEXT_COLUMNS + _FLOAT_COLUMNS}
+        values.update({name: getattr(self, name)[row] for name in _INT_COLUMNS})
+        values.update({name: bool(getattr(self, name)[row]) for name in _FLAG_COLUMNS})
+        return values
+
+    def apply_damage(self, row: int, amount: float) -> bool:
+        if self.destroyed[row] or self.leaked[row]:
             return False
-        self.hp -= max(amount, 0.0)
-        if self.hp <= 0:
-            self.hp = 0
-            self.destroyed = True
+        hp = self.hp[row] - max(amount, 0.0)
+        if hp <= 0:
+            self.hp[row] = 0
+            self.destroyed[row] = True
             return True
+        self.hp[row] = hp
         return False
 
-    def apply_burn(self, dps: float, duration: float) -> None:
-        if self.destroyed or self.leaked:
+    def apply_burn(self, row: int, dps: float, duration: float) -> None:
+        if self.destroyed[row] or self.leaked[row]:
             return
         if dps <= 0 or duration <= 0:
             return
-        self.burn_dps = max(self.burn_dps, dps)
-        self.burn_duration_left = duration
+        self.burn_dps[row] = max(self.burn_dps[row], dps)
+        self.burn_duration_left[row] = duration
 
-    def apply_slow(self, slow_percent: float, duration: float) -> None:
-        if self.destroyed or self.leaked:
+    def apply_slow(self, row: int, slow_percent: float, duration: float) -> None:
+        if self.destroyed[row] or self.leaked[row]:
             return
         if slow_percent <= 0 or duration <= 0:
             return
-        if slow_percent > self.slow_percent:
-            self.slow_percent = slow_percent
-        self.slow_duration_left = max(self.slow_duration_left, duration)
+        if slow_percent > self.slow_percent[row]:
+            self.slow_percent[row] = slow_percent
+        self.slow_duration_left[row] = max(self.slow_duration_left[row], duration)
 
-    def tick_effects(self, dt: float) -> bool:
-        if self.destroyed or self.leaked:
+    def tick_effects(self, row: int, dt: float) -> bool:
+        if self.destroyed[row] or self.leaked[row]:
             return False
 
-        if self.burn_duration_left > 0:
-            killed = self.apply_damage(self.burn_dps * dt)
-            self.burn_duration_left = max(0.0, self.burn_duration_left - dt)
-            if self.burn_duration_left == 0:
-                self.burn_dps = 0.0
+        if self.burn_duration_left[row] > 0:
+            killed = self.apply_damage(row, self.burn_dps[row] * dt)
+            self.burn_duration_left[row] = max(0.0, self.burn_duration_left[row] - dt)
+            if self.burn_duration_left[row] == 0:
+                self.burn_dps[row] = 0.0
             if killed:
                 return True
 
-        if self.slow_duration_left > 0:
-            self.slow_duration_left = max(0.0, self.slow_duration_left - dt)
-            if self.slow_duration_left == 0:
-                self.slow_percent = 0.0
+        if self.slow_duration_left[row] > 0:
+            self.slow_duration_left[row] = max(0.0, self.slow_duration_left[row] - dt)
+            if self.slow_duration_left[row] == 0:
+                self.slow_percent[row] = 0.0
 
         return False
 
-    def move(self, dt: float, path_length: float) -> bool:
-        if self.destroyed or self.leaked:
+    def move(self, row: int, dt: float, path_length: float) -> bool:
+        if self.destroyed[row] or self.leaked[row]:
             return False
 
-        speed_multiplier = 1.0 - min(self.slow_percent / 100.0, 0.8)
-        self.distance += self.speed * speed_multiplier * dt
-        if self.distance >= path_length:
-            self.leaked = True
+        speed_multiplier = 1.0 - min(self.slow_percent[row] / 100.0, 0.8)
+        self.distance[row] += self.speed[row] * speed_multiplier * dt
+        if self.distance[row] >= path_length:
+            self.leaked[row] = True
             return True
         return False
+
+    def step_effects(self, dt: float) -> list[bool]:
+        """Tick burn and slow for every row at once; return the kill mask.
+
+        Matches ``tick_effects`` row by row, including the rule that a boat
+        killed by burn keeps its slow timer untouched this tick. Timers never
+        go negative, so only rows with a nonzero timer are visited, burns
+        first so the slow pass can skip the boats they killed.
+        """
+        count = len(self.boats)
+        killed = [False] * count
+        hp = self.hp
+        burn_left = self.burn_duration_left
+        burn_dps = self.burn_dps
+        slow_left = self.slow_duration_left
+        slow_percent = self.slow_percent
+        destroyed = self.destroyed
+        leaked = self.leaked
+
+        for row in compress(range(count), burn_left):
+            if destroyed[row] or leaked[row]:
+                continue
+            remaining = hp[row] - max(burn_dps[row] * dt, 0.0)
+            # ``max(0.0, left - dt)``, with the expiry handled in the same test.
+            burn = burn_left[row] - dt
+            if burn > 0:
+                burn_left[row] = burn
+            else:
+                burn_left[row] = 0.0
+                burn_dps[row] = 0.0
+            if remaining <= 0:
+                hp[row] = 0
+                destroyed[row] = True
+                killed[row] = True
+            else:
+                hp[row] = remaining
+
+        for row in compress(range(count), slow_left):
+            if destroyed[row] or leaked[row]:
+                continue
+            slow = slow_left[row] - dt
+            if slow > 0:
+                slow_left[row] = slow
+            else:
+                slow_left[row] = 0.0
+                slow_percent[row] = 0.0
+
+        return killed
+
+    def step_movement(self, dt: float, path_length: float) -> list[bool]:
+        """Advance every row along the path at once; return the leak mask.
+
+        Uses the same slow clamp and arithmetic order as ``move`` so
+        distances match the per-boat path bit for bit.
+        """
+        destroyed = self.destroyed
+        leaked = self.leaked
+        if any(destroyed) or any(leaked):
+            stopped = [bool(dead or gone) for dead, gone in zip(destroyed, leaked)]
+            moved = [
+                distance if halt else distance + speed * (1.0 - min(slow / 100.0, 0.8)) * dt
+                for distance, speed, slow, halt in zip(self.distance, self.speed, self.slow_percent, stopped)
+            ]
+            self.distance = moved
+            leaks = [not halt and distance >= path_length for distance, halt in zip(moved, stopped)]
+        else:
+            # An unslowed multiplier is exactly 1.0, so ``speed * dt`` is bit-identical.
+            moved = [
+                distance + speed * dt if not slow else distance + speed * (1.0 - min(slow / 100.0, 0.8)) * dt
+                for distance, speed, slow in zip(self.distance, self.speed, self.slow_percent)
+            ]
+            self.distance = moved
+            if not moved or max(moved) < path_length:
+                return [False] * len(moved)
+            leaks = [distance >= path_length for distance in moved]
+        for row in compress(range(len(leaks)), leaks):
+            leaked[row] = True
+        return leaks
+
+
+class _Column:
+    """Descriptor forwarding a boat attribute to its fleet column."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, boat: EnemyBoat | None, owner: type | None = None) -> Any:
+        if boat is None:
+            return self
+        return getattr(boat._fleet, self.name)[boat._row]
+
+    def __set__(self, boat: EnemyBoat, value: Any) -> None:
+        getattr(boat._fleet, self.name)[boat._row] = value
+
+
+class _BoatId(_Column):
+    def __get__(self, boat: EnemyBoat | None, owner: type | None = None) -> Any:
+        if boat is None:
+            return self
+        return boat_label(boat._fleet.boat_id[boat._row])
+
+
+class _Flag(_Column):
+    def __get__(self, boat: EnemyBoat | None, owner: type | None = None) -> Any:
+        if boat is None:
+            return self
+        return bool(getattr(boat._fleet, self.name)[boat._row])
+
+
+class EnemyBoat:
+    """Thin view over one ``Fleet`` row.
+
+    Constructing a boat directly gives it a private single-row fleet, so the
+    entity API works the same inside and outside a running game. Views are
+    slotted: a boat's state lives in the fleet, a view only holds its place.
+    """
+
+    __slots__ = ("_fleet", "_row")
+
+    boat_id = _BoatId()
+    enemy_type = _Column()
+    max_hp = _Column()
+    hp = _Column()
+    speed = _Column()
+    coin_reward = _Column()
+    xp_reward = _Column()
+    distance = _Column()
+    leaked = _Flag()
+    destroyed = _Flag()
+    burn_dps = _Column()
+    burn_duration_left = _Column()
+    slow_percent = _Column()
+    slow_duration_left = _Column()
+
+    _fleet: Fleet
+    _row: int
+
+    def __init__(
+        self,
+        boat_id: str | int,
+        enemy_type: str,
+        max_hp: float,
+        hp: float,
+        speed: float,
+        coin_reward: int,
+        xp_reward: int,
+        distance: float = 0.0,
+        leaked: bool = False,
+        destroyed: bool = False,
+        burn_dps: float = 0.0,
+        burn_duration_left: float = 0.0,
+        slow_percent: float = 0.0,
+        slow_duration_left: float = 0.0,
+    ) -> None:
+        fleet = Fleet()
+        fleet.spawn(
+            boat_id,
+            enemy_type,
+            max_hp,
+            hp,
+            speed,
+            coin_reward,
+            xp_reward,
+            distance,
+            leaked,
+            destroyed,
+            burn_dps,
+            burn_duration_left,
+            slow_percent,
+            slow_duration_left,
+        )
+        fleet.boats[0] = self
+        self._fleet = fleet
+        self._row = 0
+
+    def __repr__(self) -> str:
+        values = self._fleet.row_values(self._row)
+        values["boat_id"] = boat_label(values["boat_id"])
+        fields = ", ".join(f"{name}={value!r}" for name, value in values.items())
+        return f"EnemyBoat({fields})"
+
+    def apply_damage(self, amount: float) -> bool:
+        return self._fleet.apply_damage(self._row, amount)
+
+    def apply_burn(self, dps: float, duration: float) -> None:
+        self._fleet.apply_burn(self._row, dps, duration)
+
+    def apply_slow(self, slow_percent: float, duration: float) -> None:
+        self._fleet.apply_slow(self._row, slow_percent, duration)
+
+    def tick_effects(self, dt: float) -> bool:
+        return self._fleet.tick_effects(self._row, dt)
+
+    def move(self, dt: float, path_length: float) -> bool:
+        return self._fleet.move(self._row, dt, path_length)
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import sys
 
 
-@dataclass
+# ``slots=`` needs Python 3.10; older interpreters get a plain dataclass.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Tower:
     tower_instance_id: str
     tower_id: str
@@ -14,6 +19,9 @@ class Tower:
     y: float
     level: int = 1
     cooldown_left: float = 0.0
+    # ``TowerStats`` slot for ``level``, set on build and upgrade or on first
+    # attack; -1 until then. A cache, so checkpoints leave it out.
+    stats_slot: int = field(default=-1, init=False, repr=False, compare=False)
 
     def tick_cooldown(self, dt: float) -> None:
         self.cooldown_left = max(0.0, self.cooldown_left - dt)
@@ -2,37 +2,94 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass
+from itertools import compress, repeat
+from operator import sub, truediv
 from pathlib import Path
+from typing import Any
+import math
 
-from homeland.config import GameContent, load_game_content
-from homeland.core.event_bus import EventBus
+from homeland.config import DEFAULT_MAP_ID, GameContent, load_game_content
+from homeland.core.event_bus import DEFAULT_HISTORY, EventBus
 from homeland.core.game_state import GameState
-from homeland.entities.enemy_boat import EnemyBoat
+from homeland.core.profiler import NULL_TIMER, NullTimer, PhaseTimer, TickProfiler
+from homeland.entities.enemy_boat import EnemyBoat, Fleet, boat_label
+from homeland.entities.tower import Tower
 from homeland.systems.combat_system import CombatSystem
+from homeland.systems.coverage import CoverageIndex
 from homeland.systems.economy_system import EconomySystem
-from homeland.systems.pathing import Path
+from homeland.systems.ledger import Ledger
+from homeland.systems.pathing import Path, PositionCache
 from homeland.systems.placement_system import PlacementSystem
 from homeland.systems.progression_system import ProgressionSystem
+from homeland.systems.range_tracker import RangeChange
 from homeland.systems.wave_system import WaveSystem
 
 
+# Floor on an event-driven step, so rounding at an event boundary cannot
+# stall the clock.
+_MIN_EVENT_STEP = 1e-9
+
+_positive = (0.0).__lt__
+
+
+def _tower_state(tower: Tower) -> dict[str, Any]:
+    """``tower`` as checkpoint data; its cached ``stats_slot`` is left to be recomputed."""
+    state = asdict(tower)
+    del state["stats_slot"]
+    return state
+
+
+@dataclass
+class GameCheckpoint:
+    """Every piece of mutable ``HomelandGame`` state, as plain data.
+
+    Content, paths and coverage are rebuilt from the game's own content on
+    restore, and event history is not part of a checkpoint.
+    """
+
+    state: str
+    coins: int
+    xp: int
+    boat_counter: int
+    tower_counter: int
+    towers: list[dict[str, Any]]
+    wave_index: int
+    spawned: int | None
+    spawn_cooldown: float
+    fleet: dict[str, list[Any]]
+
+
 class HomelandGame:
     """Engine-agnostic game model for tower defense prototype logic."""
 
-    def __init__(self, data_dir: Path | None = None, content: GameContent | None = None) -> None:
-        self.content = content or load_game_content(base_data_dir=data_dir)
-        self.events = EventBus()
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        content: GameContent | None = None,
+        event_history: int | None = DEFAULT_HISTORY,
+        map_id: str = DEFAULT_MAP_ID,
+        entity_events: bool = True,
+    ) -> None:
+        self.content = content or load_game_content(base_data_dir=data_dir, map_id=map_id)
+        # ``event_history=0`` turns telemetry off unless something subscribes.
+        self.events = EventBus(history=event_history)
+        # Off leaves a tick's kills and leaks to its one ``ledger_settled`` event.
+        self.entity_events = entity_events
         self.state = GameState.BOOT
 
         self.path = Path(self.content.map_config.path_waypoints)
         self.economy = EconomySystem(coins=self.content.map_config.starting_coins)
         self.progression = ProgressionSystem(xp=self.content.map_config.starting_xp)
-        self.placement = PlacementSystem.from_slots(self.content.map_config.build_slots)
+        self.ledger = Ledger()
+        self.coverage = CoverageIndex(self.path, self.content.tower_configs)
+        self.placement = PlacementSystem.from_slots(self.content.map_config.build_slots, coverage=self.coverage)
         self.wave_system = WaveSystem(self.content.waves)
-        self.combat = CombatSystem(self.content.tower_configs)
+        self.combat = CombatSystem(self.content.tower_configs, coverage=self.coverage)
 
-        self.active_boats: list[EnemyBoat] = []
+        self.fleet = Fleet()
         self._boat_counter = 0
+        self.profiler: TickProfiler | None = None
 
         self.state = GameState.MAP_LOAD
         self.events.emit("map_load", map_id=self.content.map_config.map_id)
@@ -52,6 +109,7 @@ class HomelandGame:
             raise ValueError("Not enough coins")
 
         tower = self.placement.place_tower(slot_id, tower_id)
+        tower.stats_slot = self.combat.stats.slot(tower)
         self.events.emit("coins_changed", delta=-cost, reason="tower_build", coins=self.economy.coins)
         self.events.emit(
             "tower_built",
@@ -80,6 +138,8 @@ class HomelandGame:
             raise ValueError("Not enough coins")
 
         tower.level = next_level
+        tower.stats_slot = self.combat.stats.slot(tower)
+        self.coverage.rebuild(tower)
         self.events.emit("coins_changed", delta=-upgrade_cost, reason="tower_upgrade", coins=self.economy.coins)
         self.events.emit(
             "tower_upgraded",
@@ -107,69 +167,272 @@ class HomelandGame:
     def tick(self, dt: float) -> None:
         if self.state != GameState.WAVE_RUNNING:
             return
-
+        timer = self._phase_timer()
+        fleet = self.fleet
+        published = self.events.published
+        checks = self.combat.distance_checks
+        timer.count("ticks", 1)
+        timer.count("boats_alive", len(fleet))
+
+        spawned = 0
         for enemy_type in self.wave_system.tick(dt):
             self._spawn_boat(enemy_type)
+            spawned += 1
+        timer.count("spawned", spawned)
+        timer.peak("peak_boats", len(fleet))
+        timer.lap("spawn")
 
-        combat_outcome = self.combat.tick(dt, self.placement.all_towers(), self.active_boats, self.path)
+        combat_outcome = self.combat.tick(
+            dt, self.placement.all_towers(), fleet, self.path, report_ranges=self._wants_range_events()
+        )
 
-        if combat_outcome.attacks_fired:
+        if combat_outcome.range_changes:
+            self._emit_range_changes(combat_outcome.range_changes)
+        if combat_outcome.attacks_fired and self.events.wants("combat_tick"):
             self.events.emit("combat_tick", attacks_fired=combat_outcome.attacks_fired)
+        timer.count("attacks_fired", combat_outcome.attacks_fired)
+        timer.count("distance_checks", self.combat.distance_checks - checks)
+        timer.lap("combat")
+
+        if combat_outcome.killed_boats:
+            timer.count("kills", len(combat_outcome.killed_boats))
+            self._settle_kills(fleet.destroyed[:])
+            timer.lap("kills")
+
+        leaked_mask = fleet.step_movement(dt, self.path.length)
+        if any(leaked_mask):
+            timer.count("leaks", sum(leaked_mask))
+            self._settle_leaks(leaked_mask)
+        timer.lap("movement")
+
+        self._check_outcome()
+        timer.lap("outcome")
+        timer.count("events_emitted", self.events.published - published)
+
+    def enable_profiling(self) -> TickProfiler:
+        """Start recording per-phase tick time and counters; returns the profiler.
+
+        Profiling stays on, accumulating, until ``disable_profiling``. The
+        report is also included in ``snapshot`` under ``"profile"``.
+        """
+        if self.profiler is None:
+            self.profiler = TickProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> TickProfiler | None:
+        """Stop profiling and return the profiler with what it recorded."""
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def _phase_timer(self) -> PhaseTimer | NullTimer:
+        return NULL_TIMER if self.profiler is None else PhaseTimer(self.profiler)
+
+    def run_until_event(self, max_time: float = math.inf) -> float:
+        """Jump to the next moment something can happen and resolve it.
+
+        Boats move in closed form up to the earliest of: the next spawn, a
+        tower cooldown running out, a boat entering a ready tower's range, a
+        leak, a burn kill and a burn or slow running out (capped at
+        ``max_time``). Spawns, attacks and outcomes are then resolved at
+        that instant. Returns the game time advanced.
+        """
+        if self.state != GameState.WAVE_RUNNING:
+            return 0.0
+        step = max(min(self.time_to_next_event(), max_time), 0.0)
+        timer = self._phase_timer()
+        published = self.events.published
+        self._drift(step)
+        timer.lap("drift")
+        timer.count("events_emitted", self.events.published - published)
+        if self.state == GameState.WAVE_RUNNING:
+            self.tick(0.0)
+        return step
+
+    def advance(self, max_time: float = math.inf) -> float:
+        """Run event to event until the wave ends or ``max_time`` has passed.
+
+        Event-driven stepping fires towers the moment they are ready rather
+        than on the next fixed tick, and every shot that lands earlier
+        compounds, so results differ from ``tick`` runs and the two must not
+        be compared: on the default map the baseline plan ends with 8145
+        coins and the next map unlocked here, but 6405 coins and still
+        locked on 0.1 s ticks. Returns the game time advanced.
+        """
+        elapsed = 0.0
+        while self.state == GameState.WAVE_RUNNING and elapsed < max_time:
+            elapsed += self.run_until_event(max_time - elapsed)
+        return elapsed
+
+    def time_to_next_event(self) -> float:
+        """Seconds until the next spawn, cooldown, range entry, leak, burn kill or effect expiry.
+
+        Range entries only count for towers ready to fire. The coverage index
+        keeps an ``EntryTable`` per set of ready towers, which repeats from
+        event to event, so each boat costs one bisect however many towers
+        are placed.
+        """
+        if self.state != GameState.WAVE_RUNNING:
+            return math.inf
+        soonest = self.wave_system.time_to_next_spawn()
 
-        killed_ids = {boat.boat_id for boat in combat_outcome.killed_boats}
-        if killed_ids:
-            survivors: list[EnemyBoat] = []
-            for boat in self.active_boats:
-                if boat.boat_id in killed_ids:
-                    self.economy.reward(boat.coin_reward)
-                    self.progression.add_xp(boat.xp_reward)
-                    self.events.emit("enemy_killed", boat_id=boat.boat_id, enemy_type=boat.enemy_type)
-                    self.events.emit(
-                        "coins_changed",
-                        delta=boat.coin_reward,
-                        reason="enemy_kill",
-                        coins=self.economy.coins,
-                    )
-                    self.events.emit(
-                        "xp_changed",
-                        delta=boat.xp_reward,
-                        reason="enemy_kill",
-                        xp=self.progression.xp,
-                    )
-                    continue
-                survivors.append(boat)
-            self.active_boats = survivors
-
-        survivors_after_move: list[EnemyBoat] = []
-        for boat in self.active_boats:
-            leaked = boat.move(dt, self.path.length)
-            if leaked:
-                self.economy.penalize(self.content.map_config.leak_penalty.coins)
-                self.progression.remove_xp(self.content.map_config.leak_penalty.xp)
-                self.events.emit("enemy_leaked", boat_id=boat.boat_id, enemy_type=boat.enemy_type)
-                self.events.emit(
-                    "coins_changed",
-                    delta=-self.content.map_config.leak_penalty.coins,
-                    reason="enemy_leak",
-                    coins=self.economy.coins,
-                )
-                self.events.emit(
-                    "xp_changed",
-                    delta=-self.content.map_config.leak_penalty.xp,
-                    reason="enemy_leak",
-                    xp=self.progression.xp,
-                )
+        ready: list[Tower] = []
+        for tower in self.placement.all_towers():
+            if tower.cooldown_left > 0:
+                soonest = min(soonest, tower.cooldown_left)
             else:
-                survivors_after_move.append(boat)
+                ready.append(tower)
+
+        fleet = self.fleet
+        if not len(fleet):
+            return max(soonest, _MIN_EVENT_STEP)
+        burning = zip(fleet.hp, fleet.burn_dps, fleet.burn_duration_left)
+        soonest = min(
+            soonest,
+            min(filter(_positive, fleet.burn_duration_left), default=math.inf),
+            min((hp / dps for hp, dps, left in burning if left > 0 and dps > 0), default=math.inf),
+            min(filter(_positive, fleet.slow_duration_left), default=math.inf),
+        )
 
-        self.active_boats = survivors_after_move
+        distances = fleet.distance
+        speeds = fleet.speed
+        if any(fleet.slow_percent):
+            speeds = [
+                speed if not slow else speed * (1.0 - min(slow / 100.0, 0.8))
+                for speed, slow in zip(speeds, fleet.slow_percent)
+            ]
+        if min(speeds) <= 0:
+            moving = [(distance, speed) for distance, speed in zip(distances, speeds) if speed > 0]
+            distances = [distance for distance, _ in moving]
+            speeds = [speed for _, speed in moving]
+        leaks = map(truediv, map(sub, repeat(self.path.length), distances), speeds)
+        soonest = min(soonest, min(leaks, default=math.inf))
+        if ready:
+            # Targets sit just past the fringe, so a boat is in range on arrival.
+            targets = self.coverage.entry_table(ready).targets_for(distances)
+            soonest = min(soonest, min(map(truediv, map(sub, targets, distances), speeds), default=math.inf))
+        return max(soonest, _MIN_EVENT_STEP)
+
+    def _drift(self, dt: float) -> None:
+        """Let ``dt`` seconds pass with no attacks: effects, cooldowns, movement and spawns."""
+        fleet = self.fleet
+        if any(fleet.step_effects(dt)):
+            self._settle_kills(fleet.destroyed[:])
+        for tower in self.placement.all_towers():
+            tower.tick_cooldown(dt)
+        leaked_mask = fleet.step_movement(dt, self.path.length)
+        if any(leaked_mask):
+            self._settle_leaks(leaked_mask)
+        for enemy_type in self.wave_system.tick(dt):
+            self._spawn_boat(enemy_type)
+        self._check_outcome()
+
+    def boats_in_range(self, slot_id: str) -> list[EnemyBoat]:
+        """Live boats the tower at ``slot_id`` can hit, furthest along the path first."""
+        tower = self.placement.get_tower(slot_id)
+        if tower is None:
+            raise ValueError(f"No tower at slot: {slot_id}")
+        ranges = self.combat.ranges
+        assert ranges is not None, "game combat always has coverage"
+        # Crossings found here are emitted now rather than lost to the next tick.
+        changes = ranges.update(self.fleet, self.placement.all_towers(), report=self._wants_range_events())
+        if changes:
+            self._emit_range_changes(changes)
+        return ranges.boats_in_range(tower, self.fleet, PositionCache(self.path, self.fleet.distance))
+
+    def _wants_range_events(self) -> bool:
+        # Range crossings are frequent; they go to subscribers only, never
+        # into history alone, so a default game does not pay to track them.
+        events = self.events
+        return events.has_listeners("boat_entered_range") or events.has_listeners("boat_left_range")
+
+    def _emit_range_changes(self, changes: list[RangeChange]) -> None:
+        """Emit ``boat_entered_range`` and ``boat_left_range`` for each crossing.
+
+        Crossings are found just before a tick's towers fire, so they cover
+        movement since the last check and this tick's spawns.
+        """
+        events = self.events
+        for tower_instance_id, boat, entered in changes:
+            events.emit(
+                "boat_entered_range" if entered else "boat_left_range",
+                tower_instance_id=tower_instance_id,
+                boat_id=boat.boat_id,
+            )
+
+    def _settle_kills(self, killed_mask: list[bool]) -> None:
+        """Credit the ledger with every killed row's rewards, then drop the rows."""
+        fleet = self.fleet
+        rows = list(compress(range(len(killed_mask)), killed_mask))
+        coin_rewards = [fleet.coin_reward[row] for row in rows]
+        xp_rewards = [fleet.xp_reward[row] for row in rows]
+        if self._wants_entity_events("enemy_killed"):
+            self._emit_entity_events("enemy_killed", "enemy_kill", rows, coin_rewards, xp_rewards)
+        self.ledger.credit(sum(coin_rewards), sum(xp_rewards), kills=len(rows))
+        fleet.compact([not killed for killed in killed_mask])
+
+    def _settle_leaks(self, leaked_mask: list[bool]) -> None:
+        """Debit the ledger with the leak penalty for every leaked row, then drop the rows."""
+        penalty = self.content.map_config.leak_penalty
+        rows = list(compress(range(len(leaked_mask)), leaked_mask))
+        if self._wants_entity_events("enemy_leaked"):
+            coin_deltas = [-penalty.coins] * len(rows)
+            xp_deltas = [-penalty.xp] * len(rows)
+            self._emit_entity_events("enemy_leaked", "enemy_leak", rows, coin_deltas, xp_deltas)
+        self.ledger.debit(penalty.coins * len(rows), penalty.xp * len(rows), leaks=len(rows))
+        self.fleet.compact([not leaked for leaked in leaked_mask])
+
+    def _wants_entity_events(self, name: str) -> bool:
+        events = self.events
+        return self.entity_events and (
+            events.wants(name) or events.wants("coins_changed") or events.wants("xp_changed")
+        )
+
+    def _emit_entity_events(
+        self,
+        name: str,
+        reason: str,
+        rows: list[int],
+        coin_deltas: list[int],
+        xp_deltas: list[int],
+    ) -> None:
+        """Emit ``name``, ``coins_changed`` and ``xp_changed`` per boat, before the batch reaches the ledger.
+
+        Balances run on from the ledger's projection, as if each boat settled alone.
+        """
+        fleet = self.fleet
+        events = self.events
+        coins, xp = self.ledger.project(self.economy.coins, self.progression.xp)
+        for row, coin_delta, xp_delta in zip(rows, coin_deltas, xp_deltas):
+            coins += coin_delta
+            xp = max(0, xp + xp_delta)
+            if events.wants(name):
+                events.emit(name, boat_id=boat_label(fleet.boat_id[row]), enemy_type=fleet.enemy_type[row])
+            if events.wants("coins_changed"):
+                events.emit("coins_changed", delta=coin_delta, reason=reason, coins=coins)
+            if events.wants("xp_changed"):
+                events.emit("xp_changed", delta=xp_delta, reason=reason, xp=xp)
+
+    def _settle_ledger(self) -> None:
+        """Apply the tick's coin and XP changes and emit ``ledger_settled`` for them."""
+        if not self.ledger.pending:
+            return
+        payload = self.ledger.settle(self.economy, self.progression)
+        if self.events.wants("ledger_settled"):
+            self.events.emit("ledger_settled", **payload)
+
+    def _check_outcome(self) -> None:
+        if self.state != GameState.WAVE_RUNNING:
+            return
+
+        # The outcome depends on the balance, so this tick's changes land first.
+        self._settle_ledger()
 
         if self.economy.coins < 0:
             self.state = GameState.MAP_RESULT
             self.events.emit("map_result", victory=False, unlocked_next_map=False)
             return
 
-        if self.wave_system.is_wave_complete(active_boats=len(self.active_boats)):
+        if self.wave_system.is_wave_complete(active_boats=len(self.fleet)):
             self.state = GameState.WAVE_RESULT
             self.events.emit("wave_complete", wave_id=self.wave_system.current_wave_number)
             self.wave_system.finish_wave()
@@ -196,11 +459,68 @@ class HomelandGame:
                 self.state = GameState.MAP_RESULT
                 self.events.emit("map_result", victory=True, unlocked_next_map=unlocked)
 
+    def fork(self, event_history: int | None = DEFAULT_HISTORY) -> HomelandGame:
+        """Independent copy of this game for what-if runs.
+
+        Content, path and wave configs are shared; economy, progression,
+        towers, the wave runtime and boats are copied. The fork starts with
+        an empty event bus of its own, so no event crosses between games.
+        """
+        game = HomelandGame.__new__(HomelandGame)
+        game.content = self.content
+        game.events = EventBus(history=event_history)
+        game.entity_events = self.entity_events
+        game.state = self.state
+        game.path = self.path
+        game.economy = EconomySystem(coins=self.economy.coins)
+        game.progression = ProgressionSystem(xp=self.progression.xp)
+        game.ledger = Ledger()
+        game.coverage = self.coverage.fork()
+        game.placement = self.placement.fork(coverage=game.coverage)
+        game.wave_system = self.wave_system.fork()
+        game.combat = CombatSystem(
+            self.content.tower_configs, coverage=game.coverage, stats=self.combat.stats, effects=self.combat.effects
+        )
+        game.fleet = self.fleet.copy()
+        game._boat_counter = self._boat_counter
+        game.profiler = None
+        return game
+
+    def checkpoint(self) -> GameCheckpoint:
+        wave_index, spawned, spawn_cooldown = self.wave_system.save()
+        return GameCheckpoint(
+            state=self.state.value,
+            coins=self.economy.coins,
+            xp=self.progression.xp,
+            boat_counter=self._boat_counter,
+            tower_counter=self.placement.tower_counter,
+            towers=[_tower_state(tower) for tower in self.placement.all_towers()],
+            wave_index=wave_index,
+            spawned=spawned,
+            spawn_cooldown=spawn_cooldown,
+            fleet=self.fleet.columns(),
+        )
+
+    def restore(self, checkpoint: GameCheckpoint) -> None:
+        """Return to ``checkpoint``; events already emitted are left alone."""
+        self.state = GameState(checkpoint.state)
+        self.economy.coins = checkpoint.coins
+        self.progression.xp = checkpoint.xp
+        self._boat_counter = checkpoint.boat_counter
+        self.placement.restore([Tower(**tower) for tower in checkpoint.towers], checkpoint.tower_counter)
+        self.wave_system.restore(checkpoint.wave_index, checkpoint.spawned, checkpoint.spawn_cooldown)
+        self.fleet = Fleet.from_columns(checkpoint.fleet)
+
+    @property
+    def active_boats(self) -> list[EnemyBoat]:
+        return self.fleet.boats
+
     def boats_remaining_current_wave(self) -> int:
-        return len(self.active_boats) + self.wave_system.boats_remaining_to_spawn()
+        return len(self.fleet) + self.wave_system.boats_remaining_to_spawn()
 
-    def snapshot(self) -> dict[str, int | str | bool]:
-        return {
+    def snapshot(self) -> dict[str, Any]:
+        """Summary of the run so far; includes ``"profile"`` while profiling."""
+        snapshot: dict[str, Any] = {
             "state": self.state.value,
             "coins": self.economy.coins,
             "xp": self.progression.xp,
@@ -210,12 +530,16 @@ class HomelandGame:
             "towers_built": len(self.placement.all_towers()),
             "next_map_unlocked": self.progression.has_unlock(self.content.map_config.unlock_requirement.min_xp),
         }
+        if self.profiler is not None:
+            snapshot["profile"] = self.profiler.report()
+        return snapshot
 
     def _spawn_boat(self, enemy_type: str) -> None:
         enemy_cfg = self.content.enemy_configs[enemy_type]
         self._boat_counter += 1
-        boat = EnemyBoat(
-            boat_id=f"boat_{self._boat_counter:04d}",
+        # The serial is the id; ``boat_label`` formats it for views and events.
+        boat = self.fleet.spawn(
+            boat_id=self._boat_counter,
             enemy_type=enemy_cfg.enemy_type,
             max_hp=enemy_cfg.hp,
             hp=enemy_cfg.hp,
@@ -224,5 +548,5 @@ class HomelandGame:
             xp_reward=enemy_cfg.xp_reward,
             distance=0.0,
         )
-        self.active_boats.append(boat)
-        self.events.emit("enemy_spawned", boat_id=boat.boat_id, enemy_type=boat.enemy_type)
+        if self.events.wants("enemy_spawned"):
+            self.events.emit("enemy_spawned", boat_id=boat.boat_id, enemy_type=boat.enemy_type)
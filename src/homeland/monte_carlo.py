@@ -0,0 +1,179 @@
+"""Multi-process Monte Carlo runs of one map under a build policy."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+import os
+import random
+
+from homeland.config import DEFAULT_MAP_ID, GameContent, load_game_content
+from homeland.core.event_bus import Event
+from homeland.core.telemetry import EventSink, open_sink
+from homeland.game import HomelandGame
+from homeland.policy import play_map, resolve_policy
+
+
+PERCENTILES = (10, 50, 90)
+
+
+@dataclass
+class RunResult:
+    run: int
+    seed: int
+    cleared: bool
+    coins: int
+    xp: int
+    leaks: int
+    waves_reached: int
+
+
+TRACE_SUFFIXES = {"ndjson": "ndjson", "binary": "hlog"}
+
+# Content and trace sink opened once per worker process by ``_init_worker``.
+_worker_content: GameContent | None = None
+_worker_sink: EventSink | None = None
+
+
+def run_seed(base_seed: int, run: int) -> int:
+    """Seed for run ``run``; the same base seed always replays the same runs."""
+    return base_seed + run
+
+
+def play_run(
+    content: GameContent,
+    policy: str,
+    run: int,
+    seed: int,
+    dt: float,
+    event_driven: bool = False,
+    sink: EventSink | None = None,
+) -> RunResult:
+    rng = random.Random(seed)
+    plan = resolve_policy(policy)(content, rng)
+    # Per-boat events only matter to a trace; leaks are counted from the ledger.
+    game = HomelandGame(content=content, event_history=0, entity_events=sink is not None)
+    settled: list[Event] = []
+    game.events.subscribe("ledger_settled", settled.append)
+    if sink is not None:
+        sink.attach(game.events)
+        game.events.emit("run_start", run=run, seed=seed, policy=policy)
+    summary = play_map(game, plan, dt=dt, event_driven=event_driven)
+    if sink is not None:
+        # One write per run keeps a sweep's trace I/O light.
+        sink.flush()
+    coins = int(summary["coins"])
+    return RunResult(
+        run=run,
+        seed=seed,
+        cleared=coins >= 0,
+        coins=coins,
+        xp=int(summary["xp"]),
+        leaks=sum(event.payload["leaks"] for event in settled),
+        waves_reached=int(summary["current_wave"]),
+    )
+
+
+def trace_path(trace_dir: Path, trace_format: str) -> Path:
+    """This process's trace file; each worker streams to its own."""
+    return Path(trace_dir) / f"trace-{os.getpid()}.{TRACE_SUFFIXES[trace_format]}"
+
+
+def _init_worker(data_dir: Path | None, map_id: str, trace_dir: Path | None, trace_format: str) -> None:
+    global _worker_content, _worker_sink
+    _worker_content = load_game_content(base_data_dir=data_dir, map_id=map_id)
+    if trace_dir is not None:
+        _worker_sink = open_sink(trace_path(trace_dir, trace_format), trace_format, append=True)
+
+
+def _run_job(job: tuple[str, int, int, float, bool]) -> RunResult:
+    assert _worker_content is not None, "worker content not loaded"
+    return play_run(_worker_content, *job, sink=_worker_sink)
+
+
+def run_monte_carlo(
+    runs: int,
+    policy: str = "baseline",
+    seed: int = 0,
+    workers: int | None = None,
+    dt: float = 0.1,
+    data_dir: Path | None = None,
+    event_driven: bool = False,
+    trace_dir: Path | None = None,
+    trace_format: str = "ndjson",
+    map_id: str = DEFAULT_MAP_ID,
+) -> list[RunResult]:
+    """Play ``runs`` games and return their results in run order.
+
+    ``policy`` is a registered policy name or ``package.module:function``,
+    resolved inside each worker. Results do not depend on ``workers``.
+    With ``trace_dir`` set, every process streams its runs' events to its
+    own file there, each run starting with a ``run_start`` event.
+    """
+    if runs < 0:
+        raise ValueError("runs must be non-negative")
+    if trace_format not in TRACE_SUFFIXES:
+        raise ValueError(f"Unknown telemetry format: {trace_format}")
+    resolve_policy(policy)
+    if trace_dir is not None:
+        Path(trace_dir).mkdir(parents=True, exist_ok=True)
+    jobs = [(policy, run, run_seed(seed, run), dt, event_driven) for run in range(runs)]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or runs <= 1:
+        content = load_game_content(base_data_dir=data_dir, map_id=map_id)
+        if trace_dir is None:
+            return [play_run(content, *job) for job in jobs]
+        with open_sink(trace_path(trace_dir, trace_format), trace_format, append=True) as sink:
+            return [play_run(content, *job, sink=sink) for job in jobs]
+
+    workers = min(workers, runs)
+    chunksize = max(1, runs // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(data_dir, map_id, trace_dir, trace_format),
+    ) as pool:
+        return list(pool.map(_run_job, jobs, chunksize=chunksize))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linearly interpolated percentile of ``values``, ``pct`` in [0, 100]."""
+    if not values:
+        raise ValueError("percentile of empty data")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(results: list[RunResult]) -> dict[str, Any]:
+    """Aggregate clear rate and leak, coin and XP percentiles across runs."""
+    summary: dict[str, Any] = {
+        "runs": len(results),
+        "clear_rate": sum(result.cleared for result in results) / len(results) if results else 0.0,
+    }
+    for name in ("leaks", "coins", "xp"):
+        values = [getattr(result, name) for result in results]
+        summary[name] = {f"p{pct}": percentile(values, pct) if values else None for pct in PERCENTILES}
+    return summary
+
+
+def report(
+    results: list[RunResult],
+    policy: str,
+    seed: int,
+    dt: float,
+    event_driven: bool = False,
+) -> dict[str, Any]:
+    """JSON-ready report: run settings, the summary and every run's result."""
+    return {
+        "policy": policy,
+        "seed": seed,
+        "dt": dt,
+        "event_driven": event_driven,
+        "summary": summarize(results),
+        "results": [asdict(result) for result in results],
+    }
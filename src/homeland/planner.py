@@ -0,0 +1,354 @@
+"""Beam search for build orders over forked game states."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+import os
+import time
+
+from homeland.config import GameContent
+from homeland.core.game_state import GameState
+from homeland.game import GameCheckpoint, HomelandGame
+
+
+# Actions are ``(method name, *args)`` tuples applied to a game in build phase.
+BUILD = "build_tower"
+UPGRADE = "upgrade_tower"
+Action = tuple[str, ...]
+
+# Wave-outcome key: (wave index, sorted (slot, tower, level) layout, coins bucket).
+StateKey = tuple[int, tuple[tuple[str, str, int], ...], int]
+
+# Content opened once per worker process by ``_init_worker``.
+_worker_content: GameContent | None = None
+
+
+@dataclass
+class PlanResult:
+    """Best build order found and how it played out.
+
+    ``phases[i]`` lists the actions taken in the build phase before wave
+    ``i + 1``. ``complete`` is False when the budget ran out before any
+    branch reached the map result; the plan then covers the waves played.
+    """
+
+    phases: list[list[Action]]
+    leaks: int
+    coins: int
+    xp: int
+    complete: bool
+    nodes: int
+    elapsed: float
+
+    def play(self, game: HomelandGame, dt: float = 0.1, event_driven: bool = False) -> dict[str, int | str | bool]:
+        """Run ``game`` under this plan and return its final snapshot."""
+        phase = 0
+        while game.state != GameState.MAP_RESULT:
+            if game.state == GameState.BUILD_PHASE:
+                if phase >= len(self.phases):
+                    break
+                for action in self.phases[phase]:
+                    apply_action(game, action)
+                phase += 1
+                game.start_next_wave()
+            _play_wave(game, dt, event_driven)
+        return game.snapshot()
+
+
+@dataclass
+class _Node:
+    game: HomelandGame
+    phases: list[list[Action]]
+    leaks: int = 0
+    pending: list[Action] = field(default_factory=list)
+
+    @property
+    def defeated(self) -> bool:
+        return self.game.state == GameState.MAP_RESULT and self.game.economy.coins < 0
+
+    @property
+    def score(self) -> tuple[bool, int, int]:
+        """Survival first, then fewest leaks, then most coins.
+
+        A defeat ends the map early, so it can leak less than a line that
+        survives; it must still rank below every survivor.
+        """
+        return (not self.defeated, -self.leaks, self.game.economy.coins)
+
+
+def apply_action(game: HomelandGame, action: Action) -> None:
+    name, *args = action
+    getattr(game, name)(*args)
+
+
+def legal_actions(game: HomelandGame) -> list[Action]:
+    """Every build and upgrade the player can afford right now."""
+    coins = game.economy.coins
+    configs = game.content.tower_configs
+    actions: list[Action] = []
+    for slot in game.content.map_config.build_slots:
+        tower = game.placement.get_tower(slot.slot_id)
+        if tower is None:
+            for tower_id, cfg in sorted(configs.items()):
+                if cfg.levels[0].cost <= coins:
+                    actions.append((BUILD, slot.slot_id, tower_id))
+        else:
+            levels = configs[tower.tower_id].levels
+            if tower.level < len(levels) and levels[tower.level].cost <= coins:
+                actions.append((UPGRADE, slot.slot_id))
+    return actions
+
+
+def layout(game: HomelandGame) -> tuple[tuple[str, str, int], ...]:
+    return tuple(sorted((tower.slot_id, tower.tower_id, tower.level) for tower in game.placement.all_towers()))
+
+
+def firepower(game: HomelandGame) -> float:
+    """Damage per second times covered path length, summed over towers.
+
+    A cheap static estimate used to choose which build bundles are worth a
+    full wave simulation.
+    """
+    total = 0.0
+    configs = game.content.tower_configs
+    for tower in game.placement.all_towers():
+        level = configs[tower.tower_id].levels[tower.level - 1]
+        coverage = game.coverage.coverage_for(tower, level.range)
+        reach = sum(end - start for start, end in coverage.intervals)
+        total += level.damage * level.attack_speed * reach
+    return total
+
+
+def dominates(a: _Node, b: _Node) -> bool:
+    """``a`` is at least as good as ``b`` on survival, leaks, coins and every tower."""
+    if a.defeated and not b.defeated:
+        return False
+    if a.leaks > b.leaks or a.game.economy.coins < b.game.economy.coins:
+        return False
+    towers = {tower.slot_id: tower for tower in a.game.placement.all_towers()}
+    for tower in b.game.placement.all_towers():
+        mine = towers.get(tower.slot_id)
+        if mine is None or mine.tower_id != tower.tower_id or mine.level < tower.level:
+            return False
+    return True
+
+
+def plan_build_order(
+    content: GameContent,
+    beam_width: int = 8,
+    branching: int = 6,
+    actions_per_phase: int = 4,
+    max_nodes: int | None = 2000,
+    time_limit: float | None = None,
+    coin_bucket: int = 50,
+    workers: int | None = 1,
+    dt: float = 0.1,
+    event_driven: bool = False,
+) -> PlanResult:
+    """Search build and upgrade sequences wave by wave with a beam.
+
+    Before each wave, every state in the beam proposes action bundles of up
+    to ``actions_per_phase`` builds or upgrades, keeping the ``branching``
+    bundles with the most ``firepower`` at each size plus doing nothing.
+    Each bundle is played through the wave; a node is one such wave
+    simulation. Bundles are deduplicated before they are played, keeping
+    the best per key of wave, tower layout and ``coin_bucket``-wide coin
+    bucket, and outcomes are deduplicated the same way. Dominated outcomes
+    are then dropped before the best ``beam_width`` by (fewest leaks, most
+    coins) carry on.
+
+    The search stops at the map result or when ``max_nodes`` or
+    ``time_limit`` seconds run out, returning the best plan found. Plans
+    that win the map come first; when none finished, the deepest branch
+    still playing is returned incomplete, and a defeat (negative coins) is
+    returned only when every line of play lost.
+    With ``workers`` above one (``None`` for the CPU count), wave
+    simulations run across a process pool.
+    """
+    if beam_width <= 0 or branching <= 0 or actions_per_phase < 0:
+        raise ValueError("beam_width and branching must be positive and actions_per_phase non-negative")
+    if coin_bucket <= 0:
+        raise ValueError("coin_bucket must be positive")
+    started = time.perf_counter()
+    deadline = None if time_limit is None else started + time_limit
+    workers = workers or os.cpu_count() or 1
+
+    root = _Node(game=HomelandGame(content=content, event_history=0, entity_events=False), phases=[])
+    beam = [root]
+    finished: list[_Node] = []
+    nodes = 0
+    pool = (
+        ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(content,))
+        if workers > 1
+        else None
+    )
+    try:
+        while beam:
+            # Bundles sharing a wave, layout and coin bucket play the wave
+            # out alike, so only the best of them is simulated.
+            candidates = _best_per_key(
+                [child for node in beam for child in _bundles(node, branching, actions_per_phase)], coin_bucket
+            )
+            budget = len(candidates)
+            if max_nodes is not None:
+                budget = min(budget, max_nodes - nodes)
+            if budget <= 0 or (deadline is not None and time.perf_counter() >= deadline):
+                break
+            played = _play_candidates(candidates[:budget], pool, dt, event_driven, deadline)
+            nodes += len(played)
+
+            outcomes: list[_Node] = []
+            for node in played:
+                (finished if node.game.state == GameState.MAP_RESULT else outcomes).append(node)
+            beam = _prune(_best_per_key(outcomes, coin_bucket), beam_width)
+            if len(played) < len(candidates):
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    won = [node for node in finished if not node.defeated]
+    if won:
+        best, complete = max(won, key=lambda node: node.score), True
+    elif beam or not finished:
+        best, complete = max(beam or [root], key=lambda node: (len(node.phases), node.score)), False
+    else:
+        best, complete = max(finished, key=lambda node: node.score), True
+    return PlanResult(
+        phases=best.phases,
+        leaks=best.leaks,
+        coins=best.game.economy.coins,
+        xp=best.game.progression.xp,
+        complete=complete,
+        nodes=nodes,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def _bundles(node: _Node, branching: int, actions_per_phase: int) -> list[_Node]:
+    """Build-phase children of ``node``: doing nothing plus the strongest bundles by size."""
+    children = [_Node(game=node.game.fork(event_history=0), phases=node.phases, leaks=node.leaks)]
+    seen = {layout(node.game)}
+    frontier = [children[0]]
+    for _ in range(actions_per_phase):
+        expanded: list[tuple[float, _Node]] = []
+        for parent in frontier:
+            for action in legal_actions(parent.game):
+                game = parent.game.fork(event_history=0)
+                apply_action(game, action)
+                key = layout(game)
+                if key in seen:
+                    continue
+                seen.add(key)
+                child = _Node(game=game, phases=node.phases, leaks=node.leaks, pending=[*parent.pending, action])
+                expanded.append((firepower(game), child))
+        expanded.sort(key=lambda item: item[0], reverse=True)
+        frontier = [child for _, child in expanded[:branching]]
+        if not frontier:
+            break
+        children.extend(frontier)
+    return children
+
+
+def _state_key(game: HomelandGame, coin_bucket: int) -> StateKey:
+    return game.wave_system.current_wave_number, layout(game), game.economy.coins // coin_bucket
+
+
+def _best_per_key(nodes: list[_Node], coin_bucket: int) -> list[_Node]:
+    """The highest-scoring node for each ``StateKey``, in first-seen key order."""
+    best: dict[StateKey, _Node] = {}
+    for node in nodes:
+        key = _state_key(node.game, coin_bucket)
+        kept = best.get(key)
+        if kept is None or node.score > kept.score:
+            best[key] = node
+    return list(best.values())
+
+
+def _play_candidates(
+    candidates: list[_Node],
+    pool: ProcessPoolExecutor | None,
+    dt: float,
+    event_driven: bool,
+    deadline: float | None,
+) -> list[_Node]:
+    """Play each candidate's next wave; stops early once ``deadline`` passes.
+
+    Pooled results are collected in candidate order, so a deadline cuts
+    the same prefix a serial run would; jobs not collected by then are
+    cancelled.
+    """
+    played: list[_Node] = []
+    if pool is None:
+        for node in candidates:
+            if deadline is not None and played and time.perf_counter() >= deadline:
+                break
+            node.leaks += _start_and_play(node.game, dt, event_driven)
+            node.phases = [*node.phases, node.pending]
+            node.pending = []
+            played.append(node)
+        return played
+
+    futures = [pool.submit(_run_job, (node.game.checkpoint(), dt, event_driven)) for node in candidates]
+    try:
+        for node, future in zip(candidates, futures):
+            if deadline is not None and played:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not wait([future], timeout=remaining).done:
+                    break
+            checkpoint, leaks = future.result()
+            node.game.restore(checkpoint)
+            node.leaks += leaks
+            node.phases = [*node.phases, node.pending]
+            node.pending = []
+            played.append(node)
+    finally:
+        for future in futures:
+            future.cancel()
+    return played
+
+
+def _prune(nodes: list[_Node], beam_width: int) -> list[_Node]:
+    """Best ``beam_width`` nodes that no other node dominates."""
+    ranked = sorted(nodes, key=lambda node: node.score, reverse=True)
+    kept: list[_Node] = []
+    for node in ranked:
+        if not any(dominates(other, node) for other in kept):
+            kept.append(node)
+            if len(kept) == beam_width:
+                break
+    return kept
+
+
+def _start_and_play(game: HomelandGame, dt: float, event_driven: bool) -> int:
+    """Start the next wave and play it out; returns how many boats leaked."""
+    settled: list[Any] = []
+    unsubscribe = game.events.subscribe("ledger_settled", settled.append)
+    game.start_next_wave()
+    _play_wave(game, dt, event_driven)
+    unsubscribe()
+    return sum(event.payload["leaks"] for event in settled)
+
+
+def _play_wave(game: HomelandGame, dt: float, event_driven: bool) -> None:
+    while game.state == GameState.WAVE_RUNNING:
+        if event_driven:
+            game.advance()
+        else:
+            game.tick(dt)
+
+
+def _init_worker(content: GameContent) -> None:
+    global _worker_content
+    _worker_content = content
+
+
+def _run_job(job: tuple[GameCheckpoint, float, bool]) -> tuple[GameCheckpoint, int]:
+    assert _worker_content is not None, "worker content not loaded"
+    checkpoint, dt, event_driven = job
+    game = HomelandGame(content=_worker_content, event_history=0, entity_events=False)
+    game.restore(checkpoint)
+    leaks = _start_and_play(game, dt, event_driven)
+    return game.checkpoint(), leaks
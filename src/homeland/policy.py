@@ -0,0 +1,121 @@
+"""Build policies that drive a headless ``HomelandGame`` between waves."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Callable
+import random
+
+from homeland.config import GameContent
+from homeland.core.game_state import GameState
+from homeland.game import HomelandGame
+
+
+@dataclass
+class BuildPlan:
+    """Fixed opening build plus an upgrade priority for every build phase.
+
+    ``placements`` are tried in order before the first wave; entries whose
+    slot is taken or that the player cannot afford are skipped. At each build
+    phase the first slot in ``upgrade_priority`` that can be upgraded is.
+    """
+
+    placements: list[tuple[str, str]]
+    upgrade_priority: list[str] = field(default_factory=list)
+
+    def place_towers(self, game: HomelandGame) -> None:
+        for slot_id, tower_id in self.placements:
+            if game.placement.is_slot_available(slot_id):
+                try:
+                    game.build_tower(slot_id, tower_id)
+                except ValueError:
+                    continue
+
+    def upgrade_one(self, game: HomelandGame) -> None:
+        for slot_id in self.upgrade_priority:
+            tower = game.placement.get_tower(slot_id)
+            if not tower:
+                continue
+            try:
+                game.upgrade_tower(slot_id)
+                break
+            except ValueError:
+                continue
+
+
+def play_map(
+    game: HomelandGame,
+    plan: BuildPlan,
+    dt: float = 0.1,
+    event_driven: bool = False,
+) -> dict[str, int | str | bool]:
+    """Run ``game`` to its map result under ``plan`` and return the final snapshot.
+
+    Waves run on fixed ``dt`` ticks, or event to event with ``game.advance``
+    when ``event_driven`` is set; the two give different results.
+    """
+    plan.place_towers(game)
+
+    while game.state != GameState.MAP_RESULT:
+        if game.state == GameState.BUILD_PHASE:
+            plan.upgrade_one(game)
+            game.start_next_wave()
+
+        if game.state == GameState.WAVE_RUNNING:
+            if event_driven:
+                game.advance()
+            else:
+                game.tick(dt)
+
+    return game.snapshot()
+
+
+# Deterministic baseline strategy for first playable simulation.
+BASELINE_PLAN = BuildPlan(
+    placements=[
+        ("s03", "arrow"),
+        ("s05", "bone"),
+        ("s08", "magic_fire"),
+        ("s07", "magic_wind"),
+    ],
+    upgrade_priority=["s03", "s05", "s08", "s07"],
+)
+
+
+# A policy turns map content and a per-run RNG into the plan for that run.
+Policy = Callable[[GameContent, random.Random], BuildPlan]
+
+
+def baseline_policy(content: GameContent, rng: random.Random) -> BuildPlan:
+    return BASELINE_PLAN
+
+
+def random_policy(content: GameContent, rng: random.Random) -> BuildPlan:
+    """One to five random towers on distinct slots, upgraded in a random order."""
+    slot_ids = [slot.slot_id for slot in content.map_config.build_slots]
+    tower_ids = sorted(content.tower_configs)
+    slots = rng.sample(slot_ids, rng.randint(1, min(5, len(slot_ids))))
+    return BuildPlan(
+        placements=[(slot_id, rng.choice(tower_ids)) for slot_id in slots],
+        upgrade_priority=rng.sample(slots, len(slots)),
+    )
+
+
+POLICIES: dict[str, Policy] = {
+    "baseline": baseline_policy,
+    "random": random_policy,
+}
+
+
+def resolve_policy(spec: str) -> Policy:
+    """Look up a policy by registered name or by ``package.module:function``."""
+    if spec in POLICIES:
+        return POLICIES[spec]
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"Unknown policy: {spec}")
+    policy = getattr(import_module(module_name), attr, None)
+    if not callable(policy):
+        raise ValueError(f"Policy {spec} is not callable")
+    return policy
@@ -0,0 +1,204 @@
+"""Command-log recording and deterministic replay of ``HomelandGame`` runs."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+import json
+import struct
+import zlib
+
+from homeland.config import GameContent
+from homeland.game import GameCheckpoint, HomelandGame
+
+
+DEFAULT_CHECKPOINT_EVERY = 100
+
+# Commands are ``[name, *args]`` lists so the log stays plain JSON.
+BUILD = "build_tower"
+UPGRADE = "upgrade_tower"
+START_WAVE = "start_next_wave"
+TICK = "tick"
+
+_HASH_HEADER = struct.Struct("<qqqq")
+
+
+class ReplayDivergence(RuntimeError):
+    """A replayed run stopped matching the recorded one."""
+
+    def __init__(self, tick: int, message: str) -> None:
+        super().__init__(f"Replay diverged at tick {tick}: {message}")
+        self.tick = tick
+
+
+def state_hash(game: HomelandGame, previous: int = 0) -> int:
+    """Fold the game's current state into ``previous``.
+
+    Chaining the hash tick after tick makes every value depend on the whole
+    run so far, while each step only packs the live numeric state.
+    """
+    fleet = game.fleet
+    crc = zlib.crc32(game.state.value.encode("ascii"), previous)
+    crc = zlib.crc32(
+        _HASH_HEADER.pack(game.economy.coins, game.progression.xp, len(fleet), game.wave_system.current_wave_number),
+        crc,
+    )
+    crc = zlib.crc32(array("d", fleet.hp).tobytes(), crc)
+    crc = zlib.crc32(array("d", fleet.distance).tobytes(), crc)
+    return zlib.crc32(array("d", [tower.cooldown_left for tower in game.placement.all_towers()]).tobytes(), crc)
+
+
+@dataclass
+class CommandLog:
+    """Everything needed to replay a run against the same content.
+
+    ``commands`` holds each command in order with whether it raised.
+    ``hashes[n]`` is the chained state hash after tick ``n + 1``.
+    ``checkpoints`` maps a tick number to the command index just after it
+    and the state at that moment.
+    """
+
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY
+    commands: list[list[Any]] = field(default_factory=list)
+    hashes: list[int] = field(default_factory=list)
+    checkpoints: dict[int, tuple[int, GameCheckpoint]] = field(default_factory=dict)
+
+    @property
+    def ticks(self) -> int:
+        return len(self.hashes)
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "checkpoint_every": self.checkpoint_every,
+            "commands": self.commands,
+            "hashes": self.hashes,
+            "checkpoints": [
+                {"tick": tick, "command_index": command_index, "state": asdict(checkpoint)}
+                for tick, (command_index, checkpoint) in sorted(self.checkpoints.items())
+            ],
+        }
+        Path(path).write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> CommandLog:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            checkpoint_every=payload["checkpoint_every"],
+            commands=payload["commands"],
+            hashes=payload["hashes"],
+            checkpoints={
+                entry["tick"]: (entry["command_index"], GameCheckpoint(**entry["state"]))
+                for entry in payload["checkpoints"]
+            },
+        )
+
+
+class GameRecorder:
+    """Drives a game and records every command, hash and periodic checkpoint.
+
+    Use the recorder's ``build_tower``, ``upgrade_tower``,
+    ``start_next_wave`` and ``tick`` in place of the game's own; they
+    behave the same, including raising ``ValueError``.
+    """
+
+    def __init__(self, game: HomelandGame, checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY) -> None:
+        if checkpoint_every <= 0:
+            raise ValueError("checkpoint_every must be positive")
+        self.game = game
+        self.log = CommandLog(checkpoint_every=checkpoint_every)
+        self.log.checkpoints[0] = (0, game.checkpoint())
+        self._hash = 0
+
+    def build_tower(self, slot_id: str, tower_id: str) -> None:
+        self._run([BUILD, slot_id, tower_id])
+
+    def upgrade_tower(self, slot_id: str) -> None:
+        self._run([UPGRADE, slot_id])
+
+    def start_next_wave(self) -> None:
+        self._run([START_WAVE])
+
+    def tick(self, dt: float) -> None:
+        self._run([TICK, dt])
+        log = self.log
+        self._hash = state_hash(self.game, self._hash)
+        log.hashes.append(self._hash)
+        if log.ticks % log.checkpoint_every == 0:
+            log.checkpoints[log.ticks] = (len(log.commands), self.game.checkpoint())
+
+    def _run(self, command: list[Any]) -> None:
+        try:
+            _apply(self.game, command)
+        except ValueError:
+            self.log.commands.append([*command, True])
+            raise
+        self.log.commands.append([*command, False])
+
+
+class Replayer:
+    """Rebuilds a recorded run from its command log.
+
+    ``seek`` restores the nearest checkpoint at or before the requested
+    tick and replays only the commands after it, checking every replayed
+    tick against the recorded hash.
+    """
+
+    def __init__(self, content: GameContent, log: CommandLog) -> None:
+        self.content = content
+        self.log = log
+
+    def seek(self, tick: int) -> HomelandGame:
+        """Return a game in the state it had just after tick ``tick`` (0 is the start)."""
+        log = self.log
+        if not 0 <= tick <= log.ticks:
+            raise ValueError(f"Tick out of range: {tick}")
+        start = max(mark for mark in log.checkpoints if mark <= tick)
+        command_index, checkpoint = log.checkpoints[start]
+        game = HomelandGame(content=self.content)
+        game.restore(checkpoint)
+        self._play(game, start, command_index, tick)
+        return game
+
+    def replay(self) -> HomelandGame:
+        """Replay the whole log from the start, including commands after the last tick."""
+        game = HomelandGame(content=self.content)
+        self._play(game, 0, 0, None)
+        return game
+
+    def _play(self, game: HomelandGame, tick: int, command_index: int, stop_tick: int | None) -> None:
+        log = self.log
+        current = log.hashes[tick - 1] if tick else 0
+        commands = log.commands
+        while command_index < len(commands) and (stop_tick is None or tick < stop_tick):
+            *command, failed = commands[command_index]
+            command_index += 1
+            if command[0] not in _COMMANDS:
+                raise ReplayDivergence(tick, f"unknown command {command[0]!r}")
+            try:
+                _apply(game, command)
+            except ValueError as exc:
+                if not failed:
+                    raise ReplayDivergence(tick, f"{command[0]} raised {exc!r}") from exc
+            else:
+                if failed:
+                    raise ReplayDivergence(tick, f"{command[0]} no longer raises")
+            if command[0] == TICK:
+                current = state_hash(game, current)
+                if current != log.hashes[tick]:
+                    raise ReplayDivergence(tick + 1, "state hash mismatch")
+                tick += 1
+
+
+_COMMANDS = {
+    BUILD: HomelandGame.build_tower,
+    UPGRADE: HomelandGame.upgrade_tower,
+    START_WAVE: HomelandGame.start_next_wave,
+    TICK: HomelandGame.tick,
+}
+
+
+def _apply(game: HomelandGame, command: list[Any]) -> None:
+    name, *args = command
+    _COMMANDS[name](game, *args)
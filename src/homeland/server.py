@@ -0,0 +1,432 @@
+"""Asyncio host for many concurrent ``HomelandGame`` sessions on one tick scheduler."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+import asyncio
+import json
+import time
+
+from homeland.config import DEFAULT_MAP_ID
+from homeland.content_registry import ContentRegistry
+from homeland.core.game_state import GameState
+from homeland.core.profiler import percentile
+from homeland.game import HomelandGame
+from homeland.replay import BUILD, START_WAVE, UPGRADE
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TICK = 0.1
+DEFAULT_MAX_SESSIONS = 10_000
+# Commands a session may have queued for the next tick before it answers "busy".
+DEFAULT_MAX_PENDING = 16
+# Requests one connection may have in flight before the server stops reading from it.
+DEFAULT_MAX_IN_FLIGHT = 256
+# Seconds a session whose map is over stays open for its final snapshot.
+DEFAULT_FINISHED_TTL = 60.0
+
+# Latency samples kept per session and for the scheduler; older ones fall off.
+LATENCY_WINDOW = 1_000
+# Sessions ticked between yields to the event loop, so sockets keep being
+# served while a large batch runs.
+TICK_CHUNK = 200
+
+# Game commands, named as in command logs, and how many arguments each takes.
+GAME_COMMANDS = {BUILD: 2, UPGRADE: 1, START_WAVE: 0}
+
+
+class ServerError(Exception):
+    """A request the server refuses; the message is sent back to the client."""
+
+
+def _failure(error: Exception) -> str:
+    return f"session failed: {type(error).__name__}: {error}"
+
+
+def latency_summary(samples: deque[float] | list[float]) -> dict[str, float]:
+    values = list(samples)
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": percentile(values, 100),
+    }
+
+
+class Session:
+    """One hosted game with its queued commands and latency samples.
+
+    Commands wait in ``pending`` until the scheduler's next batch applies
+    them, just before the game ticks, so every session changes only on tick
+    boundaries. ``command_ms`` holds the time from a command's arrival to
+    its result, ``tick_ms`` the time each tick of this game took.
+    ``finished_at`` is when a batch first found the map over.
+    """
+
+    def __init__(self, session_id: str, game: HomelandGame, max_pending: int) -> None:
+        self.session_id = session_id
+        self.game = game
+        self.max_pending = max_pending
+        self.pending: deque[tuple[list[Any], float, asyncio.Future[dict[str, Any]]]] = deque()
+        self.ticks = 0
+        self.commands = 0
+        self.closed = False
+        self.finished_at: float | None = None
+        self.command_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.tick_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def submit(self, command: list[Any]) -> asyncio.Future[dict[str, Any]]:
+        if len(self.pending) >= self.max_pending:
+            raise ServerError("busy: too many queued commands")
+        reply: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self.pending.append((command, time.perf_counter(), reply))
+        return reply
+
+    def apply_pending(self) -> None:
+        """Run every queued command in arrival order and resolve its reply.
+
+        A refused command (``ValueError``) is answered and the rest still
+        run. Any other error is answered too, then raised to the caller, as
+        the game may be left half-changed.
+        """
+        game = self.game
+        while self.pending:
+            command, received, reply = self.pending.popleft()
+            try:
+                getattr(game, command[0])(*command[1:])
+            except ValueError as error:
+                result: dict[str, Any] = {"ok": False, "error": str(error)}
+            except Exception as error:
+                if not reply.done():
+                    reply.set_result({"ok": False, "error": _failure(error)})
+                raise
+            else:
+                result = {"ok": True, "snapshot": game.snapshot()}
+            self.commands += 1
+            self.command_ms.append((time.perf_counter() - received) * 1000)
+            if not reply.done():
+                reply.set_result(result)
+
+    def cancel_pending(self, message: str) -> None:
+        while self.pending:
+            _, _, reply = self.pending.popleft()
+            if not reply.done():
+                reply.set_result({"ok": False, "error": message})
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "session": self.session_id,
+            "state": self.game.state.value,
+            "ticks": self.ticks,
+            "commands": self.commands,
+            "pending": len(self.pending),
+            "command_ms": latency_summary(self.command_ms),
+            "tick_ms": latency_summary(self.tick_ms),
+        }
+
+
+class SessionServer:
+    """Hosts sessions, ticks them together and answers line-delimited JSON.
+
+    Every ``tick`` seconds one batch applies each session's queued commands
+    and advances every running game by ``tick`` of game time. A batch that
+    overruns its slot is counted in ``overruns`` and the schedule restarts
+    from the end of it instead of bursting to catch up.
+
+    Clients send one JSON object per line and get one back per request,
+    echoing any ``"id"`` so pipelined replies can be matched:
+
+    - ``{"op": "open", "map": ...}`` starts a session (``map`` optional)
+    - ``{"op": "build_tower" | "upgrade_tower" | "start_next_wave",
+      "session": ..., "args": [...]}`` queues a game command and replies
+      with the snapshot once it is applied
+    - ``{"op": "snapshot" | "close", "session": ...}``; a connection may
+      close only the sessions it opened
+    - ``{"op": "stats"}`` for the scheduler, with ``"session"`` for one game;
+      ``"reset": true`` starts a fresh scheduler sample window after replying
+
+    Backpressure: a session with ``max_pending`` queued commands answers
+    "busy", a connection with ``max_in_flight`` unanswered requests is not
+    read until one completes, and opens past ``max_sessions`` are refused.
+
+    Sessions are closed for their clients when the connection that opened
+    them goes away (``abandoned``), ``finished_ttl`` seconds after their map
+    ends (``expired``), and when applying a command or ticking raises
+    anything but a refused command (``failed``); the other sessions and the
+    scheduler carry on.
+    """
+
+    def __init__(
+        self,
+        registry: ContentRegistry | None = None,
+        tick: float = DEFAULT_TICK,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        finished_ttl: float = DEFAULT_FINISHED_TTL,
+    ) -> None:
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if min(max_sessions, max_pending, max_in_flight) <= 0:
+            raise ValueError("limits must be positive")
+        if finished_ttl < 0:
+            raise ValueError("finished_ttl must be non-negative")
+        self.registry = registry or ContentRegistry()
+        self.tick = tick
+        self.max_sessions = max_sessions
+        self.max_pending = max_pending
+        self.max_in_flight = max_in_flight
+        self.finished_ttl = finished_ttl
+        self.sessions: dict[str, Session] = {}
+        self.batches = 0
+        self.overruns = 0
+        self.abandoned = 0
+        self.expired = 0
+        self.failed = 0
+        self.batch_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._counter = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._scheduler: asyncio.Task[None] | None = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> tuple[str, int]:
+        """Listen on ``host``:``port`` and start ticking; returns the bound address."""
+        self._server = await asyncio.start_server(self._serve_client, host, port)
+        self._scheduler = asyncio.create_task(self._run_scheduler())
+        address = self._server.sockets[0].getsockname()
+        return address[0], address[1]
+
+    async def close(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+            try:
+                await self._scheduler
+            except asyncio.CancelledError:
+                pass
+            self._scheduler = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for session in self.sessions.values():
+            session.cancel_pending("server closed")
+
+    def open_session(self, map_id: str = DEFAULT_MAP_ID) -> Session:
+        if len(self.sessions) >= self.max_sessions:
+            raise ServerError("server full")
+        if map_id not in self.registry:
+            raise ServerError(f"Unknown map: {map_id}")
+        try:
+            content = self.registry.get(map_id)
+        except Exception as error:
+            raise ServerError(f"Cannot load map {map_id}: {error}") from error
+        self._counter += 1
+        session_id = f"s{self._counter:06d}"
+        game = HomelandGame(content=content, event_history=0, entity_events=False)
+        session = self.sessions[session_id] = Session(session_id, game, self.max_pending)
+        return session
+
+    def close_session(self, session_id: str, reason: str = "session closed") -> None:
+        session = self._session(session_id)
+        del self.sessions[session_id]
+        session.closed = True
+        session.cancel_pending(reason)
+
+    async def step(self) -> None:
+        """One batch: apply queued commands, then tick each running game once.
+
+        Sessions whose map has been over for ``finished_ttl`` are closed,
+        as are sessions that raised while being applied or ticked.
+        """
+        start = time.perf_counter()
+        clock = time.perf_counter
+        tick = self.tick
+        for index, session in enumerate(list(self.sessions.values())):
+            if session.closed:
+                continue
+            game = session.game
+            try:
+                if session.pending:
+                    session.apply_pending()
+                if game.state == GameState.WAVE_RUNNING:
+                    began = clock()
+                    game.tick(tick)
+                    session.tick_ms.append((clock() - began) * 1000)
+                    session.ticks += 1
+            except Exception as error:
+                self.failed += 1
+                self.close_session(session.session_id, _failure(error))
+            else:
+                if game.state == GameState.MAP_RESULT:
+                    if session.finished_at is None:
+                        session.finished_at = start
+                    elif start - session.finished_at >= self.finished_ttl:
+                        self.expired += 1
+                        self.close_session(session.session_id, "session expired")
+            if index % TICK_CHUNK == TICK_CHUNK - 1:
+                await asyncio.sleep(0)
+        self.batches += 1
+        self.batch_ms.append((time.perf_counter() - start) * 1000)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sessions": len(self.sessions),
+            "running": sum(session.game.state == GameState.WAVE_RUNNING for session in self.sessions.values()),
+            "tick": self.tick,
+            "batches": self.batches,
+            "overruns": self.overruns,
+            "abandoned": self.abandoned,
+            "expired": self.expired,
+            "failed": self.failed,
+            "batch_ms": latency_summary(self.batch_ms),
+        }
+
+    def reset_stats(self) -> None:
+        self.batch_ms.clear()
+        self.overruns = 0
+
+    async def handle(self, request: dict[str, Any], owned: set[str] | None = None) -> dict[str, Any]:
+        """Answer one request; refusals come back as ``{"ok": false, "error": ...}``.
+
+        ``owned`` tracks the sessions a connection has opened and not closed;
+        when given, only those sessions may be closed. Any other error is
+        answered too rather than dropping the request.
+        """
+        try:
+            reply = await self._dispatch(request, owned)
+        except ServerError as error:
+            reply = {"ok": False, "error": str(error)}
+        except Exception as error:
+            reply = {"ok": False, "error": f"internal error: {type(error).__name__}: {error}"}
+        if "id" in request:
+            reply["id"] = request["id"]
+        return reply
+
+    async def _dispatch(self, request: dict[str, Any], owned: set[str] | None) -> dict[str, Any]:
+        op = request.get("op")
+        if op == "open":
+            map_id = request.get("map") or DEFAULT_MAP_ID
+            if not isinstance(map_id, str):
+                raise ServerError("map must be a string")
+            session = self.open_session(map_id)
+            if owned is not None:
+                owned.add(session.session_id)
+            return {"ok": True, "session": session.session_id}
+        if op == "stats":
+            if "session" in request:
+                return {"ok": True, "stats": self._session(request["session"]).stats()}
+            stats = self.stats()
+            if request.get("reset"):
+                self.reset_stats()
+            return {"ok": True, "stats": stats}
+        if op == "snapshot":
+            return {"ok": True, "snapshot": self._session(request.get("session")).game.snapshot()}
+        if op == "close":
+            session_id = self._session(request.get("session")).session_id
+            if owned is not None and session_id not in owned:
+                raise ServerError(f"Unknown session: {session_id}")
+            self.close_session(session_id)
+            if owned is not None:
+                owned.discard(session_id)
+            return {"ok": True}
+        if op in GAME_COMMANDS:
+            args = request.get("args", [])
+            if not isinstance(args, list) or len(args) != GAME_COMMANDS[op] or not all(
+                isinstance(arg, str) for arg in args
+            ):
+                raise ServerError(f"{op} takes {GAME_COMMANDS[op]} string arguments")
+            return await self._session(request.get("session")).submit([op, *args])
+        raise ServerError(f"Unknown op: {op}")
+
+    def _session(self, session_id: Any) -> Session:
+        session = self.sessions.get(session_id) if isinstance(session_id, str) else None
+        if session is None:
+            raise ServerError(f"Unknown session: {session_id}")
+        return session
+
+    def _abandon(self, owned: set[str]) -> None:
+        for session_id in owned:
+            if session_id in self.sessions:
+                self.abandoned += 1
+                self.close_session(session_id, "connection closed")
+        owned.clear()
+
+    async def _run_scheduler(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += self.tick
+            await self.step()
+            delay = deadline - loop.time()
+            if delay < 0:
+                self.overruns += 1
+                deadline = loop.time()
+                delay = 0.0
+            await asyncio.sleep(delay)
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        slots = asyncio.Semaphore(self.max_in_flight)
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task[None]] = set()
+        owned: set[str] = set()
+
+        async def answer(line: bytes) -> None:
+            try:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                if isinstance(request, dict):
+                    reply = await self.handle(request, owned)
+                else:
+                    reply = {"ok": False, "error": "requests are one JSON object per line"}
+                async with write_lock:
+                    writer.write(json.dumps(reply, separators=(",", ":")).encode() + b"\n")
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                slots.release()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await slots.acquire()
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            # Nobody is left to play or close these; closing them also
+            # answers their queued commands so the tasks below finish. A
+            # task that had not started yet may still open one, hence twice.
+            self._abandon(owned)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self._abandon(owned)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    registry: ContentRegistry | None = None,
+    **limits: Any,
+) -> None:
+    """Run a ``SessionServer`` until cancelled."""
+    server = SessionServer(registry=registry, **limits)
+    bound_host, bound_port = await server.start(host, port)
+    print(f"serving on {bound_host}:{bound_port} tick={server.tick}s", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
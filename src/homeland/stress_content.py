@@ -0,0 +1,189 @@
+"""Seeded procedural content for scaling and stress runs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+import json
+import math
+import random
+
+from homeland.config import EFFECT_TYPES, GameContent, build_game_content
+
+
+STRESS_MAP_ID = "stress"
+
+# Level-one stats per effect type, roughly those of the shipped towers; an
+# effect type without its own entry gets the physical stats.
+_BASE_STATS: dict[str, dict[str, float]] = {
+    "physical": {"damage": 60.0, "range": 2.6, "attack_speed": 0.8},
+    "fire": {"damage": 26.0, "range": 2.7, "attack_speed": 0.9, "burn_dps": 12.0, "burn_duration": 2.5},
+    "wind": {"damage": 20.0, "range": 2.9, "attack_speed": 0.95, "slow_percent": 22.0, "slow_duration": 1.8},
+    "lightning": {"damage": 58.0, "range": 2.8, "attack_speed": 0.8, "chain_count": 1, "chain_falloff": 35.0},
+}
+
+_ENEMIES = (
+    {"enemy_type": "scout", "hp": 180, "speed": 1.35, "coin_reward": 70, "xp_reward": 6},
+    {"enemy_type": "raider", "hp": 320, "speed": 1.00, "coin_reward": 105, "xp_reward": 10},
+    {"enemy_type": "barge", "hp": 560, "speed": 0.78, "coin_reward": 160, "xp_reward": 16},
+)
+
+_LEVELS = 3
+
+
+def generate_raw(
+    waypoints: int = 7,
+    slots: int = 10,
+    towers_per_effect: int = 1,
+    boats_per_wave: int = 20,
+    waves: int = 5,
+    seed: int = 0,
+    map_id: str = STRESS_MAP_ID,
+) -> dict[str, Any]:
+    """Content in the same JSON shape as the files under ``data/``.
+
+    Keys are ``map``, ``towers``, ``enemies``, ``waves`` and
+    ``progression``. The same arguments always give the same content.
+    """
+    if waypoints < 2:
+        raise ValueError("waypoints must be at least 2")
+    if slots < 0 or towers_per_effect < 0 or boats_per_wave < 0 or waves <= 0:
+        raise ValueError("slots, towers_per_effect and boats_per_wave must be non-negative and waves positive")
+    rng = random.Random(seed)
+    path = _path(rng, waypoints)
+    return {
+        "map": {
+            "map_id": map_id,
+            "starting_coins": 10_000,
+            "starting_xp": 0,
+            "leak_penalty": {"coins": 120, "xp": 6},
+            "unlock_requirement": {"next_map": f"{map_id}_next", "min_xp": 650},
+            "path_waypoints": path,
+            "build_slots": _slots(rng, path, slots),
+        },
+        "towers": [
+            _tower(rng, effect_type, index)
+            for effect_type in EFFECT_TYPES
+            for index in range(1, towers_per_effect + 1)
+        ],
+        "enemies": [dict(enemy) for enemy in _ENEMIES],
+        "waves": [_wave(rng, wave_id, boats_per_wave) for wave_id in range(1, waves + 1)],
+        "progression": {"xp_per_wave_clear": 25, "xp_map_clear": 100},
+    }
+
+
+def generate_content(
+    waypoints: int = 7,
+    slots: int = 10,
+    towers_per_effect: int = 1,
+    boats_per_wave: int = 20,
+    waves: int = 5,
+    seed: int = 0,
+    map_id: str = STRESS_MAP_ID,
+) -> GameContent:
+    """``GameContent`` built from ``generate_raw`` through the loader's validation."""
+    raw = generate_raw(waypoints, slots, towers_per_effect, boats_per_wave, waves, seed, map_id)
+    return build_game_content(
+        map_id,
+        map_raw=raw["map"],
+        towers_raw=raw["towers"],
+        enemies_raw=raw["enemies"],
+        waves_raw=raw["waves"],
+        progression_raw=raw["progression"],
+    )
+
+
+def write_content(data_dir: Path, **kwargs: Any) -> str:
+    """Write generated content as a data directory ``load_game_content`` reads.
+
+    Takes the same keyword arguments as ``generate_raw`` and returns the
+    map id.
+    """
+    raw = generate_raw(**kwargs)
+    map_id = raw["map"]["map_id"]
+    data_dir = Path(data_dir)
+    files = {
+        f"maps/{map_id}.json": raw["map"],
+        "towers/towers.json": raw["towers"],
+        "enemies/boat_types.json": raw["enemies"],
+        f"waves/{map_id}_waves.json": raw["waves"],
+        "progression/progression.json": raw["progression"],
+        "manifest.json": {
+            "towers": "towers/towers.json",
+            "enemies": "enemies/boat_types.json",
+            "progression": "progression/progression.json",
+            "maps": [{"map_id": map_id, "map": f"maps/{map_id}.json", "waves": f"waves/{map_id}_waves.json"}],
+        },
+    }
+    for name, payload in files.items():
+        path = data_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    return map_id
+
+
+def _path(rng: random.Random, count: int) -> list[dict[str, float]]:
+    """Left-to-right river with a bounded random walk in ``y``."""
+    points = []
+    y = rng.uniform(0.3, 0.7)
+    for index in range(count):
+        x = 0.02 + 0.96 * index / (count - 1)
+        points.append({"x": round(x, 6), "y": round(y, 6)})
+        y = min(0.9, max(0.1, y + rng.uniform(-0.08, 0.08)))
+    return points
+
+
+def _slots(rng: random.Random, path: list[dict[str, float]], count: int) -> list[dict[str, Any]]:
+    """Slots a short random distance to either side of a random point on the path."""
+    width = max(2, len(str(count)))
+    slots = []
+    for index in range(1, count + 1):
+        segment = rng.randrange(len(path) - 1)
+        a, b = path[segment], path[segment + 1]
+        t = rng.random()
+        dx, dy = b["x"] - a["x"], b["y"] - a["y"]
+        norm = math.hypot(dx, dy) or 1.0
+        offset = rng.uniform(0.04, 0.14) * rng.choice((-1.0, 1.0))
+        x = a["x"] + dx * t - dy / norm * offset
+        y = a["y"] + dy * t + dx / norm * offset
+        slots.append({"id": f"s{index:0{width}d}", "x": round(min(1.0, max(0.0, x)), 6), "y": round(min(1.0, max(0.0, y)), 6)})
+    return slots
+
+
+def _tower(rng: random.Random, effect_type: str, index: int) -> dict[str, Any]:
+    base = _BASE_STATS.get(effect_type, _BASE_STATS["physical"])
+    scale = rng.uniform(0.8, 1.2)
+    cost = int(round(rng.uniform(500, 900), -1))
+    levels = []
+    for level in range(1, _LEVELS + 1):
+        growth = 1.0 + 0.35 * (level - 1)
+        stats: dict[str, float] = {}
+        for name, value in base.items():
+            if name == "chain_count":
+                stats[name] = int(value)
+            elif name in ("range", "attack_speed"):
+                stats[name] = round(value * (1.0 + 0.05 * (level - 1)), 3)
+            elif name == "chain_falloff":
+                stats[name] = max(0.0, value - 5.0 * (level - 1))
+            else:
+                stats[name] = round(value * scale * growth, 3)
+        levels.append({"level": level, "cost": cost if level == 1 else int(cost * (0.8 + 0.3 * (level - 2))), "stats": stats})
+    return {
+        "tower_id": f"{effect_type}_{index}",
+        "display_name": f"Stress {effect_type.title()} {index}",
+        "effect_type": effect_type,
+        "levels": levels,
+    }
+
+
+def _wave(rng: random.Random, wave_id: int, boats: int) -> dict[str, Any]:
+    weights = [rng.random() + 0.1 for _ in _ENEMIES]
+    scale = boats / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    counts[0] += boats - sum(counts)
+    return {
+        "wave_id": wave_id,
+        "spawn_interval": round(rng.uniform(0.2, 1.0), 3),
+        "composition": {enemy["enemy_type"]: count for enemy, count in zip(_ENEMIES, counts)},
+        "order": rng.choice(("grouped", "interleaved")),
+    }
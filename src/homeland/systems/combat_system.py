@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from itertools import compress
+from typing import Callable
 import math
 
 from homeland.config import TowerConfig
-from homeland.entities.enemy_boat import EnemyBoat
+from homeland.entities.enemy_boat import EnemyBoat, Fleet
 from homeland.entities.tower import Tower
-from homeland.systems.pathing import Path
+from homeland.systems.coverage import CoverageIndex, TowerCoverage
+from homeland.systems.pathing import WORLD_SCALE, Path, PositionCache
+from homeland.systems.range_tracker import RangeChange, RangeTracker
+from homeland.systems.spatial import FleetGrid
+from homeland.systems.tower_stats import TowerStats
 
 
-WORLD_SCALE = 10.0
 CHAIN_RADIUS = 2.4
 
 
@@ -19,112 +25,273 @@ CHAIN_RADIUS = 2.4
 class CombatTickResult:
     killed_boats: list[EnemyBoat]
     attacks_fired: int
+    # Filled only when ``tick`` is asked to ``report_ranges``.
+    range_changes: list[RangeChange] = field(default_factory=list)
+
+
+class Volley:
+    """State shared by every attack in one combat tick.
+
+    ``rows`` are the rows alive when the tick's attacks began and
+    ``killed`` collects every boat destroyed this tick. The distance
+    ranking and the chain grid are built the first time they are needed.
+    """
+
+    __slots__ = ("fleet", "positions", "rows", "killed", "_ranked", "_grid")
+
+    def __init__(self, fleet: Fleet, positions: PositionCache, rows: list[int], killed: dict[int, EnemyBoat]) -> None:
+        self.fleet = fleet
+        self.positions = positions
+        self.rows = rows
+        self.killed = killed
+        self._ranked: tuple[list[int], list[float]] | None = None
+        self._grid: FleetGrid | None = None
+
+    def ranked(self) -> tuple[list[int], list[float]]:
+        """``rows`` sorted by path distance, and their distances."""
+        if self._ranked is None:
+            distances = self.fleet.distance
+            # Stable sort keeps spawn order among boats at equal distance.
+            ranked = sorted(self.rows, key=distances.__getitem__)
+            self._ranked = (ranked, [distances[row] for row in ranked])
+        return self._ranked
+
+    def grid(self) -> FleetGrid:
+        if self._grid is None:
+            self.positions.fill(self.rows)
+            self._grid = FleetGrid(self.positions, self.rows, CHAIN_RADIUS)
+        return self._grid
+
+
+# Called after a tower's direct hit with the combat system, the volley, the
+# tower's ``TowerStats`` slot and the target row.
+EffectHandler = Callable[["CombatSystem", Volley, int, int], None]
+
+
+def _burn(system: CombatSystem, volley: Volley, slot: int, target: int) -> None:
+    stats = system.stats
+    volley.fleet.apply_burn(target, stats.burn_dps[slot], stats.burn_duration[slot])
+
+
+def _slow(system: CombatSystem, volley: Volley, slot: int, target: int) -> None:
+    stats = system.stats
+    volley.fleet.apply_slow(target, stats.slow_percent[slot], stats.slow_duration[slot])
+
+
+def _chain(system: CombatSystem, volley: Volley, slot: int, target: int) -> None:
+    stats = system.stats
+    system._apply_chain_damage(
+        source=target,
+        fleet=volley.fleet,
+        grid=volley.grid(),
+        chain_count=stats.chain_count[slot],
+        chain_damage=stats.chain_damage[slot],
+        killed=volley.killed,
+    )
+
+
+# Handlers for the content ``EFFECT_TYPES``; ``None`` means the direct hit is all there is.
+EFFECT_HANDLERS: dict[str, EffectHandler | None] = {
+    "physical": None,
+    "fire": _burn,
+    "wind": _slow,
+    "lightning": _chain,
+}
 
 
 class CombatSystem:
-    def __init__(self, tower_configs: dict[str, TowerConfig]) -> None:
+    """Fires towers at boats; ``effects`` maps each ``effect_type`` to its handler.
+
+    ``effects`` defaults to ``EFFECT_HANDLERS``. A system given its own
+    table accepts exactly those effect types, so extra effects stay local
+    to it.
+    """
+
+    def __init__(
+        self,
+        tower_configs: dict[str, TowerConfig],
+        coverage: CoverageIndex | None = None,
+        stats: TowerStats | None = None,
+        effects: dict[str, EffectHandler | None] | None = None,
+    ) -> None:
         self._tower_configs = tower_configs
+        self._coverage = coverage
+        self.effects = effects if effects is not None else EFFECT_HANDLERS
+        # Forks pass their parent's table rather than compile it again.
+        self.stats = stats if stats is not None else TowerStats(tower_configs, list(self.effects))
+        self._handlers = [self.effects[name] for name in self.stats.effects]
+        self.ranges = RangeTracker(coverage, tower_configs) if coverage is not None else None
+        # Exact range tests run so far, added once per call for the profiler.
+        self.distance_checks = 0
 
-    def tick(self, dt: float, towers: list[Tower], boats: list[EnemyBoat], path: Path) -> CombatTickResult:
-        killed: dict[str, EnemyBoat] = {}
-        attacks_fired = 0
+    def tick(
+        self,
+        dt: float,
+        towers: list[Tower],
+        boats: Fleet | list[EnemyBoat],
+        path: Path,
+        report_ranges: bool = False,
+    ) -> CombatTickResult:
+        """Tick effects and cooldowns, then let every ready tower fire once.
 
-        for boat in boats:
-            if boat.tick_effects(dt):
-                killed[boat.boat_id] = boat
+        With ``report_ranges`` and coverage for ``path``, the ``ranges``
+        tracker is brought up to date first and its crossings returned.
+        """
+        fleet = boats if isinstance(boats, Fleet) else Fleet.adopt(boats)
+        views = fleet.boats
+        killed: dict[int, EnemyBoat] = {}
+        attacks_fired = 0
 
-        alive_boats = [b for b in boats if not (b.destroyed or b.leaked)]
+        if views:
+            for row in compress(range(len(views)), fleet.step_effects(dt)):
+                killed[row] = views[row]
 
+        ready: list[Tower] = []
         for tower in towers:
-            tower.tick_cooldown(dt)
-            if not tower.can_attack():
-                continue
-
-            tower_cfg = self._tower_configs[tower.tower_id]
-            level_cfg = tower_cfg.levels[tower.level - 1]
-
-            target = self._select_target(tower, level_cfg.range, alive_boats, path)
-            if target is None:
-                continue
-
-            attacks_fired += 1
-            tower.reset_cooldown(level_cfg.attack_speed)
-
-            if target.apply_damage(level_cfg.damage):
-                killed[target.boat_id] = target
-
-            if tower_cfg.effect_type == "fire":
-                target.apply_burn(level_cfg.burn_dps, level_cfg.burn_duration)
-            elif tower_cfg.effect_type == "wind":
-                target.apply_slow(level_cfg.slow_percent, level_cfg.slow_duration)
-            elif tower_cfg.effect_type == "lightning":
-                self._apply_chain_damage(
-                    source=target,
-                    boats=alive_boats,
-                    path=path,
-                    chain_count=level_cfg.chain_count,
-                    base_damage=level_cfg.damage,
-                    chain_falloff=level_cfg.chain_falloff,
-                    killed=killed,
-                )
-
-        return CombatTickResult(killed_boats=list(killed.values()), attacks_fired=attacks_fired)
+            # ``Tower.tick_cooldown`` then ``can_attack``, without the calls.
+            left = tower.cooldown_left - dt
+            if left > 0.0:
+                tower.cooldown_left = left
+            else:
+                tower.cooldown_left = 0.0
+                ready.append(tower)
+
+        coverage = self._coverage if self._coverage is not None and self._coverage.path is path else None
+        changes: list[RangeChange] = []
+        if report_ranges and coverage is not None and self.ranges is not None:
+            changes = self.ranges.update(fleet, towers, report=True)
+
+        destroyed = fleet.destroyed
+        leaked = fleet.leaked
+        distances = fleet.distance
+        alive_rows = [row for row in range(len(views)) if not (destroyed[row] or leaked[row])] if ready else []
+        if not alive_rows:
+            return CombatTickResult(killed_boats=list(killed.values()), attacks_fired=0, range_changes=changes)
+
+        # Boats only move after combat resolves, so one lookup per boat serves
+        # every targeting and chain check this tick.
+        volley = Volley(fleet, PositionCache(path, distances), alive_rows, killed)
+        stats = self.stats
+        ranges = stats.range
+
+        for tower in ready:
+            slot = tower.stats_slot
+            if slot < 0:
+                slot = tower.stats_slot = stats.slot(tower)
+            if self.fire(tower, slot, volley, None if coverage is None else coverage.coverage_for(tower, ranges[slot])):
+                attacks_fired += 1
+
+        return CombatTickResult(killed_boats=list(killed.values()), attacks_fired=attacks_fired, range_changes=changes)
+
+    def fire(self, tower: Tower, slot: int, volley: Volley, coverage: TowerCoverage | None = None) -> bool:
+        """Let ``tower``, at ``TowerStats`` slot ``slot``, take its shot at ``volley``; return whether it fired.
+
+        With ``coverage`` the target comes from the volley's distance
+        ranking, otherwise every row is range-checked. A tower that fires
+        has its cooldown reset, its damage dealt and its effect handled.
+        """
+        fleet = volley.fleet
+        if coverage is None:
+            volley.positions.fill(volley.rows)
+            target = self._select_target(tower, self.stats.range[slot], fleet, volley.rows, volley.positions)
+        else:
+            ranked, ranked_distances = volley.ranked()
+            target = self._select_target_indexed(tower, coverage, fleet, ranked, ranked_distances, volley.positions)
+        if target is None:
+            return False
+
+        stats = self.stats
+        # Same value ``Tower.reset_cooldown`` computes, taken from the table.
+        tower.cooldown_left = stats.cooldown[slot]
+        if fleet.apply_damage(target, stats.damage[slot]):
+            volley.killed[target] = fleet.boats[target]
+        handler = self._handlers[stats.effect[slot]]
+        if handler is not None:
+            handler(self, volley, slot, target)
+        return True
 
     def _select_target(
         self,
         tower: Tower,
         range_units: float,
-        boats: list[EnemyBoat],
-        path: Path,
-    ) -> EnemyBoat | None:
-        in_range: list[EnemyBoat] = []
-        for boat in boats:
-            if boat.destroyed or boat.leaked:
-                continue
-            bx, by = path.position_at_distance(boat.distance)
+        fleet: Fleet,
+        rows: list[int],
+        positions: dict[int, tuple[float, float]],
+    ) -> int | None:
+        destroyed = fleet.destroyed
+        leaked = fleet.leaked
+        live = [row for row in rows if not (destroyed[row] or leaked[row])]
+        self.distance_checks += len(live)
+        in_range: list[int] = []
+        for row in live:
+            bx, by = positions[row]
             dist = math.hypot((tower.x - bx) * WORLD_SCALE, (tower.y - by) * WORLD_SCALE)
             if dist <= range_units:
-                in_range.append(boat)
+                in_range.append(row)
 
         if not in_range:
             return None
 
-        return max(in_range, key=lambda b: b.distance)
+        return max(in_range, key=fleet.distance.__getitem__)
+
+    def _select_target_indexed(
+        self,
+        tower: Tower,
+        coverage: TowerCoverage,
+        fleet: Fleet,
+        ranked: list[int],
+        ranked_distances: list[float],
+        positions: dict[int, tuple[float, float]],
+    ) -> int | None:
+        """Pick the same row as ``_select_target`` using precomputed coverage.
+
+        ``ranked`` holds the tick's alive rows sorted by distance. Boats
+        well inside an interval are accepted without a position check; only
+        boats in an interval's fringe pay for the exact range test.
+        """
+        destroyed = fleet.destroyed
+        leaked = fleet.leaked
+        fringe = coverage.fringe
+        range_units = coverage.range_units
+        for lo, hi in reversed(coverage.intervals):
+            idx = bisect_right(ranked_distances, hi + fringe) - 1
+            while idx >= 0:
+                distance = ranked_distances[idx]
+                if distance < lo - fringe:
+                    break
+                row = ranked[idx]
+                idx -= 1
+                if destroyed[row] or leaked[row]:
+                    continue
+                if not (lo + fringe <= distance <= hi - fringe):
+                    self.distance_checks += 1
+                    bx, by = positions[row]
+                    dist = math.hypot((tower.x - bx) * WORLD_SCALE, (tower.y - by) * WORLD_SCALE)
+                    if dist > range_units:
+                        continue
+                # Ties on distance go to the earliest boat, as in ``max``.
+                for tied in ranked[bisect_left(ranked_distances, distance) : idx + 1]:
+                    if not (destroyed[tied] or leaked[tied]):
+                        return tied
+                return row
+        return None
 
     def _apply_chain_damage(
         self,
-        source: EnemyBoat,
-        boats: list[EnemyBoat],
-        path: Path,
+        source: int,
+        fleet: Fleet,
+        grid: FleetGrid,
         chain_count: int,
-        base_damage: float,
-        chain_falloff: float,
-        killed: dict[str, EnemyBoat],
+        chain_damage: float,
+        killed: dict[int, EnemyBoat],
     ) -> None:
+        """Hit the ``chain_count`` live boats nearest ``source`` within ``CHAIN_RADIUS``."""
         if chain_count <= 0:
             return
 
-        sx, sy = path.position_at_distance(source.distance)
-        available = [b for b in boats if b.boat_id != source.boat_id and not (b.destroyed or b.leaked)]
-        if not available:
-            return
-
-        available.sort(
-            key=lambda b: math.hypot(
-                (sx - path.position_at_distance(b.distance)[0]) * WORLD_SCALE,
-                (sy - path.position_at_distance(b.distance)[1]) * WORLD_SCALE,
-            )
-        )
-
-        chain_hits = 0
-        for candidate in available:
-            if chain_hits >= chain_count:
-                break
-            cx, cy = path.position_at_distance(candidate.distance)
-            dist = math.hypot((sx - cx) * WORLD_SCALE, (sy - cy) * WORLD_SCALE)
-            if dist > CHAIN_RADIUS:
-                continue
-            chain_damage = base_damage * (1.0 - (chain_falloff / 100.0))
-            if candidate.apply_damage(chain_damage):
-                killed[candidate.boat_id] = candidate
-            chain_hits += 1
+        examined = grid.examined
+        targets = grid.nearest(fleet, source, CHAIN_RADIUS, chain_count)
+        self.distance_checks += grid.examined - examined
+        for candidate in targets:
+            if fleet.apply_damage(candidate, chain_damage):
+                killed[candidate] = fleet.boats[candidate]
@@ -0,0 +1,214 @@
+"""Precomputed path coverage intervals for placed towers."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import repeat
+import math
+
+from homeland.config import TowerConfig
+from homeland.entities.tower import Tower
+from homeland.systems.pathing import WORLD_SCALE, Path
+
+
+@dataclass
+class TowerCoverage:
+    """Stretches of path distance a tower can reach at a given range.
+
+    ``intervals`` are disjoint, sorted ``(start, end)`` pairs of path distance.
+    Distances within ``fringe`` of an interval edge are too close to call
+    with interval arithmetic alone and must be confirmed with an exact
+    position check.
+    """
+
+    range_units: float
+    intervals: list[tuple[float, float]]
+    fringe: float
+
+
+# Entry tables kept per index before the cache starts over.
+ENTRY_TABLE_LIMIT = 256
+
+
+@dataclass
+class EntryTable:
+    """Where boats next come surely into range of any of a set of towers.
+
+    A boat heads for the start of the next coverage interval ahead, moved
+    in by the fringe, unless it is already inside one, moved in likewise.
+    Those rules compare a distance ``d`` with ``d < lo + fringe`` and
+    ``d <= hi - fringe``; the second equals ``d < nextafter(hi - fringe)``.
+    ``edges`` holds every such strict bound, sorted, so all distances in
+    ``[edges[g - 1], edges[g])`` answer every comparison alike, and their
+    nearest entry over all the towers is the constant ``targets[g]``
+    (``inf`` when none lies ahead). One bisect finds a boat's target.
+    """
+
+    edges: list[float]
+    targets: list[float]
+
+    @classmethod
+    def build(cls, coverages: list[TowerCoverage]) -> EntryTable:
+        edges = sorted(
+            {
+                edge
+                for coverage in coverages
+                for lo, hi in coverage.intervals
+                for edge in (lo + coverage.fringe, math.nextafter(hi - coverage.fringe, math.inf))
+            }
+        )
+        targets = [_entry_below(coverages, bound) for bound in edges]
+        targets.append(_entry_below(coverages, math.inf))
+        return cls(edges=edges, targets=targets)
+
+    def target(self, distance: float) -> float:
+        return self.targets[bisect_right(self.edges, distance)]
+
+    def targets_for(self, distances: list[float]) -> list[float]:
+        return list(map(self.targets.__getitem__, map(bisect_right, repeat(self.edges), distances)))
+
+
+def _entry_below(coverages: list[TowerCoverage], bound: float) -> float:
+    """Nearest entry for distances in the gap that ends at the edge ``bound``."""
+    nearest = math.inf
+    for coverage in coverages:
+        fringe = coverage.fringe
+        for lo, hi in coverage.intervals:
+            if lo + fringe >= bound:
+                nearest = min(nearest, lo + fringe)
+                break
+            if math.nextafter(hi - fringe, math.inf) >= bound:
+                break
+    return nearest
+
+
+class CoverageIndex:
+    """Caches per-tower coverage; towers and the river never move."""
+
+    def __init__(self, path: Path, tower_configs: dict[str, TowerConfig]) -> None:
+        self.path = path
+        self._tower_configs = tower_configs
+        self._by_tower: dict[str, TowerCoverage] = {}
+        self._fringe = 1e-6 * max(1.0, path.length)
+        # Bumped whenever an entry is built or removed.
+        self.version = 0
+        # ``EntryTable`` per tuple of tower instance ids, valid at ``_tables_version``.
+        self._tables: dict[tuple[str, ...], EntryTable] = {}
+        self._tables_version = 0
+
+    def fork(self) -> CoverageIndex:
+        """Index for a forked game; entries are immutable, so they are shared."""
+        index = CoverageIndex.__new__(CoverageIndex)
+        index.path = self.path
+        index._tower_configs = self._tower_configs
+        index._by_tower = dict(self._by_tower)
+        index._fringe = self._fringe
+        index.version = self.version
+        index._tables = dict(self._tables)
+        index._tables_version = self._tables_version
+        return index
+
+    def rebuild(self, tower: Tower) -> TowerCoverage:
+        level_cfg = self._tower_configs[tower.tower_id].levels[tower.level - 1]
+        return self._build(tower, level_cfg.range)
+
+    def remove(self, tower: Tower) -> None:
+        self._by_tower.pop(tower.tower_instance_id, None)
+        self.version += 1
+
+    def coverage_for(self, tower: Tower, range_units: float) -> TowerCoverage:
+        coverage = self._by_tower.get(tower.tower_instance_id)
+        if coverage is None or coverage.range_units != range_units:
+            coverage = self._build(tower, range_units)
+        return coverage
+
+    def entry_table(self, towers: list[Tower]) -> EntryTable:
+        """``EntryTable`` for ``towers`` at their current levels.
+
+        Tables are cached by tower set until any coverage entry changes; the
+        set of towers ready to fire repeats a lot from event to event.
+        """
+        if self._tables_version != self.version:
+            self._tables = {}
+            self._tables_version = self.version
+        key = tuple(tower.tower_instance_id for tower in towers)
+        table = self._tables.get(key)
+        if table is None:
+            configs = self._tower_configs
+            table = EntryTable.build(
+                [self.coverage_for(tower, configs[tower.tower_id].levels[tower.level - 1].range) for tower in towers]
+            )
+            # Building a missing coverage entry bumps the version.
+            if self._tables_version != self.version or len(self._tables) >= ENTRY_TABLE_LIMIT:
+                self._tables = {}
+                self._tables_version = self.version
+            self._tables[key] = table
+        return table
+
+    def coverage_at(self, x: float, y: float, range_units: float) -> TowerCoverage:
+        """Coverage of a tower at ``(x, y)`` reaching ``range_units``, built fresh and not cached."""
+        return TowerCoverage(
+            range_units=range_units,
+            intervals=path_intervals_in_range(self.path, x, y, range_units),
+            fringe=self._fringe,
+        )
+
+    def _build(self, tower: Tower, range_units: float) -> TowerCoverage:
+        coverage = self.coverage_at(tower.x, tower.y, range_units)
+        self._by_tower[tower.tower_instance_id] = coverage
+        self.version += 1
+        return coverage
+
+
+def path_intervals_in_range(path: Path, x: float, y: float, range_units: float) -> list[tuple[float, float]]:
+    """Return merged path-distance intervals whose positions lie within range of ``(x, y)``."""
+    if range_units < 0:
+        return []
+
+    radius_sq = (range_units / WORLD_SCALE) ** 2
+    raw: list[tuple[float, float]] = []
+    for start, end, a, b in path.segment_spans():
+        dx = b.x - a.x
+        dy = b.y - a.y
+        wx = a.x - x
+        wy = a.y - y
+
+        # |W + uD|^2 <= r^2 for u in [0, 1] along the segment.
+        qa = dx * dx + dy * dy
+        qb = 2.0 * (wx * dx + wy * dy)
+        qc = wx * wx + wy * wy - radius_sq
+        if qa == 0.0:
+            if qc <= 0.0:
+                raw.append((start, end))
+            continue
+
+        disc = qb * qb - 4.0 * qa * qc
+        if disc < 0.0:
+            # Grazing tangents can round negative; keep the touch point so
+            # the exact check in the fringe can still decide it.
+            if disc < -1e-9 * (qb * qb + abs(4.0 * qa * qc)):
+                continue
+            disc = 0.0
+        root = math.sqrt(disc)
+        u_lo = (-qb - root) / (2.0 * qa)
+        u_hi = (-qb + root) / (2.0 * qa)
+        if u_hi < 0.0 or u_lo > 1.0:
+            continue
+        lo = start if u_lo <= 0.0 else start + (end - start) * u_lo
+        hi = end if u_hi >= 1.0 else start + (end - start) * u_hi
+        raw.append((lo, hi))
+
+    merged: list[tuple[float, float]] = []
+    for lo, hi in raw:
+        if merged and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+
+    # Distances past either end of the path clamp to the end points.
+    if merged and merged[0][0] <= 0.0:
+        merged[0] = (-math.inf, merged[0][1])
+    if merged and merged[-1][1] >= path.length:
+        merged[-1] = (merged[-1][0], math.inf)
+    return merged
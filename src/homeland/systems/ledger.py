@@ -0,0 +1,71 @@
+"""Per-tick batching of coin and XP changes from kills and leaks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+from homeland.systems.economy_system import EconomySystem
+from homeland.systems.progression_system import ProgressionSystem
+
+
+@dataclass
+class Ledger:
+    """Coin and XP changes collected over a tick and applied in one step.
+
+    ``settle`` applies every credit before every debit, through the same
+    economy and progression calls a single kill or leak would use: coins
+    may go negative and XP floors at zero. A tick's kills always settle
+    before its leaks, and XP losses compose (flooring each one equals
+    flooring their sum), so the balances match one-at-a-time updates.
+    """
+
+    kills: int = 0
+    leaks: int = 0
+    coins_earned: int = 0
+    coins_lost: int = 0
+    xp_earned: int = 0
+    xp_lost: int = 0
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.kills or self.leaks)
+
+    def credit(self, coins: int, xp: int, kills: int = 1) -> None:
+        """Record ``kills`` kills rewarding ``coins`` and ``xp`` between them."""
+        if coins < 0 or xp < 0:
+            raise ValueError("amounts must be non-negative")
+        self.kills += kills
+        self.coins_earned += coins
+        self.xp_earned += xp
+
+    def debit(self, coins: int, xp: int, leaks: int = 1) -> None:
+        """Record ``leaks`` leaks costing ``coins`` and ``xp`` between them."""
+        if coins < 0 or xp < 0:
+            raise ValueError("amounts must be non-negative")
+        self.leaks += leaks
+        self.coins_lost += coins
+        self.xp_lost += xp
+
+    def project(self, coins: int, xp: int) -> tuple[int, int]:
+        """Balances that settling on top of ``coins`` and ``xp`` would give."""
+        return coins + self.coins_earned - self.coins_lost, max(0, xp + self.xp_earned - self.xp_lost)
+
+    def settle(self, economy: EconomySystem, progression: ProgressionSystem) -> dict[str, Any]:
+        """Apply and clear everything pending; returns the ``ledger_settled`` payload."""
+        coins, xp = economy.coins, progression.xp
+        economy.reward(self.coins_earned)
+        economy.penalize(self.coins_lost)
+        progression.add_xp(self.xp_earned)
+        progression.remove_xp(self.xp_lost)
+        payload = {
+            "kills": self.kills,
+            "leaks": self.leaks,
+            "coins_delta": economy.coins - coins,
+            "xp_delta": progression.xp - xp,
+            "coins": economy.coins,
+            "xp": progression.xp,
+        }
+        for field in fields(self):
+            setattr(self, field.name, field.default)
+        return payload
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
+from typing import Iterable, Sequence
 import math
 
 from homeland.config import Waypoint
 
 
+WORLD_SCALE = 10.0
+
+# Segments left before the target that lookups walk one by one: each
+# ``_tables`` step costs about as much as walking this many segments.
+_WALK_TAIL = 32
+# Shorter paths are walked outright; the tables only win past this length.
+_TABLE_SEGMENTS = 256
+# ``2**52``, the smallest remainder of a binade in that binade's ulps.
+_BINADE_FLOOR = 1 << 52
+
+
 @dataclass
 class Path:
     points: list[Waypoint]
@@ -16,25 +29,213 @@ class Path:
         if len(self.points) < 2:
             raise ValueError("Path requires at least 2 points")
         self._segments: list[tuple[Waypoint, Waypoint, float]] = []
+        # Cumulative distance at the start and end of each segment.
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._lengths: list[float] = []
+        self._origins: list[tuple[float, float, float, float]] = []
         self.length = 0.0
         for idx in range(len(self.points) - 1):
             a = self.points[idx]
             b = self.points[idx + 1]
-            seg_len = math.hypot(b.x - a.x, b.y - a.y) * 10.0
+            seg_len = math.hypot(b.x - a.x, b.y - a.y) * WORLD_SCALE
             self._segments.append((a, b, seg_len))
+            self._lengths.append(seg_len)
+            self._starts.append(self.length)
             self.length += seg_len
+            self._ends.append(self.length)
+            self._origins.append((a.x, a.y, b.x - a.x, b.y - a.y))
+        self._start_point = (self.points[0].x, self.points[0].y)
+        self._end_point = (self.points[-1].x, self.points[-1].y)
+        self._top_binade, self._tables = _remainder_tables(self._lengths, self.length)
 
     def position_at_distance(self, distance: float) -> tuple[float, float]:
         if distance <= 0:
-            return (self.points[0].x, self.points[0].y)
+            return self._start_point
         if distance >= self.length:
-            return (self.points[-1].x, self.points[-1].y)
+            return self._end_point
+        return self._locate(distance)
+
+    def segment_spans(self) -> list[tuple[float, float, Waypoint, Waypoint]]:
+        """Return ``(start, end, a, b)`` path-distance spans for each segment."""
+        return [(self._starts[i], self._ends[i], a, b) for i, (a, b, _) in enumerate(self._segments)]
+
+    def positions_at_distances(self, distances: Iterable[float]) -> list[tuple[float, float]]:
+        """Resolve many path distances in one call, preserving input order."""
+        length = self.length
+        start_point = self._start_point
+        end_point = self._end_point
+        lengths = self._lengths
+        origins = self._origins
+        skip = self._skip if self._tables else None
 
+        positions: list[tuple[float, float]] = []
+        append = positions.append
+        for distance in distances:
+            if distance <= 0:
+                append(start_point)
+                continue
+            if distance >= length:
+                append(end_point)
+                continue
+            idx = 0
+            remaining = distance
+            if skip:
+                idx, remaining = skip(distance)
+            for idx in range(idx, len(lengths)):
+                seg_len = lengths[idx]
+                if remaining <= seg_len:
+                    ax, ay, dx, dy = origins[idx]
+                    t = remaining / seg_len
+                    append((ax + dx * t, ay + dy * t))
+                    break
+                remaining -= seg_len
+            else:
+                append(end_point)
+        return positions
+
+    def _locate(self, distance: float) -> tuple[float, float]:
+        """Interpolate a distance strictly inside the path.
+
+        Segments are walked from the start, subtracting each length from the
+        remaining distance in turn; ``distance - start`` is not bit-equal to
+        the walked remainder, and the last-bit drift in positions changes
+        which boats are in range and so game outcomes. On long paths
+        ``_skip`` replays the walk up to the last few segments.
+        """
+        idx = 0
         remaining = distance
-        for a, b, seg_len in self._segments:
+        if self._tables:
+            idx, remaining = self._skip(distance)
+        lengths = self._lengths
+        for idx in range(idx, len(lengths)):
+            seg_len = lengths[idx]
             if remaining <= seg_len:
-                t = remaining / seg_len if seg_len else 0.0
-                return (a.x + (b.x - a.x) * t, a.y + (b.y - a.y) * t)
+                ax, ay, dx, dy = self._origins[idx]
+                t = remaining / seg_len
+                return (ax + dx * t, ay + dy * t)
             remaining -= seg_len
+        return self._end_point
+
+    def _skip(self, distance: float) -> tuple[int, float]:
+        """Return the segment walk's state ``_WALK_TAIL`` segments before ``distance``.
+
+        Bisecting ``_ends`` finds the target segment; the walk up to it is
+        replayed a binade at a time from ``_tables``, each step jumping to
+        the segment whose subtraction leaves the binade and doing that one
+        subtraction as the walk does. The remainder is bit-identical to the
+        walk's. A segment index past the last means the walk ran off the end.
+        """
+        lengths = self._lengths
+        count = len(lengths)
+        remaining = distance
+        idx = 0
+        tables = self._tables
+        frexp = math.frexp
+        ldexp = math.ldexp
+        tail = bisect_left(self._ends, distance) - _WALK_TAIL
+        while idx < tail:
+            binade = frexp(remaining)[1]
+            level = self._top_binade - binade
+            if level >= len(tables):
+                break
+            prefix, next_tie, ties = tables[level]
+            # ``remaining`` in ulps of its binade, offset so that the remainder
+            # before segment ``i`` is ``base - prefix[i]``.
+            base = int(ldexp(remaining, 53 - binade)) + prefix[idx]
+            tie = next_tie[idx]
+            stop = bisect_left(prefix, base - _BINADE_FLOOR, idx + 1, tie + 1)
+            if stop > tie:
+                if tie == count:
+                    return count, remaining
+                # ``prefix`` assumed a rounding for the first tie; settle it
+                # from the parity the remainder actually has there.
+                odd, assumed = ties[tie]
+                settled = base - ((base - prefix[tie] - odd) & 1) + assumed
+                stop = bisect_left(prefix, settled - _BINADE_FLOOR, tie + 1, count + 1)
+                if stop > count:
+                    return count, remaining
+                if stop > tie + 1:
+                    base = settled
+            # Segment ``stop - 1`` leaves the binade (or holds the distance),
+            # so its subtraction is done as the walk does it.
+            idx = stop - 1
+            remaining = ldexp(base - prefix[idx], binade - 53)
+            if remaining <= lengths[idx]:
+                return idx, remaining
+            remaining -= lengths[idx]
+            idx = stop
+        return idx, remaining
+
+
+def _remainder_tables(
+    lengths: list[float], total: float
+) -> tuple[int, list[tuple[list[int], list[int], dict[int, tuple[int, int]]]]]:
+    """Tables that replay the segment walk's ``remaining -= seg_len`` a binade at a time.
+
+    While the remainder stays in the binade ``[2**(b-1), 2**b)`` every
+    subtraction rounds to the same ulp, so the walk is a prefix sum of the
+    lengths rounded to that ulp. A length exactly half-way between two ulps
+    rounds to even; once one such tie has been passed the remainder's parity
+    is known, so later ties are summed with the rounding they will get and
+    only the first is left for lookups to settle (``ties`` maps it to the
+    parity of its rounded-down ulps and the rounding ``prefix`` assumed).
+
+    Returns the top binade and, per binade below it, ``(prefix, next_tie,
+    ties)``. Binades stop two above the median segment, where the walk is
+    nearly done; paths short enough to walk get none.
+    """
+    top = math.frexp(total)[1]
+    positive = sorted(seg_len for seg_len in lengths if seg_len > 0)
+    if len(lengths) <= _TABLE_SEGMENTS or not positive:
+        return top, []
+    count = len(lengths)
+    tables = []
+    for binade in range(top, math.frexp(positive[len(positive) // 2])[1] + 1, -1):
+        prefix = [0]
+        ties: dict[int, tuple[int, int]] = {}
+        since_tie: int | None = None
+        for idx, seg_len in enumerate(lengths):
+            ulps = math.ldexp(seg_len, 53 - binade)
+            whole = math.floor(ulps)
+            half = ulps - whole
+            if half == 0.5:
+                # Rounded to leave the remainder even, given it was even after the last tie.
+                up = (since_tie + whole) & 1 if since_tie is not None else 0
+                ties[idx] = (whole & 1, up)
+                step = whole + up
+                since_tie = 0
+            else:
+                step = whole if half < 0.5 else whole + 1
+                if since_tie is not None:
+                    since_tie += step
+            prefix.append(prefix[-1] + step)
+        next_tie = [count] * (count + 1)
+        for idx in range(count - 1, -1, -1):
+            next_tie[idx] = idx if idx in ties else next_tie[idx + 1]
+        tables.append((prefix, next_tie, ties))
+    return top, tables
+
+
+class PositionCache(dict):
+    """Per-tick ``index -> (x, y)`` lookups resolved on first use.
+
+    ``distances`` is indexed by the same keys, so callers that only need a
+    handful of boats never pay to resolve the whole fleet.
+    """
+
+    def __init__(self, path: Path, distances: Sequence[float]) -> None:
+        super().__init__()
+        self._path = path
+        self._distances = distances
+
+    def __missing__(self, index: int) -> tuple[float, float]:
+        position = self._path.position_at_distance(self._distances[index])
+        self[index] = position
+        return position
 
-        return (self.points[-1].x, self.points[-1].y)
+    def fill(self, indices: list[int]) -> None:
+        """Resolve every index in ``indices`` with one batch lookup."""
+        missing = [index for index in indices if index not in self]
+        distances = self._distances
+        self.update(zip(missing, self._path.positions_at_distances(distances[index] for index in missing)))
@@ -2,23 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from homeland.config import BuildSlot
 from homeland.entities.tower import Tower
+from homeland.systems.coverage import CoverageIndex
 
 
 @dataclass
 class PlacementSystem:
     slots: dict[str, BuildSlot]
+    coverage: CoverageIndex | None = None
 
     def __post_init__(self) -> None:
         self._towers_by_slot: dict[str, Tower] = {}
         self._counter = 0
 
     @classmethod
-    def from_slots(cls, slots: list[BuildSlot]) -> "PlacementSystem":
-        return cls(slots={slot.slot_id: slot for slot in slots})
+    def from_slots(cls, slots: list[BuildSlot], coverage: CoverageIndex | None = None) -> "PlacementSystem":
+        return cls(slots={slot.slot_id: slot for slot in slots}, coverage=coverage)
 
     def is_slot_available(self, slot_id: str) -> bool:
         return slot_id in self.slots and slot_id not in self._towers_by_slot
@@ -39,10 +41,37 @@ class PlacementSystem:
             level=1,
         )
         self._towers_by_slot[slot_id] = tower
+        if self.coverage is not None:
+            self.coverage.rebuild(tower)
         return tower
 
     def get_tower(self, slot_id: str) -> Tower | None:
         return self._towers_by_slot.get(slot_id)
 
+    def fork(self, coverage: CoverageIndex | None = None) -> PlacementSystem:
+        """Copy with its own towers; slots are shared."""
+        placement = PlacementSystem(slots=self.slots, coverage=coverage)
+        placement._towers_by_slot = {slot_id: replace(tower) for slot_id, tower in self._towers_by_slot.items()}
+        placement._counter = self._counter
+        return placement
+
+    @property
+    def tower_counter(self) -> int:
+        return self._counter
+
+    def restore(self, towers: list[Tower], counter: int) -> None:
+        """Replace every placed tower, keeping ``towers`` in build order."""
+        if self.coverage is not None:
+            for tower in self._towers_by_slot.values():
+                self.coverage.remove(tower)
+        self._towers_by_slot = {}
+        for tower in towers:
+            if tower.slot_id not in self.slots:
+                raise ValueError(f"Unknown slot: {tower.slot_id}")
+            self._towers_by_slot[tower.slot_id] = tower
+            if self.coverage is not None:
+                self.coverage.rebuild(tower)
+        self._counter = counter
+
     def all_towers(self) -> list[Tower]:
         return list(self._towers_by_slot.values())
@@ -0,0 +1,212 @@
+"""Per-tower in-range sets kept up to date as boats cross coverage edges."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from itertools import compress
+from operator import ge
+import math
+
+from homeland.config import TowerConfig
+from homeland.entities.enemy_boat import EnemyBoat, Fleet
+from homeland.entities.tower import Tower
+from homeland.systems.coverage import CoverageIndex, TowerCoverage
+from homeland.systems.pathing import WORLD_SCALE, PositionCache
+
+
+# ``(tower_instance_id, boat view, entered)`` for one boat crossing one edge.
+RangeChange = tuple[str, EnemyBoat, bool]
+
+
+class RangeTracker:
+    """Which boats each tower may reach, maintained from boat movement alone.
+
+    Every coverage interval, widened by its fringe, contributes an entry and
+    an exit distance. Those edges cut the path into zones, each covered by a
+    fixed set of towers. Boats only move forward, so a boat changes zone
+    only when its distance passes the upper edge of the zone it is in; each
+    ``update`` moves just those boats between towers' sets. A boat's zone
+    and upper edge live in the fleet's ``range_zone`` and ``range_edge``
+    columns, so finding the boats that crossed is one pass over two columns.
+
+    Members are ``EnemyBoat`` views, which keep their row through fleet
+    compaction; boats that left the fleet are dropped as they are found.
+    Set membership is a candidate test: boats within the fringe of an edge
+    still get an exact position check in ``boats_in_range``.
+
+    Targeting does not go through the tracker: the shared per-tick ranking
+    in ``CombatSystem`` already finds each tower's target with a bisect. The
+    tracker serves range events and queries, and costs nothing until used.
+    """
+
+    def __init__(self, coverage: CoverageIndex, tower_configs: dict[str, TowerConfig]) -> None:
+        self.coverage = coverage
+        self._tower_configs = tower_configs
+        self._fleet: Fleet | None = None
+        self._layout: tuple[int, tuple[str, ...]] | None = None
+        self._edges: list[float] = []
+        self._covers: list[tuple[str, ...]] = [()]
+        self._coverages: dict[str, TowerCoverage] = {}
+        self._members: dict[str, dict[EnemyBoat, None]] = {}
+        # ``(old zone, new zone) -> (towers left, towers entered)``; -1 is "not yet placed".
+        self._transitions: dict[tuple[int, int], tuple[tuple[str, ...], tuple[str, ...]]] = {}
+
+    def update(self, fleet: Fleet, towers: list[Tower], report: bool = False) -> list[RangeChange]:
+        """Bring every tower's set up to date with ``fleet``'s distances.
+
+        Returns the crossings when ``report`` is set, in row order; boats
+        leaving the fleet by dying or leaking are not reported.
+        """
+        layout = (self.coverage.version, tuple(tower.tower_instance_id for tower in towers))
+        changes: list[RangeChange] = []
+        if layout != self._layout or fleet is not self._fleet:
+            changes = self._reset(fleet, towers, report)
+        distances = fleet.distance
+        uppers = fleet.range_edge
+        crossed = list(compress(range(len(uppers)), map(ge, distances, uppers)))
+        if not crossed:
+            return changes
+
+        views = fleet.boats
+        zones = fleet.range_zone
+        edges = self._edges
+        members = self._members
+        transitions = self._transitions
+        for row in crossed:
+            view = views[row]
+            zone = bisect_right(edges, distances[row])
+            step = (zones[row], zone)
+            moves = transitions.get(step)
+            if moves is None:
+                moves = transitions[step] = self._transition(*step)
+            zones[row] = zone
+            uppers[row] = edges[zone] if zone < len(edges) else math.inf
+            left, entered = moves
+            for tower_instance_id in left:
+                del members[tower_instance_id][view]
+            for tower_instance_id in entered:
+                members[tower_instance_id][view] = None
+            if report:
+                changes.extend((tower_instance_id, view, False) for tower_instance_id in left)
+                changes.extend((tower_instance_id, view, True) for tower_instance_id in entered)
+        return changes
+
+    def boats_in_range(self, tower: Tower, fleet: Fleet, positions: PositionCache) -> list[EnemyBoat]:
+        """Live boats ``tower`` can hit right now, furthest along the path first."""
+        coverage = self._coverages.get(tower.tower_instance_id)
+        if coverage is None:
+            return []
+        candidates = self._candidates(tower, fleet)
+        candidates.sort(reverse=True)
+        return [
+            fleet.boats[-negated]
+            for distance, negated in candidates
+            if self._reaches(tower, coverage, distance, -negated, positions)
+        ]
+
+    def _reaches(
+        self,
+        tower: Tower,
+        coverage: TowerCoverage,
+        distance: float,
+        row: int,
+        positions: PositionCache,
+    ) -> bool:
+        """Whether a candidate is in range; only boats in an interval's fringe pay for the exact test."""
+        fringe = coverage.fringe
+        for lo, hi in coverage.intervals:
+            if lo + fringe <= distance <= hi - fringe:
+                return True
+        bx, by = positions[row]
+        return math.hypot((tower.x - bx) * WORLD_SCALE, (tower.y - by) * WORLD_SCALE) <= coverage.range_units
+
+    def _candidates(self, tower: Tower, fleet: Fleet) -> list[tuple[float, int]]:
+        """``(distance, -row)`` of every live member, dropping boats that left the fleet.
+
+        With the row negated, a reverse sort puts the furthest boat first and
+        breaks distance ties toward the lower row, as targeting does.
+        """
+        members = self._members.get(tower.tower_instance_id)
+        if not members:
+            return []
+        destroyed = fleet.destroyed
+        leaked = fleet.leaked
+        distances = fleet.distance
+        candidates: list[tuple[float, int]] = []
+        gone: list[EnemyBoat] = []
+        for view in members:
+            if view._fleet is not fleet:
+                gone.append(view)
+                continue
+            row = view._row
+            if not (destroyed[row] or leaked[row]):
+                candidates.append((distances[row], -row))
+        for view in gone:
+            del members[view]
+        return candidates
+
+    def _transition(self, old: int, new: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        before = self._covers[old] if old >= 0 else ()
+        after = self._covers[new]
+        return (
+            tuple(tower_instance_id for tower_instance_id in before if tower_instance_id not in after),
+            tuple(tower_instance_id for tower_instance_id in after if tower_instance_id not in before),
+        )
+
+    def _reset(self, fleet: Fleet, towers: list[Tower], report: bool) -> list[RangeChange]:
+        """Recompute edges and zones for ``towers`` and place every boat afresh.
+
+        Boats keep their standing across the rebuild: with ``report`` set,
+        only towers a live boat has newly entered or left are returned, so a
+        boat that stays in range of a tower gets no second entry.
+        """
+        previous: dict[EnemyBoat, list[str]] = {}
+        if fleet is self._fleet:
+            for tower_instance_id, members in self._members.items():
+                for view in members:
+                    previous.setdefault(view, []).append(tower_instance_id)
+        coverages: dict[str, TowerCoverage] = {}
+        spans: list[tuple[str, float, float]] = []
+        for tower in towers:
+            level_cfg = self._tower_configs[tower.tower_id].levels[tower.level - 1]
+            coverage = self.coverage.coverage_for(tower, level_cfg.range)
+            coverages[tower.tower_instance_id] = coverage
+            for lo, hi in coverage.intervals:
+                # Exits sit just past ``hi + fringe`` so a boat exactly on it stays a candidate.
+                exit_at = math.nextafter(hi + coverage.fringe, math.inf)
+                spans.append((tower.tower_instance_id, lo - coverage.fringe, exit_at))
+        edges = sorted({edge for _, entry_at, exit_at in spans for edge in (entry_at, exit_at)})
+        covers: list[set[str]] = [set() for _ in range(len(edges) + 1)]
+        for tower_instance_id, entry_at, exit_at in spans:
+            for zone in range(bisect_right(edges, entry_at), bisect_right(edges, exit_at)):
+                covers[zone].add(tower_instance_id)
+        self._fleet = fleet
+        # Read after ``coverage_for``, which may have built entries.
+        self._layout = (self.coverage.version, tuple(tower.tower_instance_id for tower in towers))
+        self._edges = edges
+        self._covers = [tuple(sorted(cover)) for cover in covers]
+        self._coverages = coverages
+        self._members = members = {tower.tower_instance_id: {} for tower in towers}
+        self._transitions = {}
+
+        changes: list[RangeChange] = []
+        zones = fleet.range_zone
+        uppers = fleet.range_edge
+        destroyed = fleet.destroyed
+        leaked = fleet.leaked
+        for row, (view, distance) in enumerate(zip(fleet.boats, fleet.distance)):
+            zone = bisect_right(edges, distance)
+            zones[row] = zone
+            uppers[row] = edges[zone] if zone < len(edges) else math.inf
+            cover = self._covers[zone]
+            for tower_instance_id in cover:
+                members[tower_instance_id][view] = None
+            if report and not (destroyed[row] or leaked[row]):
+                before = previous.get(view, ())
+                changes.extend(
+                    (tower_instance_id, view, False) for tower_instance_id in before if tower_instance_id not in cover
+                )
+                changes.extend(
+                    (tower_instance_id, view, True) for tower_instance_id in cover if tower_instance_id not in before
+                )
+        return changes
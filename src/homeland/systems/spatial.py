@@ -0,0 +1,71 @@
+"""Uniform-grid lookup of boats near a point on the map."""
+
+from __future__ import annotations
+
+from typing import Mapping
+import math
+
+from homeland.entities.enemy_boat import Fleet
+from homeland.systems.pathing import WORLD_SCALE
+
+
+class FleetGrid:
+    """Fleet rows bucketed into square cells of map coordinates.
+
+    Built once per tick from the rows alive at its start; boats destroyed
+    or leaked later in the tick stay bucketed and are skipped on lookup.
+    ``cell_units`` is the cell side in world units and should be close to
+    the radius most lookups use, so a lookup visits about nine cells.
+    ``examined`` counts the boats lookups have looked at so far.
+    """
+
+    def __init__(self, positions: Mapping[int, tuple[float, float]], rows: list[int], cell_units: float) -> None:
+        if cell_units <= 0:
+            raise ValueError("cell_units must be positive")
+        self._positions = positions
+        self._cell = cell_units / WORLD_SCALE
+        cell = self._cell
+        cells: dict[tuple[int, int], list[int]] = {}
+        for row in rows:
+            x, y = positions[row]
+            key = (math.floor(x / cell), math.floor(y / cell))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [row]
+            else:
+                bucket.append(row)
+        self._cells = cells
+        self.examined = 0
+
+    def nearest(self, fleet: Fleet, source: int, radius_units: float, count: int) -> list[int]:
+        """Up to ``count`` live rows other than ``source`` within ``radius_units`` of it.
+
+        Nearest first, ties going to the lower row, which is the order a
+        stable sort of the tick's rows by distance gives.
+        """
+        if count <= 0:
+            return []
+        positions = self._positions
+        cell = self._cell
+        sx, sy = positions[source]
+        # Padded so rounding cannot leave a boat right on the radius outside the cells visited.
+        reach = radius_units / WORLD_SCALE * (1 + 1e-9) + 1e-12
+        x_lo, x_hi = math.floor((sx - reach) / cell), math.floor((sx + reach) / cell)
+        y_lo, y_hi = math.floor((sy - reach) / cell), math.floor((sy + reach) / cell)
+        destroyed = fleet.destroyed
+        leaked = fleet.leaked
+        cells = self._cells
+        found: list[tuple[float, int]] = []
+        for cx in range(x_lo, x_hi + 1):
+            for cy in range(y_lo, y_hi + 1):
+                bucket = cells.get((cx, cy), ())
+                self.examined += len(bucket)
+                for row in bucket:
+                    if row == source or destroyed[row] or leaked[row]:
+                        continue
+                    bx, by = positions[row]
+                    dist = math.hypot((sx - bx) * WORLD_SCALE, (sy - by) * WORLD_SCALE)
+                    if dist <= radius_units:
+                        found.append((dist, row))
+        found.sort()
+        return [row for _, row in found[:count]]
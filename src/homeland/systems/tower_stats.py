@@ -0,0 +1,55 @@
+"""Tower configs compiled into flat per-level stat columns."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from homeland.config import TowerConfig
+from homeland.entities.tower import Tower
+
+
+class TowerStats:
+    """Every tower type's levels laid out back to back in parallel columns.
+
+    A tower's stats live at ``slot(tower)``: its type's offset plus its
+    level minus one. ``effect`` holds an index into ``effects``, the effect
+    names the table was compiled against, so callers dispatch on an int.
+    ``cooldown`` is the reload after an attack and ``chain_damage`` the
+    damage each chained hit deals after falloff.
+    """
+
+    def __init__(self, tower_configs: dict[str, TowerConfig], effects: Sequence[str]) -> None:
+        effect_ids = {name: index for index, name in enumerate(effects)}
+        self.effects = tuple(effects)
+        self.offsets: dict[str, int] = {}
+        self.damage: list[float] = []
+        self.range: list[float] = []
+        self.attack_speed: list[float] = []
+        self.cooldown: list[float] = []
+        self.effect: list[int] = []
+        self.burn_dps: list[float] = []
+        self.burn_duration: list[float] = []
+        self.slow_percent: list[float] = []
+        self.slow_duration: list[float] = []
+        self.chain_count: list[int] = []
+        self.chain_damage: list[float] = []
+        for tower_id, tower_cfg in tower_configs.items():
+            effect = effect_ids.get(tower_cfg.effect_type)
+            if effect is None:
+                raise ValueError(f"Unknown effect_type for {tower_id}: {tower_cfg.effect_type}")
+            self.offsets[tower_id] = len(self.damage)
+            for level_cfg in tower_cfg.levels:
+                self.damage.append(level_cfg.damage)
+                self.range.append(level_cfg.range)
+                self.attack_speed.append(level_cfg.attack_speed)
+                self.cooldown.append(1.0 / level_cfg.attack_speed if level_cfg.attack_speed > 0 else 1.0)
+                self.effect.append(effect)
+                self.burn_dps.append(level_cfg.burn_dps)
+                self.burn_duration.append(level_cfg.burn_duration)
+                self.slow_percent.append(level_cfg.slow_percent)
+                self.slow_duration.append(level_cfg.slow_duration)
+                self.chain_count.append(level_cfg.chain_count)
+                self.chain_damage.append(level_cfg.damage * (1.0 - (level_cfg.chain_falloff / 100.0)))
+
+    def slot(self, tower: Tower) -> int:
+        return self.offsets[tower.tower_id] + tower.level - 1
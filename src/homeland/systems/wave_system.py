@@ -2,20 +2,118 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterator
+import math
+
+from homeland.config import SPAWN_ORDERS, WaveConfig
+
+
+class SpawnTimeline:
+    """Which enemy type leaves the spawn point k-th, and when, without a queue.
+
+    Spawn ``k`` is due ``k * spawn_interval`` seconds after the wave starts.
+    The type of any spawn is computed from the composition directly, so
+    the timeline costs memory in the number of enemy types, not boats.
+    """
+
+    def __init__(self, config: WaveConfig) -> None:
+        if config.order not in SPAWN_ORDERS:
+            raise ValueError(f"Wave {config.wave_id}: unknown spawn order {config.order!r}")
+        self.interval = config.spawn_interval
+        self.order = config.order
+        self._types = [enemy_type for enemy_type, count in config.composition.items() if count > 0]
+        self._counts = [config.composition[enemy_type] for enemy_type in self._types]
+        self._ends = list(accumulate(self._counts))
+        self._pattern = list(config.pattern)
+        self.total = self._ends[-1] if self._ends else 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_from(0)
+
+    def enemy_at(self, index: int) -> str:
+        if not 0 <= index < self.total:
+            raise IndexError(f"Spawn index out of range: {index}")
+        if self.order == "grouped":
+            return self._types[bisect_right(self._ends, index)]
+        if self.order == "pattern":
+            return self._pattern[index % len(self._pattern)]
+        # Interleaved: round r visits, in composition order, every type with
+        # more than r boats. Find the round by bisecting on spawns before it.
+        low, high = 0, max(self._counts)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._before_round(mid) <= index:
+                low = mid
+            else:
+                high = mid - 1
+        offset = index - self._before_round(low)
+        for enemy_type, count in zip(self._types, self._counts):
+            if count > low:
+                if offset == 0:
+                    return enemy_type
+                offset -= 1
+        raise AssertionError("unreachable")
+
+    def iter_from(self, index: int) -> Iterator[str]:
+        """Enemy types from spawn ``index`` on, generated as they are needed."""
+        if self.order == "grouped":
+            group = bisect_right(self._ends, index)
+            for enemy_type, end in zip(self._types[group:], self._ends[group:]):
+                for _ in range(end - index):
+                    yield enemy_type
+                index = end
+        else:
+            for spawn in range(index, self.total):
+                yield self.enemy_at(spawn)
+
+    def spawn_time(self, index: int) -> float:
+        """Seconds after the wave starts that spawn ``index`` is due."""
+        return index * self.interval
+
+    def spawns_between(self, start: float, end: float) -> int:
+        """How many spawns fall due in ``[start, end)`` seconds after the wave starts."""
+        if end <= start:
+            return 0
+        return self._due_before(end) - self._due_before(start)
+
+    def _due_before(self, elapsed: float) -> int:
+        if elapsed <= 0:
+            return 0
+        if self.interval <= 0:
+            return self.total
+        return min(self.total, math.ceil(elapsed / self.interval))
 
-from homeland.config import WaveConfig
+    def _before_round(self, round_index: int) -> int:
+        return sum(min(count, round_index) for count in self._counts)
 
 
 @dataclass
 class WaveRuntime:
     config: WaveConfig
-    spawn_queue: list[str]
+    timeline: SpawnTimeline
+    spawned: int = 0
     spawn_cooldown: float = 0.0
 
+    def __post_init__(self) -> None:
+        self._upcoming = self.timeline.iter_from(self.spawned)
+
+    @property
+    def remaining(self) -> int:
+        return self.timeline.total - self.spawned
+
     @property
     def is_finished_spawning(self) -> bool:
-        return not self.spawn_queue
+        return self.spawned >= self.timeline.total
+
+    def next_enemy(self) -> str:
+        self.spawned += 1
+        return next(self._upcoming)
 
 
 class WaveSystem:
@@ -23,6 +121,7 @@ class WaveSystem:
         if not waves:
             raise ValueError("At least one wave is required")
         self._waves = sorted(waves, key=lambda w: w.wave_id)
+        self._timelines = [SpawnTimeline(wave) for wave in self._waves]
         self._wave_index = -1
         self._runtime: WaveRuntime | None = None
 
@@ -48,11 +147,7 @@ class WaveSystem:
         if not self.has_more_waves():
             raise ValueError("No more waves")
         self._wave_index += 1
-        config = self._waves[self._wave_index]
-        queue: list[str] = []
-        for enemy_type, count in config.composition.items():
-            queue.extend([enemy_type] * count)
-        runtime = WaveRuntime(config=config, spawn_queue=queue)
+        runtime = WaveRuntime(config=self._waves[self._wave_index], timeline=self._timelines[self._wave_index])
         self._runtime = runtime
         return runtime
 
@@ -60,15 +155,70 @@ class WaveSystem:
         if self._runtime is None:
             return []
 
+        runtime = self._runtime
         spawned: list[str] = []
-        self._runtime.spawn_cooldown -= dt
+        runtime.spawn_cooldown -= dt
 
-        while self._runtime.spawn_queue and self._runtime.spawn_cooldown <= 0:
-            spawned.append(self._runtime.spawn_queue.pop(0))
-            self._runtime.spawn_cooldown += self._runtime.config.spawn_interval
+        while runtime.spawn_cooldown <= 0 and not runtime.is_finished_spawning:
+            spawned.append(runtime.next_enemy())
+            runtime.spawn_cooldown += runtime.config.spawn_interval
 
         return spawned
 
+    def fork(self) -> WaveSystem:
+        """Copy with its own spawn position; wave configs and timelines are shared."""
+        waves = WaveSystem.__new__(WaveSystem)
+        waves._waves = self._waves
+        waves._timelines = self._timelines
+        waves._wave_index = self._wave_index
+        waves._runtime = None
+        if self._runtime is not None:
+            waves._resume(self._wave_index, self._runtime.spawned, self._runtime.spawn_cooldown)
+        return waves
+
+    def save(self) -> tuple[int, int | None, float]:
+        """Wave index plus the running wave's spawn count and cooldown."""
+        if self._runtime is None:
+            return self._wave_index, None, 0.0
+        return self._wave_index, self._runtime.spawned, self._runtime.spawn_cooldown
+
+    def restore(self, wave_index: int, spawned: int | None, spawn_cooldown: float) -> None:
+        """Return to a state captured by ``save``."""
+        if not -1 <= wave_index < len(self._waves):
+            raise ValueError(f"Wave index out of range: {wave_index}")
+        self._wave_index = wave_index
+        self._runtime = None
+        if spawned is not None:
+            self._resume(wave_index, spawned, spawn_cooldown)
+
+    def _resume(self, wave_index: int, spawned: int, spawn_cooldown: float) -> None:
+        self._runtime = WaveRuntime(
+            config=self._waves[wave_index],
+            timeline=self._timelines[wave_index],
+            spawned=spawned,
+            spawn_cooldown=spawn_cooldown,
+        )
+
+    def time_to_next_spawn(self) -> float:
+        """Seconds until ``tick`` next spawns a boat; infinite once every boat has spawned."""
+        if self._runtime is None or self._runtime.is_finished_spawning:
+            return math.inf
+        return max(self._runtime.spawn_cooldown, 0.0)
+
+    def spawns_within(self, seconds: float) -> int:
+        """How many boats ``tick`` will spawn over the next ``seconds``, without iterating."""
+        runtime = self._runtime
+        if runtime is None or seconds < 0:
+            return 0
+        # Remaining spawns are due at cooldown, cooldown + interval, ...
+        first = max(runtime.spawn_cooldown, 0.0)
+        if seconds < first:
+            return 0
+        interval = runtime.config.spawn_interval
+        if interval <= 0:
+            return runtime.remaining
+        return min(runtime.remaining, math.floor((seconds - first) / interval) + 1)
+
     def is_wave_complete(self, active_boats: int) -> bool:
         if self._runtime is None:
             return False
@@ -80,4 +230,4 @@ class WaveSystem:
     def boats_remaining_to_spawn(self) -> int:
         if self._runtime is None:
             return 0
-        return len(self._runtime.spawn_queue)
+        return self._runtime.remaining
@@ -0,0 +1,9 @@
+import pytest
+
+from homeland.config import CACHE_ENV
+
+
+@pytest.fixture(autouse=True)
+def _content_cache(tmp_path, monkeypatch) -> None:
+    # Compiled content goes to a per-test directory, never the user's cache.
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path / "content-cache"))
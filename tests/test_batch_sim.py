@@ -0,0 +1,51 @@
+import random
+
+from homeland.batch_sim import BatchedHomelandSim
+from homeland.config import load_game_content
+from homeland.game import HomelandGame
+from homeland.policy import BASELINE_PLAN, BuildPlan, play_map
+from homeland.stress_content import generate_content
+
+
+def _random_plan(rng: random.Random, slot_ids: list[str], tower_ids: list[str]) -> BuildPlan:
+    slots = rng.sample(slot_ids, rng.randint(1, 5))
+    return BuildPlan(
+        placements=[(slot_id, rng.choice(tower_ids)) for slot_id in slots],
+        upgrade_priority=rng.sample(slots, len(slots)),
+    )
+
+
+def test_batched_snapshots_match_individual_games() -> None:
+    content = load_game_content()
+    rng = random.Random(11)
+    slot_ids = [slot.slot_id for slot in content.map_config.build_slots]
+    tower_ids = list(content.tower_configs)
+    plans = [BASELINE_PLAN] + [_random_plan(rng, slot_ids, tower_ids) for _ in range(24)]
+
+    sim = BatchedHomelandSim(content, plans)
+    batched = sim.run()
+
+    assert all(sim.finished)
+    assert batched == [play_map(HomelandGame(content=content), plan) for plan in plans]
+
+
+def test_batched_snapshots_match_individual_games_on_stress_content() -> None:
+    content = generate_content(waypoints=40, slots=16, towers_per_effect=2, boats_per_wave=40, waves=4, seed=3)
+    rng = random.Random(5)
+    slot_ids = [slot.slot_id for slot in content.map_config.build_slots]
+    tower_ids = list(content.tower_configs)
+    lightning = [tower_id for tower_id, cfg in content.tower_configs.items() if cfg.effect_type == "lightning"]
+    plans = [BuildPlan(placements=[])]
+    for _ in range(15):
+        plan = _random_plan(rng, slot_ids, tower_ids)
+        # Every plan opens with a chaining tower so lightning hits land in every game.
+        plan.placements.insert(0, (rng.choice(slot_ids), rng.choice(lightning)))
+        plans.append(plan)
+
+    sim = BatchedHomelandSim(content, plans)
+    batched = sim.run()
+
+    assert all(sim.finished)
+    assert batched == [play_map(HomelandGame(content=content), plan) for plan in plans]
+    # Some games lose mid-wave, which drops their boats from the shared fleet.
+    assert {snapshot["coins"] < 0 for snapshot in batched} == {True, False}
@@ -0,0 +1,63 @@
+import time
+
+from homeland.bench import BENCHMARKS, Benchmark, compare, mann_whitney_greater, measure, run_benchmarks
+
+
+def test_report_has_docs_perf_shape() -> None:
+    report = run_benchmarks(names=["path_lookup", "select_target"], repeats=3)
+
+    assert set(report) >= {"startedAt", "endedAt", "repeats", "benchmarks"}
+    result = report["benchmarks"]["select_target"]
+    assert len(result["samples"]) == 3
+    assert set(result["summary"]) >= {"sampleSize", "min", "p50", "p95", "max"}
+    assert {"micro", "macro"} <= {bench.kind for bench in BENCHMARKS.values()}
+
+
+def test_paired_benchmarks_report_a_speedup(monkeypatch) -> None:
+    monkeypatch.setitem(BENCHMARKS, "slow_way", Benchmark("slow_way", "macro", lambda: lambda: time.sleep(0.004)))
+    monkeypatch.setitem(
+        BENCHMARKS, "fast_way", Benchmark("fast_way", "macro", lambda: lambda: time.sleep(0.001), versus="slow_way")
+    )
+
+    alone = run_benchmarks(names=["fast_way"], repeats=2)
+    paired = run_benchmarks(names=["slow_way", "fast_way"], repeats=2)
+
+    assert "speedup" not in alone["benchmarks"]["fast_way"]
+    speedup = paired["benchmarks"]["fast_way"]["speedup"]
+    assert speedup["versus"] == "slow_way" and speedup["ratio"] > 1.5
+    assert BENCHMARKS["batch_runs_16"].versus in BENCHMARKS
+
+
+def test_compare_flags_only_significant_slowdowns() -> None:
+    def report(samples):
+        return {"benchmarks": {"tick": {"summary": {"p50": sorted(samples)[len(samples) // 2]}, "samples": samples}}}
+
+    baseline = report([10.0, 10.2, 9.9, 10.1, 10.0, 10.3, 9.8, 10.1])
+    slower = report([12.0, 12.1, 11.9, 12.3, 12.0, 12.2, 11.8, 12.1])
+    noisy = report([10.1, 10.0, 10.2, 9.9, 10.3, 10.0, 9.9, 10.2])
+
+    assert compare(baseline, slower)[0]["regression"]
+    assert not compare(baseline, noisy)[0]["regression"]
+    assert not compare(slower, baseline)[0]["regression"]
+    assert mann_whitney_greater([2.0, 3.0], [0.0, 1.0]) < mann_whitney_greater([0.0, 1.0], [2.0, 3.0])
+
+
+def test_compare_reports_benchmarks_on_one_side_only() -> None:
+    def report(**p50s):
+        return {"benchmarks": {name: {"summary": {"p50": p50}, "samples": [p50]} for name, p50 in p50s.items()}}
+
+    rows = compare(report(tick=1.0, retired=2.0), report(tick=1.0, added=3.0))
+
+    assert [(row["name"], row["status"]) for row in rows] == [
+        ("tick", "compared"),
+        ("added", "no baseline"),
+        ("retired", "not run"),
+    ]
+    assert rows[1]["currentP50"] == 3.0 and rows[1]["baselineP50"] is None
+    assert not any(row["regression"] for row in rows)
+
+
+def test_memory_benchmarks_record_returned_values() -> None:
+    bench = Benchmark("resident", "memory", lambda: lambda: 240.0, unit="B/boat")
+
+    assert measure(bench, repeats=2) == [240.0, 240.0]
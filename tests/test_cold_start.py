@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Interpreter start to first simulated tick, best of a few warm-cache runs.
+# docs/perf tracks the web runtime's time to interactive at about 80 ms p50
+# and 180 ms p95; the headless core should stay in the same range.
+COLD_START_BUDGET_MS = 150
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+FIRST_TICK = """
+from homeland.game import HomelandGame
+game = HomelandGame(event_history=0)
+game.build_tower("s03", "arrow")
+game.start_next_wave()
+game.tick(0.1)
+"""
+
+
+def _run(args: list[str], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], env=env, check=True, capture_output=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def test_cold_start_to_first_tick_is_within_budget(tmp_path) -> None:
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), HOMELAND_CONTENT_CACHE=str(tmp_path))
+    _run(["-c", FIRST_TICK], env)  # warms the compiled content cache
+    best = min(_run(["-c", FIRST_TICK], env) for _ in range(3))
+    assert best < COLD_START_BUDGET_MS, f"cold start took {best:.1f} ms"
+
+
+def test_cli_module_defers_engine_import() -> None:
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    probe = "import sys; from homeland.__main__ import main; print('homeland.game' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", probe], env=env, check=True, capture_output=True, text=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_timing_flag_reports_each_phase(capsys) -> None:
+    from homeland.__main__ import main
+
+    main(["--timing"])
+    err = capsys.readouterr().err
+    for phase in ("import=", "content=", "simulation=", "total="):
+        assert phase in err
@@ -1,8 +1,11 @@
-from homeland.config import TowerLevel, TowerConfig, Waypoint
+import pytest
+
+from homeland.config import EFFECT_TYPES, TowerLevel, TowerConfig, Waypoint
 from homeland.entities.enemy_boat import EnemyBoat
 from homeland.entities.tower import Tower
-from homeland.systems.combat_system import CombatSystem
+from homeland.systems.combat_system import EFFECT_HANDLERS, CombatSystem
 from homeland.systems.pathing import Path
+from homeland.systems.tower_stats import TowerStats
 
 
 def test_fire_burn_refresh_not_additive() -> None:
@@ -93,3 +96,64 @@ def test_lightning_chain_hits_secondary_target() -> None:
 
     # Targeting favors the boat closest to exit; chain hits the second target.
     assert sorted([round(primary.hp, 1), round(secondary.hp, 1)]) == [142.0, 162.3]
+
+
+def _tower_config(tower_id: str, effect_type: str, levels: int = 1) -> TowerConfig:
+    return TowerConfig(
+        tower_id=tower_id,
+        display_name=tower_id,
+        effect_type=effect_type,
+        levels=[
+            TowerLevel(level=level, cost=100, damage=10.0 * level, range=2.8, attack_speed=0.5 * level)
+            for level in range(1, levels + 1)
+        ],
+    )
+
+
+def test_tower_stats_lay_levels_out_by_type() -> None:
+    configs = {"fire": _tower_config("fire", "fire", levels=2), "wind": _tower_config("wind", "wind", levels=3)}
+    stats = TowerStats(configs, ("physical", "fire", "wind"))
+    tower = Tower(tower_instance_id="t1", tower_id="wind", slot_id="s1", x=0.0, y=0.0, level=2)
+
+    slot = stats.slot(tower)
+
+    assert slot == 3
+    assert stats.damage[slot] == 20.0
+    assert stats.cooldown[slot] == 1.0
+    assert stats.effects[stats.effect[slot]] == "wind"
+
+
+def test_unknown_effect_type_is_rejected() -> None:
+    with pytest.raises(ValueError, match="frost"):
+        CombatSystem({"frost": _tower_config("frost", "frost")})
+
+
+def test_every_content_effect_type_has_a_handler() -> None:
+    assert set(EFFECT_HANDLERS) == set(EFFECT_TYPES)
+
+
+def test_extra_effect_runs_after_the_direct_hit() -> None:
+    hits: list[tuple[int, float]] = []
+    effects = {
+        **EFFECT_HANDLERS,
+        "frost": lambda system, volley, slot, target: hits.append((target, volley.fleet.hp[target])),
+    }
+    system = CombatSystem({"frost": _tower_config("frost", "frost")}, effects=effects)
+    path = Path([Waypoint(x=0.0, y=0.5), Waypoint(x=1.0, y=0.5)])
+    tower = Tower(tower_instance_id="t1", tower_id="frost", slot_id="s1", x=0.25, y=0.5)
+    boat = EnemyBoat(
+        boat_id="b1",
+        enemy_type="raider",
+        max_hp=200,
+        hp=200,
+        speed=0.1,
+        coin_reward=0,
+        xp_reward=0,
+        distance=2.3,
+    )
+
+    result = system.tick(0.1, [tower], [boat], path)
+
+    assert result.attacks_fired == 1
+    assert hits == [(0, 190.0)]
+    assert "frost" not in EFFECT_HANDLERS
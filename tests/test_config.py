@@ -1,4 +1,11 @@
-from homeland.config import load_game_content
+import dataclasses
+import json
+import shutil
+
+import pytest
+
+from homeland import config
+from homeland.config import CACHE_ENV, DEFAULT_DATA_DIR, available_maps, load_game_content
 
 
 def test_load_content_success() -> None:
@@ -11,3 +18,89 @@ def test_load_content_success() -> None:
     assert "scout" in content.enemy_configs
     assert len(content.waves) == 5
     assert content.progression.xp_per_wave_clear == 25
+
+
+def _copy_data(tmp_path):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DEFAULT_DATA_DIR, data_dir)
+    return data_dir
+
+
+def test_compiled_content_is_cached_and_rebuilt_on_change(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_ENV, str(cache_dir))
+    monkeypatch.setattr(config, "_compiled", {})
+    data_dir = _copy_data(tmp_path)
+
+    first = load_game_content(data_dir)
+    assert load_game_content(data_dir) is first
+    assert len(list(cache_dir.glob("map_01_river_bend-*.pickle"))) == 1
+    monkeypatch.setattr(config, "_compiled", {})
+    assert load_game_content(data_dir) == first
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.map_config.starting_coins = 0  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        first.tower_configs["arrow"] = first.tower_configs["arrow"]  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        first.tower_configs["arrow"].levels.append(first.tower_configs["arrow"].levels[0])  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        first.waves[0].composition["scout"] = 0  # type: ignore[index]
+
+    map_path = data_dir / "maps" / "map_01_river_bend.json"
+    raw = json.loads(map_path.read_text())
+    raw["starting_coins"] = 1234
+    map_path.write_text(json.dumps(raw))
+
+    stale = next(cache_dir.glob("map_01_river_bend-*.pickle"))
+    sibling = cache_dir / "map_01_river_bend-side-0123.pickle"
+    sibling.write_bytes(b"")
+    changed = load_game_content(data_dir)
+    assert changed.map_config.starting_coins == 1234
+    # The superseded artifact is pruned; a longer map id sharing the prefix is not.
+    artifacts = set(cache_dir.glob("map_01_river_bend-*.pickle"))
+    assert stale not in artifacts
+    assert sibling in artifacts
+    assert len(artifacts) == 2
+
+
+def test_any_map_in_the_data_dir_can_be_loaded(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv(CACHE_ENV, "")
+    data_dir = _copy_data(tmp_path)
+    raw = json.loads((data_dir / "maps" / "map_01_river_bend.json").read_text())
+    raw["map_id"] = "map_01_side_channel"
+    raw["starting_coins"] = 500
+    (data_dir / "maps" / "map_01_side_channel.json").write_text(json.dumps(raw))
+
+    assert available_maps(data_dir) == ["map_01_river_bend", "map_01_side_channel"]
+    content = load_game_content(data_dir, map_id="map_01_side_channel")
+    assert content.map_config.starting_coins == 500
+    assert len(content.waves) == 5
+    with pytest.raises(ValueError, match="Unknown map"):
+        load_game_content(data_dir, map_id="map_99_missing")
+
+
+def test_unknown_effect_type_is_rejected_at_load(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv(CACHE_ENV, "")
+    data_dir = _copy_data(tmp_path)
+    towers_path = data_dir / "towers" / "towers.json"
+    towers = json.loads(towers_path.read_text())
+    towers[0]["effect_type"] = "frost"
+    towers_path.write_text(json.dumps(towers))
+
+    with pytest.raises(ValueError, match="Unknown effect_type for arrow: frost"):
+        load_game_content(data_dir)
+
+
+@pytest.mark.parametrize("payload", [b"", b"\x80\x05\x95", b"not a pickle", b"\x80\x04K\x01."])
+def test_unreadable_artifacts_are_rebuilt(tmp_path, monkeypatch, payload) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_ENV, str(cache_dir))
+    monkeypatch.setattr(config, "_compiled", {})
+    data_dir = _copy_data(tmp_path)
+    expected = load_game_content(data_dir)
+    artifact = next(cache_dir.glob("map_01_river_bend-*.pickle"))
+    artifact.write_bytes(payload)
+
+    monkeypatch.setattr(config, "_compiled", {})
+    assert load_game_content(data_dir) == expected
+    assert artifact.read_bytes() != payload
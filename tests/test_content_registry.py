@@ -0,0 +1,50 @@
+import json
+import shutil
+
+import pytest
+
+from homeland.config import DEFAULT_DATA_DIR
+from homeland.content_registry import MANIFEST_NAME, ContentRegistry
+
+
+def _campaign(tmp_path, coins: dict[str, int]):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DEFAULT_DATA_DIR, data_dir)
+    base = json.loads((data_dir / "maps" / "map_01_river_bend.json").read_text())
+    (data_dir / "maps" / "map_01_river_bend.json").unlink()
+    entries = []
+    for map_id, starting_coins in coins.items():
+        (data_dir / "maps" / f"{map_id}.json").write_text(json.dumps({**base, "map_id": map_id, "starting_coins": starting_coins}))
+        entries.append({"map_id": map_id, "map": f"maps/{map_id}.json", "waves": "waves/map_01_waves.json"})
+    manifest = json.loads((data_dir / MANIFEST_NAME).read_text())
+    manifest["maps"] = entries
+    (data_dir / MANIFEST_NAME).write_text(json.dumps(manifest))
+    return data_dir
+
+
+def test_registry_loads_maps_lazily_and_evicts_least_recent(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HOMELAND_CONTENT_CACHE", "")
+    data_dir = _campaign(tmp_path, {"map_a": 100, "map_b": 200, "map_c": 300})
+    registry = ContentRegistry(data_dir, max_maps=2)
+
+    assert registry.map_ids == ["map_a", "map_b", "map_c"]
+    assert registry.loaded == []
+
+    map_a = registry.get("map_a")
+    assert map_a.map_config.starting_coins == 100
+    assert registry.get("map_b").map_config.starting_coins == 200
+    assert registry.get("map_a") is map_a
+    registry.get("map_c")
+
+    assert registry.loaded == ["map_a", "map_c"]
+    with pytest.raises(ValueError, match="Unknown map"):
+        registry.get("map_z")
+
+
+def test_registry_indexes_by_convention_without_manifest(tmp_path) -> None:
+    data_dir = tmp_path / "data"
+    shutil.copytree(DEFAULT_DATA_DIR, data_dir)
+    (data_dir / MANIFEST_NAME).unlink()
+
+    assert ContentRegistry(data_dir).map_ids == ["map_01_river_bend"]
+    assert ContentRegistry().get("map_01_river_bend").map_config.map_id == "map_01_river_bend"
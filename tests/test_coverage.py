@@ -0,0 +1,174 @@
+import math
+import random
+
+from homeland.config import TowerConfig, TowerLevel, Waypoint
+from homeland.entities.enemy_boat import Fleet
+from homeland.entities.tower import Tower
+from homeland.systems.combat_system import CombatSystem
+from homeland.systems.coverage import CoverageIndex, TowerCoverage
+from homeland.systems.pathing import Path
+from homeland.systems.range_tracker import RangeTracker
+
+
+def _spawn(fleet: Fleet, idx: int, distance: float) -> None:
+    fleet.spawn(
+        boat_id=f"b{idx}",
+        enemy_type="scout",
+        max_hp=100,
+        hp=100,
+        speed=1.0,
+        coin_reward=0,
+        xp_reward=0,
+        distance=distance,
+    )
+
+
+def test_coverage_targeting_matches_brute_force_scan() -> None:
+    rng = random.Random(20260226)
+    arrow = TowerConfig(
+        tower_id="arrow",
+        display_name="Arrow Tower",
+        effect_type="physical",
+        levels=[TowerLevel(level=1, cost=1, damage=1, range=2.8, attack_speed=1.0)],
+    )
+    system = CombatSystem({"arrow": arrow})
+
+    for _ in range(60):
+        points = [Waypoint(x=rng.random(), y=rng.random()) for _ in range(rng.randint(2, 12))]
+        path = Path(points)
+        coverage = CoverageIndex(path, {"arrow": arrow})
+
+        for tower_idx in range(8):
+            tower = Tower(
+                tower_instance_id=f"t{tower_idx}",
+                tower_id="arrow",
+                slot_id="s",
+                x=rng.random(),
+                y=rng.random(),
+            )
+            range_units = rng.choice([0.5, 1.5, 2.8, 4.0, 9.0])
+            tower_coverage = coverage.coverage_for(tower, range_units)
+
+            distances = [rng.uniform(-0.5, path.length + 0.5) for _ in range(40)]
+            # Boats sitting exactly on interval edges and sharing distances.
+            for lo, hi in tower_coverage.intervals:
+                distances.extend(d for d in (lo, hi) if abs(d) != float("inf"))
+            distances.extend(distances[:5])
+            fleet = Fleet()
+            for i, distance in enumerate(distances):
+                _spawn(fleet, i, distance)
+            rows = list(range(len(fleet)))
+            positions = dict(zip(rows, path.positions_at_distances(distances)))
+            ranked = sorted(rows, key=distances.__getitem__)
+            # Boats killed earlier in the same tick stay in the ranked list.
+            for row in rng.sample(rows, 6):
+                fleet.destroyed[row] = True
+
+            expected = system._select_target(tower, range_units, fleet, rows, positions)
+            actual = system._select_target_indexed(
+                tower,
+                tower_coverage,
+                fleet,
+                ranked,
+                [distances[row] for row in ranked],
+                positions,
+            )
+            assert actual == expected
+
+
+def _scan_entry(coverages: list[TowerCoverage], distance: float) -> float:
+    # The per-tower interval walk ``time_to_next_event`` used to run.
+    nearest = math.inf
+    for coverage in coverages:
+        fringe = coverage.fringe
+        for lo, hi in coverage.intervals:
+            if distance < lo + fringe:
+                nearest = min(nearest, lo + fringe)
+                break
+            if distance <= hi - fringe:
+                break
+    return nearest
+
+
+def test_entry_table_matches_scanning_every_tower() -> None:
+    rng = random.Random(20261016)
+    configs = {
+        "arrow": TowerConfig(
+            tower_id="arrow",
+            display_name="Arrow Tower",
+            effect_type="physical",
+            levels=[TowerLevel(level=1, cost=1, damage=1, range=2.8, attack_speed=1.0)],
+        )
+    }
+
+    for _ in range(40):
+        path = Path([Waypoint(x=rng.random(), y=rng.random()) for _ in range(rng.randint(2, 12))])
+        coverage = CoverageIndex(path, configs)
+        towers = [
+            Tower(tower_instance_id=f"t{idx}", tower_id="arrow", slot_id="s", x=rng.random(), y=rng.random())
+            for idx in range(rng.randint(1, 6))
+        ]
+        ready = rng.sample(towers, rng.randint(1, len(towers)))
+        coverages = [coverage.coverage_for(tower, 2.8) for tower in ready]
+
+        distances = [rng.uniform(-0.5, path.length + 0.5) for _ in range(60)]
+        # Boats exactly on, and one step either side of, every edge the scan compares.
+        for item in coverages:
+            for lo, hi in item.intervals:
+                for edge in (lo + item.fringe, hi - item.fringe):
+                    if abs(edge) != math.inf:
+                        distances.extend((math.nextafter(edge, -math.inf), edge, math.nextafter(edge, math.inf)))
+
+        table = coverage.entry_table(ready)
+        assert table.targets_for(distances) == [_scan_entry(coverages, distance) for distance in distances]
+        assert coverage.entry_table(ready) is table
+
+
+def test_range_tracker_follows_moving_boats() -> None:
+    rng = random.Random(7)
+    configs = {
+        f"arrow_{range_units}": TowerConfig(
+            tower_id=f"arrow_{range_units}",
+            display_name="Arrow Tower",
+            effect_type="physical",
+            levels=[TowerLevel(level=1, cost=1, damage=1, range=range_units, attack_speed=1.0)],
+        )
+        for range_units in (1.5, 2.8, 4.0)
+    }
+    path = Path([Waypoint(x=0.0, y=0.2), Waypoint(x=0.9, y=0.4), Waypoint(x=0.1, y=0.8), Waypoint(x=1.0, y=0.9)])
+    built = [
+        Tower(tower_instance_id=f"t{idx}", tower_id=tower_id, slot_id=f"s{idx}", x=rng.random(), y=rng.random())
+        for idx, tower_id in enumerate(configs)
+    ]
+    system = CombatSystem(configs)
+    ranges = RangeTracker(CoverageIndex(path, configs), configs)
+    fleet = Fleet()
+    inside: set[tuple[str, str]] = set()
+    crossings = 0
+
+    for step in range(400):
+        # Selling and rebuilding a tower rebuilds the tracker mid-wave.
+        towers = built[1:] if 150 <= step < 250 else built
+        if step % 10 == 0:
+            _spawn(fleet, step, 0.0)
+            fleet.speed[-1] = rng.uniform(0.5, 2.0)
+        for tower_instance_id, boat, entered in ranges.update(fleet, towers, report=True):
+            key = (tower_instance_id, boat.boat_id)
+            assert (key in inside) != entered
+            (inside.add if entered else inside.discard)(key)
+            crossings += 1
+
+        rows = list(range(len(fleet)))
+        positions = dict(zip(rows, path.positions_at_distances(fleet.distance)))
+        for tower in towers:
+            range_units = configs[tower.tower_id].levels[0].range
+            boats = ranges.boats_in_range(tower, fleet, positions)
+            expected = system._select_target(tower, range_units, fleet, rows, positions)
+            assert (boats[0]._row if boats else None) == expected
+            assert all((tower.tower_instance_id, boat.boat_id) in inside for boat in boats)
+
+        leaked = fleet.step_movement(0.1, path.length)
+        fleet.compact([not gone for gone in leaked])
+        inside = {key for key in inside if key[1] in fleet.boat_id}
+
+    assert crossings > 0
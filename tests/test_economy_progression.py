@@ -1,4 +1,7 @@
+from homeland.game import HomelandGame
+from homeland.policy import BASELINE_PLAN, play_map
 from homeland.systems.economy_system import EconomySystem
+from homeland.systems.ledger import Ledger
 from homeland.systems.progression_system import ProgressionSystem
 
 
@@ -19,3 +22,41 @@ def test_progression_floor_at_zero() -> None:
     assert progression.xp == 0
     progression.add_xp(12)
     assert progression.has_unlock(10)
+
+
+def test_ledger_settles_like_one_at_a_time_updates() -> None:
+    economy = EconomySystem(coins=10)
+    progression = ProgressionSystem(xp=5)
+    ledger = Ledger()
+    ledger.credit(coins=4, xp=3, kills=2)
+    ledger.debit(coins=30, xp=6, leaks=2)
+    assert ledger.project(economy.coins, progression.xp) == (-16, 2)
+
+    payload = ledger.settle(economy, progression)
+
+    assert (economy.coins, progression.xp) == (-16, 2)
+    assert payload == {"kills": 2, "leaks": 2, "coins_delta": -26, "xp_delta": -3, "coins": -16, "xp": 2}
+    assert not ledger.pending
+    ledger.debit(coins=0, xp=50)
+    ledger.settle(economy, progression)
+    assert progression.xp == 0
+
+
+def test_game_without_entity_events_reports_one_settlement_per_tick() -> None:
+    detailed = HomelandGame(event_history=None)
+    batched = HomelandGame(event_history=None, entity_events=False)
+    play_map(detailed, BASELINE_PLAN)
+    play_map(batched, BASELINE_PLAN)
+
+    names = {event.name for event in batched.events.events}
+    settled = [event.payload for event in batched.events.events if event.name == "ledger_settled"]
+    kills = sum(1 for event in detailed.events.events if event.name == "enemy_killed")
+
+    assert batched.snapshot() == detailed.snapshot()
+    assert not names & {"enemy_killed", "enemy_leaked"}
+    assert sum(payload["kills"] for payload in settled) == kills > 0
+    assert all(
+        event.payload["reason"] not in {"enemy_kill", "enemy_leak"}
+        for event in batched.events.events
+        if event.name in {"coins_changed", "xp_changed"}
+    )
@@ -0,0 +1,57 @@
+from homeland.core.event_bus import WILDCARD, EventBus
+from homeland.game import HomelandGame
+from homeland.policy import BASELINE_PLAN, play_map
+
+
+def test_history_is_bounded() -> None:
+    bus = EventBus(history=3)
+    for index in range(10):
+        bus.emit("tick", index=index)
+
+    assert [event.payload["index"] for event in bus.events] == [7, 8, 9]
+    assert len(bus.drain()) == 3
+    assert bus.events == []
+
+
+def test_subscribers_receive_events_by_name_and_wildcard() -> None:
+    bus = EventBus(history=0)
+    kills: list[str] = []
+    seen: list[str] = []
+    unsubscribe = bus.subscribe("enemy_killed", lambda event: kills.append(event.payload["boat_id"]))
+    bus.subscribe(WILDCARD, lambda event: seen.append(event.name))
+
+    bus.emit("enemy_killed", boat_id="boat_0001")
+    bus.emit("coins_changed", delta=5)
+    unsubscribe()
+    bus.emit("enemy_killed", boat_id="boat_0002")
+
+    assert kills == ["boat_0001"]
+    assert seen == ["enemy_killed", "coins_changed", "enemy_killed"]
+    assert bus.events == []
+
+
+def test_lazy_payload_is_not_built_without_listeners() -> None:
+    bus = EventBus(history=0)
+    built: list[bool] = []
+
+    def build() -> dict[str, int]:
+        built.append(True)
+        return {"value": 1}
+
+    bus.emit_lazy("combat_tick", build)
+    assert not bus.wants("combat_tick")
+    assert built == []
+
+    received: list[int] = []
+    bus.subscribe("combat_tick", lambda event: received.append(event.payload["value"]))
+    bus.emit_lazy("combat_tick", build)
+    assert received == [1]
+
+
+def test_game_outcome_does_not_depend_on_telemetry() -> None:
+    recorded = play_map(HomelandGame(), BASELINE_PLAN)
+    silent_game = HomelandGame(event_history=0)
+    silent = play_map(silent_game, BASELINE_PLAN)
+
+    assert silent == recorded
+    assert silent_game.events.events == []
@@ -0,0 +1,86 @@
+import random
+
+from homeland.entities.enemy_boat import Fleet
+
+
+def _spawn(fleet: Fleet, boat_id: str, distance: float) -> None:
+    fleet.spawn(
+        boat_id=boat_id,
+        enemy_type="scout",
+        max_hp=100,
+        hp=100,
+        speed=1.0,
+        coin_reward=5,
+        xp_reward=1,
+        distance=distance,
+    )
+
+
+def test_compact_keeps_views_bound_to_surviving_rows() -> None:
+    fleet = Fleet()
+    for idx, distance in enumerate([1.0, 2.0, 3.0]):
+        _spawn(fleet, f"b{idx}", distance)
+    first, middle, last = fleet.boats
+
+    assert middle.apply_damage(150)
+    fleet.compact([not destroyed for destroyed in fleet.destroyed])
+
+    assert len(fleet) == 2
+    assert fleet.boats == [first, last]
+    assert fleet.boat_id == ["b0", "b2"]
+    last.distance = 4.5
+    assert fleet.distance[1] == 4.5
+
+    # Removed boats keep their final state after leaving the fleet.
+    assert middle.destroyed
+    assert middle.hp == 0
+    assert middle.boat_id == "b1"
+
+
+def test_batched_kernels_match_scalar_boat_updates() -> None:
+    rng = random.Random(7)
+    batched = Fleet()
+    scalar = Fleet()
+    for idx in range(200):
+        values = dict(
+            boat_id=f"b{idx}",
+            enemy_type="raider",
+            max_hp=320,
+            hp=rng.uniform(1, 320),
+            speed=rng.uniform(0.5, 1.5),
+            coin_reward=0,
+            xp_reward=0,
+            distance=rng.uniform(0, 20),
+            burn_dps=rng.choice([0.0, 12.0, 24.0]),
+            burn_duration_left=rng.choice([0.0, 0.05, 0.1, 2.5]),
+            slow_percent=rng.choice([0.0, 22.0, 95.0]),
+            slow_duration_left=rng.choice([0.0, 0.1, 1.8]),
+        )
+        batched.spawn(**values)
+        scalar.spawn(**values)
+
+    for _ in range(30):
+        killed = batched.step_effects(0.1)
+        assert killed == [scalar.tick_effects(row, 0.1) for row in range(len(scalar))]
+        leaked = batched.step_movement(0.1, 24.0)
+        assert leaked == [scalar.move(row, 0.1, 24.0) for row in range(len(scalar))]
+        for name in ("hp", "distance", "burn_dps", "burn_duration_left", "slow_percent", "slow_duration_left"):
+            assert getattr(batched, name) == getattr(scalar, name)
+        assert batched.destroyed == scalar.destroyed
+        assert batched.leaked == scalar.leaked
+
+
+def test_game_boats_keep_integer_ids_and_slotted_views() -> None:
+    from homeland.game import HomelandGame
+
+    game = HomelandGame(event_history=None)
+    game.start_next_wave()
+    while not game.fleet.boat_id:
+        game.tick(0.1)
+    boat = game.fleet.boats[0]
+
+    assert game.fleet.boat_id[0] == 1
+    assert boat.boat_id == "boat_0001"
+    assert not hasattr(boat, "__dict__")
+    spawned = [event for event in game.events.events if event.name == "enemy_spawned"]
+    assert spawned[0].payload["boat_id"] == "boat_0001"
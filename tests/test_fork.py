@@ -0,0 +1,53 @@
+from homeland.core.game_state import GameState
+from homeland.game import HomelandGame
+from homeland.policy import BASELINE_PLAN
+
+
+def _play(game: HomelandGame) -> tuple:
+    guard = 0
+    while game.state != GameState.MAP_RESULT and guard < 5000:
+        if game.state == GameState.BUILD_PHASE:
+            BASELINE_PLAN.upgrade_one(game)
+            game.start_next_wave()
+        game.tick(0.1)
+        guard += 1
+    return game.state, game.economy.coins, game.progression.xp
+
+
+def test_fork_mid_wave_plays_to_the_same_result() -> None:
+    game = HomelandGame()
+    BASELINE_PLAN.place_towers(game)
+    game.start_next_wave()
+    for _ in range(150):
+        game.tick(0.1)
+    assert len(game.fleet) > 0
+
+    fork = game.fork()
+    assert fork.content is game.content
+    assert _play(fork) == _play(game)
+
+
+def test_fork_is_independent_of_the_original() -> None:
+    game = HomelandGame()
+    BASELINE_PLAN.place_towers(game)
+    game.start_next_wave()
+    for _ in range(100):
+        game.tick(0.1)
+    coins = game.economy.coins
+    boats = len(game.fleet)
+    hp = list(game.fleet.hp)
+    levels = {tower.slot_id: tower.level for tower in game.placement.all_towers()}
+    events = len(game.events.events)
+
+    fork = game.fork()
+    assert fork.events.events == []
+    for _ in range(50):
+        fork.tick(0.1)
+    BASELINE_PLAN.upgrade_one(fork)
+
+    assert fork.events.events
+    assert len(game.events.events) == events
+    assert game.economy.coins == coins
+    assert len(game.fleet) == boats
+    assert game.fleet.hp == hp
+    assert {tower.slot_id: tower.level for tower in game.placement.all_towers()} == levels
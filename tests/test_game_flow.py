@@ -13,6 +13,7 @@ from homeland.config import (
 )
 from homeland.core.game_state import GameState
 from homeland.game import HomelandGame
+from homeland.policy import BASELINE_PLAN
 
 
 def _mini_content() -> GameContent:
@@ -68,3 +69,70 @@ def test_game_completes_and_rewards_progression() -> None:
     assert game.state == GameState.MAP_RESULT
     assert game.economy.coins == 95
     assert game.progression.xp == 12
+
+
+def test_event_driven_advance_matches_fixed_step_outcome() -> None:
+    game = HomelandGame(content=_mini_content())
+    game.build_tower("s1", "arrow")
+    game.start_next_wave()
+
+    elapsed = game.advance()
+
+    assert game.state == GameState.MAP_RESULT
+    assert game.economy.coins == 95
+    assert game.progression.xp == 12
+    assert elapsed < 0.1
+
+
+def test_run_until_event_jumps_to_next_leak() -> None:
+    game = HomelandGame(content=_mini_content())
+    game.start_next_wave()
+
+    game.run_until_event()
+    assert len(game.fleet) == 1
+    # Path is 10 units long and the scout moves 0.2 units per second.
+    assert abs(game.time_to_next_event() - 50.0) < 1e-6
+
+    game.run_until_event(max_time=20.0)
+    assert abs(game.fleet.distance[0] - 4.0) < 1e-9
+
+    game.advance()
+    assert game.state == GameState.MAP_RESULT
+    assert game.economy.coins == 90
+
+
+def test_range_events_pair_up_per_tower_and_boat() -> None:
+    game = HomelandGame()
+    BASELINE_PLAN.place_towers(game)
+    entered: set[tuple[str, str]] = set()
+    game.events.subscribe("boat_entered_range", lambda event: entered.add(tuple(event.payload.values())))
+    left: list[tuple[str, str]] = []
+    game.events.subscribe("boat_left_range", lambda event: left.append(tuple(event.payload.values())))
+    game.start_next_wave()
+    for _ in range(300):
+        game.tick(0.1)
+        slot_id = game.placement.all_towers()[0].slot_id
+        assert all(boat in game.fleet.boats for boat in game.boats_in_range(slot_id))
+
+    assert entered and left
+    assert set(left) <= entered
+
+
+def test_upgraded_towers_fire_with_their_new_level() -> None:
+    game = HomelandGame(content=_mini_content())
+    game.build_tower("s1", "arrow")
+    tower = game.placement.get_tower("s1")
+    assert game.combat.stats.damage[tower.stats_slot] == 80
+    game.upgrade_tower("s1")
+    assert game.combat.stats.damage[tower.stats_slot] == 90
+
+    checkpoint = game.checkpoint()
+    assert "stats_slot" not in checkpoint.towers[0]
+    game.restore(checkpoint)
+    restored = game.placement.get_tower("s1")
+    assert restored.stats_slot == -1
+    game.start_next_wave()
+    for _ in range(50):
+        game.tick(0.1)
+    assert restored.stats_slot == game.combat.stats.slot(restored)
+    assert game.combat.stats.damage[restored.stats_slot] == 90
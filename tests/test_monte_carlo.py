@@ -0,0 +1,39 @@
+import json
+
+from homeland.__main__ import main
+from homeland.monte_carlo import percentile, run_monte_carlo, summarize
+
+
+def test_runs_are_deterministic_across_worker_counts() -> None:
+    serial = run_monte_carlo(runs=6, policy="random", seed=7, workers=1)
+    pooled = run_monte_carlo(runs=6, policy="random", seed=7, workers=2)
+
+    assert serial == pooled
+    assert [result.seed for result in serial] == [7, 8, 9, 10, 11, 12]
+
+
+def test_summary_reports_clear_rate_and_percentiles() -> None:
+    results = run_monte_carlo(runs=2, policy="baseline", workers=1)
+    summary = summarize(results)
+
+    assert summary["runs"] == 2
+    assert summary["clear_rate"] == 1.0
+    assert summary["coins"]["p50"] == results[0].coins
+    assert set(summary["leaks"]) == {"p10", "p50", "p90"}
+
+
+def test_percentile_interpolates_between_ranks() -> None:
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([5], 90) == 5
+    assert percentile([0, 10], 10) == 1.0
+
+
+def test_sim_subcommand_writes_json(tmp_path, capsys) -> None:
+    out = tmp_path / "sim.json"
+    main(["sim", "--runs", "3", "--workers", "1", "--policy", "random", "--out", str(out)])
+
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert payload["policy"] == "random"
+    assert payload["summary"]["runs"] == 3
+    assert len(payload["results"]) == 3
+    assert "clear_rate=" in capsys.readouterr().out
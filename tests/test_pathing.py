@@ -0,0 +1,79 @@
+import math
+import random
+
+from homeland.config import Waypoint
+from homeland.stress_content import generate_content
+from homeland.systems.pathing import Path
+
+
+def _walk_segments(path: Path, distance: float) -> tuple[float, float]:
+    # The original implementation, which fixed positions to the last bit.
+    if distance <= 0:
+        return (path.points[0].x, path.points[0].y)
+    if distance >= path.length:
+        return (path.points[-1].x, path.points[-1].y)
+    remaining = distance
+    for idx in range(len(path.points) - 1):
+        a = path.points[idx]
+        b = path.points[idx + 1]
+        seg_len = math.hypot(b.x - a.x, b.y - a.y) * 10.0
+        if remaining <= seg_len:
+            t = remaining / seg_len if seg_len else 0.0
+            return (a.x + (b.x - a.x) * t, a.y + (b.y - a.y) * t)
+        remaining -= seg_len
+    return (path.points[-1].x, path.points[-1].y)
+
+
+def _winding_path() -> Path:
+    return Path(
+        [
+            Waypoint(x=0.02, y=0.62),
+            Waypoint(x=0.18, y=0.58),
+            Waypoint(x=0.18, y=0.58),
+            Waypoint(x=0.33, y=0.50),
+            Waypoint(x=0.49, y=0.52),
+            Waypoint(x=0.66, y=0.44),
+            Waypoint(x=0.96, y=0.34),
+        ]
+    )
+
+
+def test_lookup_is_bit_identical_to_segment_walk() -> None:
+    rng = random.Random(7)
+    long_path = Path([Waypoint(x=i / 300, y=rng.random()) for i in range(301)])
+    for path in (_winding_path(), long_path):
+        ends = [path.length * i / 97 for i in range(98)]
+        ends.extend(end for _, end, _, _ in path.segment_spans())
+        samples = [-1.0, 0.0, 0.5, 1.6492, 3.3, 5.0, path.length - 1e-9, path.length, path.length + 2.0]
+        samples.extend(ends)
+        samples.extend(math.nextafter(end, 0.0) for end in ends)
+        samples.extend(math.nextafter(end, math.inf) for end in ends)
+        samples.extend(rng.uniform(0.0, path.length) for _ in range(2000))
+
+        assert [path.position_at_distance(d) for d in samples] == [_walk_segments(path, d) for d in samples]
+        assert path.positions_at_distances(samples) == [_walk_segments(path, d) for d in samples]
+
+
+def test_waypoint_heavy_lookups_bisect_to_the_walked_position() -> None:
+    rng = random.Random(11)
+    river = Path(generate_content(waypoints=1000, seed=4).map_config.path_waypoints)
+    # Lengths on a 1/64 grid land exactly half-way between ulps, which rounds to even.
+    grid = Path([Waypoint(x=i / 64, y=rng.choice([0.0, 0.25, 0.5, 0.75])) for i in range(600)])
+    for path in (river, grid):
+        assert path._tables
+        samples = [rng.uniform(0.0, path.length) for _ in range(2000)]
+        for _, end, _, _ in path.segment_spans():
+            samples.extend((end, math.nextafter(end, 0.0), math.nextafter(end, math.inf)))
+
+        walked = [_walk_segments(path, d) for d in samples]
+        assert path.positions_at_distances(samples) == walked
+        assert [path.position_at_distance(d) for d in samples] == walked
+
+
+def test_batch_positions_match_single_lookups() -> None:
+    path = _winding_path()
+    distances = [path.length * i / 31 for i in range(32)] + [-0.5, path.length * 2]
+
+    batch = path.positions_at_distances(distances)
+
+    assert batch == [path.position_at_distance(d) for d in distances]
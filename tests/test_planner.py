@@ -0,0 +1,138 @@
+from concurrent.futures import ProcessPoolExecutor
+import json
+import time
+
+from homeland.__main__ import main
+from homeland.config import (
+    BuildSlot,
+    EnemyConfig,
+    GameContent,
+    LeakPenalty,
+    MapConfig,
+    ProgressionConfig,
+    TowerConfig,
+    TowerLevel,
+    UnlockRequirement,
+    WaveConfig,
+    Waypoint,
+    load_game_content,
+)
+from homeland.game import HomelandGame
+from homeland.planner import _best_per_key, _bundles, _init_worker, _Node, _play_candidates, plan_build_order
+from homeland.policy import BASELINE_PLAN, play_map
+
+
+def test_planner_beats_the_baseline_and_replays() -> None:
+    content = load_game_content()
+    baseline = play_map(HomelandGame(content=content), BASELINE_PLAN)
+
+    result = plan_build_order(content, beam_width=4, branching=4, actions_per_phase=3)
+
+    assert result.complete
+    assert result.coins > baseline["coins"]
+    summary = result.play(HomelandGame(content=content))
+    assert summary["state"] == "map_result"
+    assert (summary["coins"], summary["xp"]) == (result.coins, result.xp)
+
+
+def _all_or_nothing_content() -> GameContent:
+    # Building spends every coin but kills the scout for a reward that
+    # covers both unkillable tanks leaking. Saving the coins lets the scout
+    # leak first, which is already a defeat after a single leak.
+    map_cfg = MapConfig(
+        map_id="test_map",
+        starting_coins=10,
+        starting_xp=0,
+        leak_penalty=LeakPenalty(coins=11, xp=0),
+        unlock_requirement=UnlockRequirement(next_map="map_02", min_xp=10),
+        path_waypoints=[Waypoint(x=0.0, y=0.5), Waypoint(x=1.0, y=0.5)],
+        build_slots=[BuildSlot(slot_id="s1", x=0.2, y=0.5)],
+    )
+    towers = {
+        "arrow": TowerConfig(
+            tower_id="arrow",
+            display_name="Arrow Tower",
+            effect_type="physical",
+            levels=[TowerLevel(level=1, cost=10, damage=80, range=5.0, attack_speed=5.0)],
+        )
+    }
+    enemies = {
+        "scout": EnemyConfig(enemy_type="scout", hp=50, speed=2.0, coin_reward=30, xp_reward=0),
+        "tank": EnemyConfig(enemy_type="tank", hp=1e9, speed=2.0, coin_reward=0, xp_reward=0),
+    }
+    waves = [WaveConfig(wave_id=1, spawn_interval=1.0, composition={"scout": 1, "tank": 2})]
+    return GameContent(
+        map_config=map_cfg,
+        tower_configs=towers,
+        enemy_configs=enemies,
+        waves=waves,
+        progression=ProgressionConfig(xp_per_wave_clear=0, xp_map_clear=0),
+    )
+
+
+def test_planner_prefers_a_leaky_win_to_a_cheap_defeat() -> None:
+    content = _all_or_nothing_content()
+    saver = HomelandGame(content=content)
+    saver.start_next_wave()
+    saver.advance()
+    assert saver.economy.coins < 0
+
+    result = plan_build_order(content, beam_width=2, branching=2, actions_per_phase=1)
+
+    assert result.complete
+    assert result.phases == [[("build_tower", "s1", "arrow")]]
+    assert (result.leaks, result.coins) == (2, 8)
+
+
+def test_planner_respects_node_budget_and_worker_count() -> None:
+    content = load_game_content()
+    serial = plan_build_order(content, beam_width=2, branching=2, actions_per_phase=2, max_nodes=12)
+    pooled = plan_build_order(content, beam_width=2, branching=2, actions_per_phase=2, max_nodes=12, workers=2)
+
+    assert serial.nodes <= 12
+    assert not serial.complete
+    assert serial.phases
+    assert (serial.phases, serial.coins, serial.leaks) == (pooled.phases, pooled.coins, pooled.leaks)
+
+
+def test_transpositions_keep_the_best_node_not_the_first() -> None:
+    root = HomelandGame(content=load_game_content(), event_history=0, entity_events=False)
+    leaky, built, clean = (root.fork(event_history=0) for _ in range(3))
+    leaky.economy.coins -= 1
+    clean.economy.coins -= 2
+    built.build_tower(*BASELINE_PLAN.placements[0])
+    nodes = [_Node(game=leaky, phases=[], leaks=1), _Node(game=built, phases=[]), _Node(game=clean, phases=[])]
+
+    kept = _best_per_key(nodes, coin_bucket=50)
+
+    assert [node.game for node in kept] == [clean, built]
+
+
+def test_pooled_play_stops_collecting_at_the_deadline() -> None:
+    content = load_game_content()
+    root = _Node(game=HomelandGame(content=content, event_history=0, entity_events=False), phases=[])
+
+    def candidates() -> list[_Node]:
+        return _bundles(root, branching=3, actions_per_phase=2)
+
+    serial = _play_candidates(candidates(), None, 0.1, False, deadline=time.perf_counter())
+    with ProcessPoolExecutor(max_workers=2, initializer=_init_worker, initargs=(content,)) as pool:
+        pending = candidates()
+        pooled = _play_candidates(pending, pool, 0.1, False, deadline=time.perf_counter())
+
+    # The first result is always collected, as in the serial loop; the rest
+    # are left unplayed.
+    assert len(pooled) == len(serial) == 1
+    assert (pooled[0].phases, pooled[0].leaks) == (serial[0].phases, serial[0].leaks)
+    assert pooled[0].game.snapshot() == serial[0].game.snapshot()
+    assert len(pending) > 1
+    assert all(node.game.wave_system.current_wave_number == 0 for node in pending[1:])
+
+
+def test_plan_subcommand_writes_json(tmp_path, capsys) -> None:
+    out = tmp_path / "plan.json"
+    main(["plan", "--beam-width", "2", "--branching", "2", "--max-nodes", "20", "--out", str(out)])
+
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert payload["nodes"] <= 20
+    assert "wave 1:" in capsys.readouterr().out
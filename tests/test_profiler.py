@@ -0,0 +1,47 @@
+from homeland.config import load_game_content
+from homeland.core.profiler import PHASES
+from homeland.game import HomelandGame
+from homeland.policy import BASELINE_PLAN, BuildPlan, play_map
+from homeland.stress_content import generate_content
+
+
+def test_profiling_leaves_the_run_unchanged_and_reports_every_phase() -> None:
+    content = load_game_content()
+    plain = play_map(HomelandGame(content=content), BASELINE_PLAN)
+
+    game = HomelandGame(content=content)
+    profiler = game.enable_profiling()
+    profiled = play_map(game, BASELINE_PLAN)
+    report = profiled.pop("profile")
+
+    assert profiled == plain
+    assert set(report["phases"]) == set(PHASES)
+    counters = report["counters"]
+    assert report["phases"]["combat"]["calls"] == counters["ticks"] > 0
+    assert counters["attacks_fired"] > 0
+    assert counters["spawned"] == counters["kills"] + counters["leaks"]
+    assert counters["events_emitted"] > 0
+    assert profiler.report() == report
+
+    assert game.disable_profiling() is profiler
+    assert "profile" not in game.snapshot()
+
+
+def test_event_driven_runs_time_the_drift_phase() -> None:
+    game = HomelandGame(content=load_game_content(), event_history=0)
+    profiler = game.enable_profiling()
+    play_map(game, BASELINE_PLAN, event_driven=True)
+
+    assert profiler.calls["drift"] > 0
+    assert profiler.counters["events_emitted"] == 0
+    assert game.fork().profiler is None
+
+
+def test_range_tests_are_counted() -> None:
+    content = generate_content(boats_per_wave=30, waves=1, seed=3)
+    game = HomelandGame(content=content, event_history=0)
+    profiler = game.enable_profiling()
+    slots = [slot.slot_id for slot in content.map_config.build_slots]
+    play_map(game, BuildPlan(placements=list(zip(slots, sorted(content.tower_configs))), upgrade_priority=slots))
+
+    assert profiler.counters["distance_checks"] == game.combat.distance_checks > 0
@@ -0,0 +1,74 @@
+import pytest
+
+from homeland.config import load_game_content
+from homeland.core.game_state import GameState
+from homeland.game import HomelandGame
+from homeland.replay import CommandLog, GameRecorder, Replayer, ReplayDivergence, state_hash
+
+
+def _record(content, checkpoint_every: int = 50) -> tuple[GameRecorder, list[dict]]:
+    recorder = GameRecorder(HomelandGame(content=content), checkpoint_every=checkpoint_every)
+    game = recorder.game
+    recorder.build_tower("s03", "arrow")
+    recorder.build_tower("s08", "magic_fire")
+    with pytest.raises(ValueError):
+        recorder.build_tower("s03", "bone")
+    # Index n holds the snapshot just after tick n.
+    snapshots = [game.snapshot()]
+    while game.state != GameState.MAP_RESULT:
+        if game.state == GameState.BUILD_PHASE:
+            try:
+                recorder.upgrade_tower("s03")
+            except ValueError:
+                pass
+            recorder.start_next_wave()
+        recorder.tick(0.1)
+        snapshots.append(game.snapshot())
+    return recorder, snapshots
+
+
+def test_seek_matches_the_recorded_run_at_every_checkpoint_gap() -> None:
+    content = load_game_content()
+    recorder, snapshots = _record(content)
+    log = recorder.log
+    replayer = Replayer(content, log)
+
+    assert len(log.checkpoints) == 1 + log.ticks // 50
+    assert replayer.seek(0).snapshot() == HomelandGame(content=content).snapshot()
+    for tick in (1, 49, 50, 51, 173, log.ticks):
+        assert replayer.seek(tick).snapshot() == snapshots[tick]
+
+    assert replayer.replay().snapshot() == recorder.game.snapshot()
+
+
+def test_log_round_trips_through_json(tmp_path) -> None:
+    content = load_game_content()
+    recorder, snapshots = _record(content, checkpoint_every=200)
+    path = tmp_path / "run.json"
+    recorder.log.save(path)
+
+    loaded = CommandLog.load(path)
+    assert loaded.hashes == recorder.log.hashes
+    assert Replayer(content, loaded).seek(420).snapshot() == snapshots[420]
+
+
+def test_replay_detects_divergence() -> None:
+    content = load_game_content()
+    recorder, _ = _record(content)
+    log = recorder.log
+    tick_commands = [index for index, command in enumerate(log.commands) if command[0] == "tick"]
+    log.commands[tick_commands[120]][1] = 0.2
+
+    replayer = Replayer(content, log)
+    assert replayer.seek(100).snapshot()["state"]
+    with pytest.raises(ReplayDivergence) as excinfo:
+        replayer.seek(130)
+    assert excinfo.value.tick == 121
+
+
+def test_state_hash_chains_over_ticks() -> None:
+    game = HomelandGame(content=load_game_content())
+    first = state_hash(game)
+
+    assert state_hash(game) == first
+    assert state_hash(game, first) != first
@@ -0,0 +1,186 @@
+import asyncio
+import json
+from typing import Any
+
+from homeland.core.game_state import GameState
+from homeland.policy import BASELINE_PLAN
+from homeland.server import SessionServer
+
+
+async def _call(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, **request: Any) -> dict[str, Any]:
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+def test_sessions_play_over_the_socket_on_the_shared_tick() -> None:
+    async def scenario() -> None:
+        server = SessionServer(tick=0.005)
+        host, port = await server.start(port=0)
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            first = (await _call(reader, writer, op="open"))["session"]
+            second = (await _call(reader, writer, op="open"))["session"]
+            slot_id, tower_id = BASELINE_PLAN.placements[0]
+            built = await _call(reader, writer, op="build_tower", session=first, args=[slot_id, tower_id], id=7)
+            assert built["ok"] and built["id"] == 7
+            assert built["snapshot"]["towers_built"] == 1
+            refused = await _call(reader, writer, op="build_tower", session=first, args=[slot_id, tower_id])
+            assert refused == {"ok": False, "error": f"Slot is occupied: {slot_id}"}
+
+            assert (await _call(reader, writer, op="start_next_wave", session=first))["ok"]
+            assert (await _call(reader, writer, op="start_next_wave", session=second))["ok"]
+            await asyncio.sleep(0.2)
+            stats = (await _call(reader, writer, op="stats", session=first))["stats"]
+            assert stats["ticks"] > 0 and stats["commands"] == 3
+            assert stats["command_ms"]["p95"] > 0
+            assert (await _call(reader, writer, op="stats"))["stats"]["running"] == 2
+
+            assert (await _call(reader, writer, op="close", session=second))["ok"]
+            assert not (await _call(reader, writer, op="snapshot", session=second))["ok"]
+            assert not (await _call(reader, writer, op="teleport"))["ok"]
+        finally:
+            writer.close()
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_full_command_queue_answers_busy() -> None:
+    async def scenario() -> None:
+        server = SessionServer(tick=60.0, max_pending=2, max_sessions=1)
+        await server.start(port=0)
+        try:
+            await asyncio.sleep(0)
+            session = server.open_session().session_id
+            queued = [
+                asyncio.create_task(server.handle({"op": "start_next_wave", "session": session})) for _ in range(3)
+            ]
+            busy = await queued[2]
+            assert busy == {"ok": False, "error": "busy: too many queued commands"}
+            assert (await server.handle({"op": "open"}))["error"] == "server full"
+
+            await server.step()
+            first, second = await asyncio.gather(*queued[:2])
+            assert first["ok"] and first["snapshot"]["state"] == "wave_running"
+            assert second == {"ok": False, "error": "Cannot start wave from current state"}
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_sessions_close_when_their_connection_drops() -> None:
+    async def scenario() -> None:
+        server = SessionServer(tick=60.0)
+        host, port = await server.start(port=0)
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            kept = (await _call(reader, writer, op="open"))["session"]
+            closed = (await _call(reader, writer, op="open"))["session"]
+            assert (await _call(reader, writer, op="close", session=closed))["ok"]
+            assert set(server.sessions) == {kept}
+            writer.close()
+            await writer.wait_closed()
+            for _ in range(100):
+                if not server.sessions:
+                    break
+                await asyncio.sleep(0.01)
+            assert not server.sessions
+            assert server.stats()["abandoned"] == 1
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_finished_sessions_expire() -> None:
+    async def scenario() -> None:
+        server = SessionServer(tick=60.0, finished_ttl=0.0)
+        await server.start(port=0)
+        try:
+            finished = server.open_session()
+            playing = server.open_session()
+            finished.game.state = GameState.MAP_RESULT
+            await server.step()
+            assert finished.finished_at is not None and not finished.closed
+            await server.step()
+            assert finished.closed
+            assert list(server.sessions) == [playing.session_id]
+            assert server.stats()["expired"] == 1
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_a_failing_session_is_closed_and_the_scheduler_keeps_ticking() -> None:
+    async def scenario() -> None:
+        server = SessionServer(tick=0.005)
+        await server.start(port=0)
+        try:
+            broken = server.open_session()
+            healthy = server.open_session()
+
+            def explode(*args: Any) -> None:
+                raise RuntimeError("boom")
+
+            broken.game.upgrade_tower = explode  # type: ignore[method-assign]
+            failed = await server.handle({"op": "upgrade_tower", "session": broken.session_id, "args": ["s1"]})
+            assert failed == {"ok": False, "error": "session failed: RuntimeError: boom"}
+            assert broken.closed
+
+            started = await server.handle({"op": "start_next_wave", "session": healthy.session_id})
+            assert started["ok"]
+            await asyncio.sleep(0.05)
+            assert healthy.ticks > 0
+            assert server.stats()["failed"] == 1
+
+            refused = await server.handle({"op": "open", "map": ["map_01_river_bend"]})
+            assert refused == {"ok": False, "error": "map must be a string"}
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_connections_close_only_their_own_sessions() -> None:
+    async def scenario() -> None:
+        server = SessionServer(tick=60.0)
+        host, port = await server.start(port=0)
+        mine = await asyncio.open_connection(host, port)
+        theirs = await asyncio.open_connection(host, port)
+        try:
+            session = (await _call(*mine, op="open"))["session"]
+            refused = await _call(*theirs, op="close", session=session)
+            assert refused == {"ok": False, "error": f"Unknown session: {session}"}
+            assert session in server.sessions
+            assert (await _call(*mine, op="close", session=session))["ok"]
+        finally:
+            for _, writer in (mine, theirs):
+                writer.close()
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_a_map_that_fails_to_load_is_answered() -> None:
+    class BrokenRegistry:
+        def __contains__(self, map_id: object) -> bool:
+            return True
+
+        def get(self, map_id: str) -> Any:
+            raise OSError("disk gone")
+
+    async def scenario() -> None:
+        server = SessionServer(registry=BrokenRegistry(), tick=60.0)  # type: ignore[arg-type]
+        host, port = await server.start(port=0)
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            reply = await _call(reader, writer, op="open", map="anywhere", id=3)
+            assert reply == {"ok": False, "error": "Cannot load map anywhere: disk gone", "id": 3}
+        finally:
+            writer.close()
+            await server.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,51 @@
+import math
+import random
+
+from homeland.config import Waypoint
+from homeland.entities.enemy_boat import Fleet
+from homeland.systems.combat_system import CHAIN_RADIUS
+from homeland.systems.pathing import WORLD_SCALE, Path
+from homeland.systems.spatial import FleetGrid
+
+
+def _fleet(distances: list[float]) -> Fleet:
+    fleet = Fleet()
+    for index, distance in enumerate(distances):
+        fleet.spawn(
+            boat_id=f"b{index}",
+            enemy_type="scout",
+            max_hp=100,
+            hp=100,
+            speed=1.0,
+            coin_reward=0,
+            xp_reward=0,
+            distance=distance,
+        )
+    return fleet
+
+
+def test_nearest_matches_sorting_every_boat() -> None:
+    rng = random.Random(5)
+    path = Path([Waypoint(x=0.0, y=0.5), Waypoint(x=0.6, y=0.2), Waypoint(x=0.4, y=0.8), Waypoint(x=1.0, y=0.6)])
+    for _ in range(40):
+        distances = [rng.uniform(0, path.length) for _ in range(80)]
+        # Boats sharing a distance tie, and ties go to the lower row.
+        distances.extend(distances[:10])
+        fleet = _fleet(distances)
+        rows = list(range(len(fleet)))
+        positions = dict(zip(rows, path.positions_at_distances(distances)))
+        grid = FleetGrid(positions, rows, CHAIN_RADIUS)
+        for row in rng.sample(rows, 8):
+            fleet.destroyed[row] = True
+
+        source = rng.choice(rows)
+        count = rng.randint(1, 6)
+        radius = rng.choice([CHAIN_RADIUS, 0.5, 6.0])
+        sx, sy = positions[source]
+
+        def dist(row: int) -> float:
+            return math.hypot((sx - positions[row][0]) * WORLD_SCALE, (sy - positions[row][1]) * WORLD_SCALE)
+
+        alive = [row for row in rows if row != source and not fleet.destroyed[row]]
+        expected = [row for row in sorted(alive, key=dist) if dist(row) <= radius][:count]
+        assert grid.nearest(fleet, source, radius, count) == expected
@@ -0,0 +1,32 @@
+from homeland.config import EFFECT_TYPES, load_game_content
+from homeland.game import HomelandGame
+from homeland.stress_content import generate_content, write_content
+
+
+def test_generated_content_has_the_requested_scale() -> None:
+    content = generate_content(waypoints=200, slots=50, towers_per_effect=2, boats_per_wave=1000, waves=3, seed=4)
+
+    assert len(content.map_config.path_waypoints) == 200
+    assert len(content.map_config.build_slots) == 50
+    assert len(content.tower_configs) == 2 * len(EFFECT_TYPES)
+    assert {tower.effect_type for tower in content.tower_configs.values()} == set(EFFECT_TYPES)
+    assert len(content.waves) == 3
+    assert all(sum(wave.composition.values()) == 1000 for wave in content.waves)
+    assert content == generate_content(waypoints=200, slots=50, towers_per_effect=2, boats_per_wave=1000, waves=3, seed=4)
+    assert content != generate_content(waypoints=200, slots=50, towers_per_effect=2, boats_per_wave=1000, waves=3, seed=5)
+
+
+def test_written_content_loads_and_plays(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HOMELAND_CONTENT_CACHE", "")
+    map_id = write_content(tmp_path, slots=12, boats_per_wave=30, seed=1)
+    content = load_game_content(tmp_path, map_id=map_id)
+    assert content == generate_content(slots=12, boats_per_wave=30, seed=1)
+
+    game = HomelandGame(content=content)
+    slot = content.map_config.build_slots[0].slot_id
+    game.build_tower(slot, sorted(content.tower_configs)[0])
+    game.start_next_wave()
+    for _ in range(100):
+        game.tick(0.1)
+    assert game.wave_system.boats_remaining_to_spawn() < 30
+
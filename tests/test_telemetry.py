@@ -0,0 +1,75 @@
+import pytest
+
+from homeland.core.event_bus import EventBus
+from homeland.core.telemetry import BinarySink, NdjsonSink, open_sink, read_events
+from homeland.game import HomelandGame
+from homeland.monte_carlo import run_monte_carlo
+from homeland.policy import BASELINE_PLAN, play_map
+
+
+def _emit_sample(bus: EventBus) -> None:
+    bus.emit("enemy_killed", boat_id="boat_0001", enemy_type="scout")
+    bus.emit("coins_changed", delta=-5, reason="enemy_leak", coins=95)
+    bus.emit("map_result", victory=True, unlocked_next_map=False)
+    bus.emit("speed", value=1.25, extra=None, tags=["a", "b"])
+    bus.emit("enemy_killed", boat_id="boat_0002", enemy_type="raider")
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "binary"])
+def test_sink_round_trips_events(tmp_path, fmt) -> None:
+    recorded = EventBus(history=None)
+    path = tmp_path / "trace.log"
+    with open_sink(path, fmt, batch=2) as sink:
+        sink.attach(recorded)
+        _emit_sample(recorded)
+
+    assert list(read_events(path)) == recorded.events
+
+
+def test_sink_buffers_until_batch_is_full(tmp_path) -> None:
+    path = tmp_path / "trace.ndjson"
+    bus = EventBus(history=0)
+    sink = NdjsonSink(path, batch=3)
+    sink.attach(bus)
+
+    bus.emit("a", value=1)
+    bus.emit("b", value=2)
+    assert path.read_bytes() == b""
+    bus.emit("c", value=3)
+    assert len(path.read_bytes().splitlines()) == 3
+    sink.close()
+
+
+def test_binary_log_is_smaller_than_ndjson_for_a_game(tmp_path) -> None:
+    sizes = {}
+    for fmt, suffix in (("ndjson", "ndjson"), ("binary", "hlog")):
+        game = HomelandGame(event_history=0)
+        path = tmp_path / f"game.{suffix}"
+        with open_sink(path, fmt) as sink:
+            sink.attach(game.events)
+            play_map(game, BASELINE_PLAN)
+        sizes[fmt] = path.stat().st_size
+        assert sum(1 for event in read_events(path) if event.name == "map_result") == 1
+
+    assert sizes["binary"] * 2 < sizes["ndjson"]
+
+
+def test_binary_segments_can_be_appended(tmp_path) -> None:
+    path = tmp_path / "trace.hlog"
+    for index in range(2):
+        bus = EventBus(history=0)
+        with BinarySink(path, append=True) as sink:
+            sink.attach(bus)
+            bus.emit("run_start", run=index)
+            bus.emit("enemy_killed", boat_id="boat_0001", enemy_type="scout")
+
+    events = list(read_events(path))
+    assert [event.payload.get("run") for event in events] == [0, None, 1, None]
+
+
+def test_sweep_streams_each_run_to_the_trace_dir(tmp_path) -> None:
+    run_monte_carlo(runs=3, policy="random", workers=1, trace_dir=tmp_path, trace_format="binary")
+
+    (trace,) = tmp_path.iterdir()
+    starts = [event.payload for event in read_events(trace) if event.name == "run_start"]
+    assert [start["run"] for start in starts] == [0, 1, 2]
@@ -1,5 +1,7 @@
-from homeland.config import WaveConfig
-from homeland.systems.wave_system import WaveSystem
+import pytest
+
+from homeland.config import WaveConfig, validate_spawn_order
+from homeland.systems.wave_system import SpawnTimeline, WaveSystem
 
 
 def test_wave_spawns_expected_count() -> None:
@@ -14,3 +16,45 @@ def test_wave_spawns_expected_count() -> None:
     assert spawned.count("scout") == 2
     assert spawned.count("raider") == 1
     assert len(spawned) == 3
+
+
+def test_timeline_orders_match_their_generators() -> None:
+    interleaved = SpawnTimeline(
+        WaveConfig(wave_id=1, spawn_interval=1.0, composition={"a": 3, "b": 1, "c": 2}, order="interleaved")
+    )
+    patterned = SpawnTimeline(
+        WaveConfig(wave_id=2, spawn_interval=1.0, composition={"a": 4, "b": 2}, order="pattern", pattern=["a", "a", "b"])
+    )
+
+    assert list(interleaved) == ["a", "b", "c", "a", "c", "a"]
+    assert [interleaved.enemy_at(k) for k in range(6)] == list(interleaved)
+    assert list(patterned) == ["a", "a", "b", "a", "a", "b"]
+    assert list(patterned.iter_from(4)) == ["a", "b"]
+
+
+def test_pattern_must_produce_the_composition() -> None:
+    wave = WaveConfig(wave_id=1, spawn_interval=1.0, composition={"a": 2, "b": 3}, order="pattern", pattern=["a", "b"])
+    with pytest.raises(ValueError, match="pattern"):
+        validate_spawn_order(wave)
+
+
+def test_large_wave_streams_and_counts_in_closed_form() -> None:
+    wave = WaveConfig(wave_id=1, spawn_interval=0.01, composition={"scout": 60_000, "raider": 40_000})
+    timeline = SpawnTimeline(wave)
+    assert timeline.spawns_between(0.0, 1.0) == 100
+    assert timeline.spawns_between(999.0, 2000.0) == 100
+    assert timeline.enemy_at(59_999) == "scout"
+    assert timeline.enemy_at(60_000) == "raider"
+
+    wave_system = WaveSystem([wave])
+    wave_system.start_next_wave()
+    assert wave_system.spawns_within(0.995) == 100
+    spawned = wave_system.tick(600.0)
+    assert len(spawned) == 60_001
+    assert spawned[-1] == "raider"
+    assert wave_system.boats_remaining_to_spawn() == 39_999
+
+    wave_index, count, cooldown = wave_system.save()
+    fork = wave_system.fork()
+    wave_system.restore(wave_index, count, cooldown)
+    assert wave_system.tick(1.0) == fork.tick(1.0)